@@ -0,0 +1,35 @@
+BEGIN;
+
+-- Change feed for op.continuum.projector.subscribe: every projection write
+-- is announced on the arqonbus_continuum_projection NOTIFY channel.
+CREATE OR REPLACE FUNCTION arqonbus_continuum_projection_notify() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('arqonbus_continuum_projection', json_build_object(
+        'tenant_id', NEW.tenant_id,
+        'agent_id', NEW.agent_id,
+        'episode_id', NEW.episode_id,
+        'event_type', NEW.event_type,
+        'last_event_id', NEW.last_event_id,
+        'last_event_ts', NEW.last_event_ts,
+        'updated_at', NEW.updated_at,
+        'deleted', NEW.deleted
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_trigger
+        WHERE tgname = 'arqonbus_continuum_projection_notify'
+          AND tgrelid = 'arqonbus_continuum_projection'::regclass
+    ) THEN
+        CREATE TRIGGER arqonbus_continuum_projection_notify
+          AFTER INSERT OR UPDATE ON arqonbus_continuum_projection
+          FOR EACH ROW EXECUTE FUNCTION arqonbus_continuum_projection_notify();
+    END IF;
+END
+$$;
+
+COMMIT;
@@ -0,0 +1,13 @@
+BEGIN;
+
+-- Keyset pagination for op.continuum.projector.list, dlq.list and backfill.
+CREATE INDEX IF NOT EXISTS idx_arqonbus_cont_proj_updated_at
+  ON arqonbus_continuum_projection (updated_at DESC, tenant_id DESC, agent_id DESC, episode_id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_arqonbus_cont_proj_dlq_queued_at_id
+  ON arqonbus_continuum_projection_dlq (queued_at DESC, dlq_id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_arqonbus_cont_proj_events_source_ts_key
+  ON arqonbus_continuum_projection_events (source_ts, tenant_id, agent_id, event_id);
+
+COMMIT;
@@ -0,0 +1,10 @@
+BEGIN;
+
+-- Tag (@>, ?|) and attribute (@>) filters for op.continuum.projector.list.
+CREATE INDEX IF NOT EXISTS idx_arqonbus_cont_proj_tags
+  ON arqonbus_continuum_projection USING GIN (tags);
+
+CREATE INDEX IF NOT EXISTS idx_arqonbus_cont_proj_metadata
+  ON arqonbus_continuum_projection USING GIN (metadata jsonb_path_ops);
+
+COMMIT;
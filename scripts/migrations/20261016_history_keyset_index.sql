@@ -0,0 +1,7 @@
+BEGIN;
+
+-- Keyset pagination for streamed op.history.get / op.history.replay.
+CREATE INDEX IF NOT EXISTS idx_arqonbus_room_channel_stored_at_id
+  ON arqonbus_message_history (room, channel, stored_at, id);
+
+COMMIT;
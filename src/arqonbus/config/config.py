@@ -58,6 +58,8 @@ class ServerConfig:
     connection_timeout: float = 30.0
     ping_interval: float = 20.0
     ping_timeout: float = 10.0
+    workers: int = 1  # >1 runs a supervisor with N worker processes sharing the port; needs shared storage
+    worker_socket_dir: str = ""  # Unix socket directory for cross-worker fan-out (default: temp dir)
 
 
 @dataclass 
@@ -67,6 +69,15 @@ class WebSocketConfig:
     compression: Optional[str] = None
     ssl_context: Optional[Dict[str, Any]] = None
     allowed_origins: List[str] = field(default_factory=list)
+    send_timeout_seconds: float = 5.0  # Per-client deadline for a broadcast write
+    outbound_queue_size: int = 1024  # Per-connection outbound frame bound; 0 sends inline
+    outbound_overflow_policy: str = "drop_oldest"  # drop_oldest|drop_newest|disconnect|coalesce
+    outbound_overflow_policies: Dict[str, str] = field(default_factory=dict)  # {"room:channel": policy}
+    ack_mode: str = "legacy"  # Default ack mode: legacy|none|id|batch (clients may negotiate)
+    ack_batch_size: int = 64  # Messages covered by one cumulative ack in batch mode
+    ack_flush_ms: float = 50.0  # Max delay before a pending cumulative ack is sent
+    max_batch_size: int = 1000  # Max envelopes in one inbound batch frame
+    max_in_flight_per_connection: int = 1  # Frames processed concurrently per connection (1 = sequential)
 
 
 @dataclass
@@ -103,6 +114,22 @@ class StorageConfig:
     max_history_size: int = 10000
     retention_hours: int = 24
     enable_persistence: bool = False
+    record_format: str = "legacy"  # Redis stream records: legacy, json, protobuf, compressed
+    write_behind: bool = False  # Redis: acknowledge before persisting, commit in background groups
+    write_behind_flush_ms: float = 5.0  # Max time a queued message waits before its group is committed
+    write_behind_batch_size: int = 256  # Max messages per group commit
+    write_behind_queue_size: int = 10000  # Max messages awaiting commit
+    write_behind_block_when_full: bool = True  # Block publishers when full (False: reject the append)
+    write_behind_max_retries: int = 3  # Retries of a failed group commit before its messages are dropped
+    write_behind_read_timeout: float = 1.0  # Max seconds a history read waits for queued writes to commit
+    postgres_batch_max_size: int = 500  # Max messages per multi-row insert (1 = one insert per message)
+    postgres_batch_flush_ms: float = 0.0  # Extra wait to grow a batch (0 = group only while a flush is running)
+    postgres_partitioning: str = "none"  # History table partitions: none, daily, hourly
+    postgres_pool_min_size: int = 1  # Connections kept open in the Postgres pool
+    postgres_pool_max_size: int = 10  # Upper bound on pooled Postgres connections
+    postgres_statement_cache_size: int = 100  # Prepared statements cached per connection (0 disables, e.g. for PgBouncer)
+    postgres_command_timeout: float = 0.0  # Per-statement timeout in seconds (0 = none)
+    postgres_connection_lifetime: float = 300.0  # Seconds an idle pooled connection lives before it is closed
 
 
 @dataclass
@@ -196,6 +223,14 @@ class TierOmegaConfig:
     max_vms: int = 8
 
 
+@dataclass
+class ContinuumConfig:
+    """Continuum projector lane configuration (in-memory mode)."""
+    dedup_window_size: int = 100000  # Recent event IDs remembered exactly; older ones fall under per-episode watermarks
+    event_log_size: int = 10000  # Projected events kept for in-memory backfill (oldest dropped first)
+    change_feed_window_ms: float = 100.0  # Projection changes per agent are coalesced into one delta over this window
+
+
 @dataclass
 class ArqonBusConfig:
     """Main configuration for ArqonBus."""
@@ -208,6 +243,7 @@ class ArqonBusConfig:
     security: SecurityConfig = field(default_factory=SecurityConfig)
     casil: CASILConfig = field(default_factory=CASILConfig)
     tier_omega: TierOmegaConfig = field(default_factory=TierOmegaConfig)
+    continuum: ContinuumConfig = field(default_factory=ContinuumConfig)
     
     # Feature Flags
     holonomy_enabled: bool = False
@@ -243,11 +279,52 @@ class ArqonBusConfig:
         config.server.host = os.getenv("ARQONBUS_SERVER_HOST", config.server.host)
         config.server.port = int(os.getenv("ARQONBUS_SERVER_PORT", config.server.port))
         config.server.max_connections = int(os.getenv("ARQONBUS_MAX_CONNECTIONS", config.server.max_connections))
+        config.server.workers = int(os.getenv("ARQONBUS_SERVER_WORKERS", config.server.workers))
+        config.server.worker_socket_dir = os.getenv(
+            "ARQONBUS_WORKER_SOCKET_DIR", config.server.worker_socket_dir
+        )
         
         # WebSocket configuration  
         config.websocket.max_message_size = int(os.getenv("ARQONBUS_MAX_MESSAGE_SIZE", config.websocket.max_message_size))
         compression_val = os.getenv("ARQONBUS_COMPRESSION", "false").lower()
         config.websocket.compression = "deflate" if compression_val == "true" else None
+        config.websocket.send_timeout_seconds = float(
+            os.getenv("ARQONBUS_SEND_TIMEOUT_SECONDS", config.websocket.send_timeout_seconds)
+        )
+        config.websocket.outbound_queue_size = int(
+            os.getenv("ARQONBUS_OUTBOUND_QUEUE_SIZE", config.websocket.outbound_queue_size)
+        )
+        config.websocket.outbound_overflow_policy = os.getenv(
+            "ARQONBUS_OUTBOUND_OVERFLOW_POLICY",
+            config.websocket.outbound_overflow_policy,
+        ).strip().lower().replace("-", "_")
+        overflow_policies = os.getenv("ARQONBUS_OUTBOUND_OVERFLOW_POLICIES")
+        if overflow_policies:
+            # Format: "room:channel=policy,room:*=policy"
+            from ..routing.outbound import parse_overflow_policies
+            config.websocket.outbound_overflow_policies = parse_overflow_policies(overflow_policies)
+        from ..transport.acks import normalize_ack_mode
+        raw_ack_mode = os.getenv("ARQONBUS_ACK_MODE", config.websocket.ack_mode)
+        try:
+            config.websocket.ack_mode = normalize_ack_mode(raw_ack_mode)
+        except ValueError:
+            # Left as-is so validate() reports it.
+            config.websocket.ack_mode = raw_ack_mode.strip().lower()
+        config.websocket.ack_batch_size = int(
+            os.getenv("ARQONBUS_ACK_BATCH_SIZE", config.websocket.ack_batch_size)
+        )
+        config.websocket.ack_flush_ms = float(
+            os.getenv("ARQONBUS_ACK_FLUSH_MS", config.websocket.ack_flush_ms)
+        )
+        config.websocket.max_batch_size = int(
+            os.getenv("ARQONBUS_MAX_BATCH_SIZE", config.websocket.max_batch_size)
+        )
+        config.websocket.max_in_flight_per_connection = int(
+            os.getenv(
+                "ARQONBUS_MAX_IN_FLIGHT_PER_CONNECTION",
+                config.websocket.max_in_flight_per_connection,
+            )
+        )
         
         # Redis configuration
         config.redis.host = _env_first(
@@ -285,6 +362,55 @@ class ArqonBusConfig:
         config.storage.postgres_url = os.getenv("ARQONBUS_POSTGRES_URL", config.storage.postgres_url)
         config.storage.max_history_size = int(os.getenv("ARQONBUS_MAX_HISTORY_SIZE", config.storage.max_history_size))
         config.storage.enable_persistence = os.getenv("ARQONBUS_ENABLE_PERSISTENCE", "false").lower() == "true"
+        config.storage.record_format = os.getenv(
+            "ARQONBUS_STORAGE_RECORD_FORMAT", config.storage.record_format
+        ).strip().lower()
+        config.storage.write_behind = os.getenv(
+            "ARQONBUS_STORAGE_WRITE_BEHIND", str(config.storage.write_behind)
+        ).lower() == "true"
+        config.storage.write_behind_flush_ms = float(
+            os.getenv("ARQONBUS_STORAGE_WRITE_BEHIND_FLUSH_MS", config.storage.write_behind_flush_ms)
+        )
+        config.storage.write_behind_batch_size = int(
+            os.getenv("ARQONBUS_STORAGE_WRITE_BEHIND_BATCH_SIZE", config.storage.write_behind_batch_size)
+        )
+        config.storage.write_behind_queue_size = int(
+            os.getenv("ARQONBUS_STORAGE_WRITE_BEHIND_QUEUE_SIZE", config.storage.write_behind_queue_size)
+        )
+        config.storage.postgres_batch_max_size = int(
+            os.getenv("ARQONBUS_POSTGRES_BATCH_MAX_SIZE", config.storage.postgres_batch_max_size)
+        )
+        config.storage.postgres_batch_flush_ms = float(
+            os.getenv("ARQONBUS_POSTGRES_BATCH_FLUSH_MS", config.storage.postgres_batch_flush_ms)
+        )
+        config.storage.postgres_partitioning = os.getenv(
+            "ARQONBUS_POSTGRES_PARTITIONING", config.storage.postgres_partitioning
+        ).strip().lower()
+        config.storage.postgres_pool_min_size = int(
+            os.getenv("ARQONBUS_POSTGRES_POOL_MIN_SIZE", config.storage.postgres_pool_min_size)
+        )
+        config.storage.postgres_pool_max_size = int(
+            os.getenv("ARQONBUS_POSTGRES_POOL_MAX_SIZE", config.storage.postgres_pool_max_size)
+        )
+        config.storage.postgres_statement_cache_size = int(
+            os.getenv("ARQONBUS_POSTGRES_STATEMENT_CACHE_SIZE", config.storage.postgres_statement_cache_size)
+        )
+        config.storage.postgres_command_timeout = float(
+            os.getenv("ARQONBUS_POSTGRES_COMMAND_TIMEOUT", config.storage.postgres_command_timeout)
+        )
+        config.storage.postgres_connection_lifetime = float(
+            os.getenv("ARQONBUS_POSTGRES_CONNECTION_LIFETIME", config.storage.postgres_connection_lifetime)
+        )
+        config.storage.write_behind_block_when_full = os.getenv(
+            "ARQONBUS_STORAGE_WRITE_BEHIND_BLOCK_WHEN_FULL",
+            str(config.storage.write_behind_block_when_full),
+        ).lower() == "true"
+        config.storage.write_behind_max_retries = int(
+            os.getenv("ARQONBUS_STORAGE_WRITE_BEHIND_MAX_RETRIES", config.storage.write_behind_max_retries)
+        )
+        config.storage.write_behind_read_timeout = float(
+            os.getenv("ARQONBUS_STORAGE_WRITE_BEHIND_READ_TIMEOUT", config.storage.write_behind_read_timeout)
+        )
         
         # Telemetry configuration
         config.telemetry.enable_telemetry = os.getenv("ARQONBUS_ENABLE_TELEMETRY", "true").lower() == "true"
@@ -372,6 +498,17 @@ class ArqonBusConfig:
         config.tier_omega.max_vms = int(
             os.getenv("ARQONBUS_OMEGA_MAX_VMS", config.tier_omega.max_vms)
         )
+
+        # Continuum projector configuration
+        config.continuum.dedup_window_size = int(
+            os.getenv("ARQONBUS_CONTINUUM_DEDUP_WINDOW_SIZE", config.continuum.dedup_window_size)
+        )
+        config.continuum.event_log_size = int(
+            os.getenv("ARQONBUS_CONTINUUM_EVENT_LOG_SIZE", config.continuum.event_log_size)
+        )
+        config.continuum.change_feed_window_ms = float(
+            os.getenv("ARQONBUS_CONTINUUM_CHANGE_FEED_WINDOW_MS", config.continuum.change_feed_window_ms)
+        )
         
         # Feature Flags
         config.holonomy_enabled = os.getenv("ARQONBUS_HOLONOMY_ENABLED", "false").lower() == "true"
@@ -403,10 +540,42 @@ class ArqonBusConfig:
             
         if self.server.max_connections < 1:
             errors.append(f"Invalid max connections: {self.server.max_connections}")
+
+        if self.server.workers < 1:
+            errors.append(f"Invalid worker count: {self.server.workers}")
+        elif self.server.workers > 1 and self.storage.backend in ("memory", "memory_storage"):
+            # Each worker would keep its own history, so answers would depend on the worker.
+            errors.append(
+                f"{self.server.workers} workers need a shared storage backend "
+                f"(redis, valkey or postgres), not {self.storage.backend}"
+            )
             
         # WebSocket validation
         if self.websocket.max_message_size < 1024:
             errors.append(f"Message size too small: {self.websocket.max_message_size}")
+        if self.websocket.send_timeout_seconds <= 0:
+            errors.append(f"Invalid send timeout: {self.websocket.send_timeout_seconds}")
+        if self.websocket.outbound_queue_size < 0:
+            errors.append(f"Invalid outbound queue size: {self.websocket.outbound_queue_size}")
+        overflow_policies = ("drop_oldest", "drop_newest", "disconnect", "coalesce")
+        if self.websocket.outbound_overflow_policy not in overflow_policies:
+            errors.append(f"Invalid outbound overflow policy: {self.websocket.outbound_overflow_policy}")
+        for key, policy in self.websocket.outbound_overflow_policies.items():
+            if policy not in overflow_policies:
+                errors.append(f"Invalid outbound overflow policy for {key}: {policy}")
+        from ..transport.acks import ACK_MODES
+        if self.websocket.ack_mode not in ACK_MODES:
+            errors.append(f"Invalid ack mode: {self.websocket.ack_mode}")
+        if self.websocket.ack_batch_size < 1:
+            errors.append(f"Invalid ack batch size: {self.websocket.ack_batch_size}")
+        if self.websocket.ack_flush_ms <= 0:
+            errors.append(f"Invalid ack flush interval: {self.websocket.ack_flush_ms}")
+        if self.websocket.max_batch_size < 1:
+            errors.append(f"Invalid max batch size: {self.websocket.max_batch_size}")
+        if self.websocket.max_in_flight_per_connection < 1:
+            errors.append(
+                f"Invalid max in-flight per connection: {self.websocket.max_in_flight_per_connection}"
+            )
             
         # Redis validation (only if Redis backend is used)
         if self.storage.backend in ("redis", "redis_streams", "valkey", "valkey_streams"):
@@ -436,6 +605,34 @@ class ArqonBusConfig:
             errors.append(f"Unsupported storage backend: {self.storage.backend}")
         if self.storage.max_history_size < 1:
             errors.append(f"Invalid history size: {self.storage.max_history_size}")
+        if self.storage.record_format not in ("legacy", "json", "protobuf", "compressed"):
+            errors.append(f"Invalid storage record format: {self.storage.record_format}")
+        if self.storage.write_behind_flush_ms <= 0:
+            errors.append(f"Invalid write-behind flush interval: {self.storage.write_behind_flush_ms}")
+        if self.storage.write_behind_batch_size < 1:
+            errors.append(f"Invalid write-behind batch size: {self.storage.write_behind_batch_size}")
+        if self.storage.write_behind_queue_size < 1:
+            errors.append(f"Invalid write-behind queue size: {self.storage.write_behind_queue_size}")
+        if self.storage.write_behind_max_retries < 0:
+            errors.append(f"Invalid write-behind max retries: {self.storage.write_behind_max_retries}")
+        if self.storage.write_behind_read_timeout <= 0:
+            errors.append(f"Invalid write-behind read timeout: {self.storage.write_behind_read_timeout}")
+        if self.storage.postgres_batch_max_size < 1:
+            errors.append(f"Invalid Postgres batch size: {self.storage.postgres_batch_max_size}")
+        if self.storage.postgres_partitioning not in ("none", "daily", "hourly"):
+            errors.append(f"Invalid Postgres partitioning: {self.storage.postgres_partitioning}")
+        if self.storage.postgres_pool_min_size < 0:
+            errors.append(f"Invalid Postgres pool min size: {self.storage.postgres_pool_min_size}")
+        if self.storage.postgres_pool_max_size < max(1, self.storage.postgres_pool_min_size):
+            errors.append(f"Invalid Postgres pool max size: {self.storage.postgres_pool_max_size}")
+        if self.storage.postgres_statement_cache_size < 0:
+            errors.append(f"Invalid Postgres statement cache size: {self.storage.postgres_statement_cache_size}")
+        if self.storage.postgres_command_timeout < 0:
+            errors.append(f"Invalid Postgres command timeout: {self.storage.postgres_command_timeout}")
+        if self.storage.postgres_connection_lifetime < 0:
+            errors.append(f"Invalid Postgres connection lifetime: {self.storage.postgres_connection_lifetime}")
+        if self.storage.postgres_batch_flush_ms < 0:
+            errors.append(f"Invalid Postgres batch flush interval: {self.storage.postgres_batch_flush_ms}")
             
         # Telemetry validation
         if self.telemetry.metrics_interval < 1:
@@ -489,6 +686,14 @@ class ArqonBusConfig:
                 errors.append(
                     "Tier-Omega firecracker runtime requires ARQONBUS_OMEGA_ROOTFS_IMAGE"
                 )
+
+        # Continuum projector validation
+        if self.continuum.dedup_window_size < 1:
+            errors.append("Continuum dedup_window_size must be >= 1")
+        if self.continuum.event_log_size < 1:
+            errors.append("Continuum event_log_size must be >= 1")
+        if self.continuum.change_feed_window_ms < 0:
+            errors.append("Continuum change_feed_window_ms must be >= 0")
             
         return errors
     
@@ -499,12 +704,23 @@ class ArqonBusConfig:
                 "host": self.server.host,
                 "port": self.server.port,
                 "max_connections": self.server.max_connections,
-                "connection_timeout": self.server.connection_timeout
+                "connection_timeout": self.server.connection_timeout,
+                "workers": self.server.workers,
+                "worker_socket_dir": self.server.worker_socket_dir
             },
             "websocket": {
                 "max_message_size": self.websocket.max_message_size,
                 "compression": self.websocket.compression,
-                "allowed_origins": self.websocket.allowed_origins
+                "allowed_origins": self.websocket.allowed_origins,
+                "send_timeout_seconds": self.websocket.send_timeout_seconds,
+                "outbound_queue_size": self.websocket.outbound_queue_size,
+                "outbound_overflow_policy": self.websocket.outbound_overflow_policy,
+                "outbound_overflow_policies": self.websocket.outbound_overflow_policies,
+                "ack_mode": self.websocket.ack_mode,
+                "ack_batch_size": self.websocket.ack_batch_size,
+                "ack_flush_ms": self.websocket.ack_flush_ms,
+                "max_batch_size": self.websocket.max_batch_size,
+                "max_in_flight_per_connection": self.websocket.max_in_flight_per_connection
             },
             "redis": {
                 "host": self.redis.host,
@@ -527,7 +743,23 @@ class ArqonBusConfig:
                 "redis_url": self.storage.redis_url,
                 "postgres_url": self.storage.postgres_url,
                 "max_history_size": self.storage.max_history_size,
-                "enable_persistence": self.storage.enable_persistence
+                "enable_persistence": self.storage.enable_persistence,
+                "record_format": self.storage.record_format,
+                "write_behind": self.storage.write_behind,
+                "write_behind_flush_ms": self.storage.write_behind_flush_ms,
+                "write_behind_batch_size": self.storage.write_behind_batch_size,
+                "write_behind_queue_size": self.storage.write_behind_queue_size,
+                "write_behind_block_when_full": self.storage.write_behind_block_when_full,
+                "write_behind_max_retries": self.storage.write_behind_max_retries,
+                "write_behind_read_timeout": self.storage.write_behind_read_timeout,
+                "postgres_batch_max_size": self.storage.postgres_batch_max_size,
+                "postgres_batch_flush_ms": self.storage.postgres_batch_flush_ms,
+                "postgres_partitioning": self.storage.postgres_partitioning,
+                "postgres_pool_min_size": self.storage.postgres_pool_min_size,
+                "postgres_pool_max_size": self.storage.postgres_pool_max_size,
+                "postgres_statement_cache_size": self.storage.postgres_statement_cache_size,
+                "postgres_command_timeout": self.storage.postgres_command_timeout,
+                "postgres_connection_lifetime": self.storage.postgres_connection_lifetime
             },
             "telemetry": {
                 "enable_telemetry": self.telemetry.enable_telemetry,
@@ -584,6 +816,11 @@ class ArqonBusConfig:
                 "vm_timeout_seconds": self.tier_omega.vm_timeout_seconds,
                 "max_vms": self.tier_omega.max_vms,
             },
+            "continuum": {
+                "dedup_window_size": self.continuum.dedup_window_size,
+                "event_log_size": self.continuum.event_log_size,
+                "change_feed_window_ms": self.continuum.change_feed_window_ms
+            },
             "environment": self.environment,
             "debug": self.debug,
             "infra_protocol": self.infra_protocol,
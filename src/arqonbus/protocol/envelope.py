@@ -1,6 +1,7 @@
 """Message envelope for ArqonBus protocol."""
+import zlib
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 from datetime import datetime
 from .ids import generate_message_id
 
@@ -18,6 +19,54 @@ def _parse_iso8601_timestamp(raw_timestamp: Any) -> datetime:
     return datetime.fromisoformat(normalized)
 
 
+class WireFrames:
+    """Lazily built cache of an envelope's serialized wire forms.
+    
+    Each form is encoded at most once, so fan-out to many recipients with
+    mixed wire formats never serializes the same envelope twice.
+    """
+    
+    __slots__ = ("_envelope", "_json", "_proto", "_compressed")
+    
+    def __init__(self, envelope: "Envelope"):
+        self._envelope = envelope
+        self._json: Optional[str] = None
+        self._proto: Optional[bytes] = None
+        self._compressed: Dict[str, bytes] = {}
+    
+    @property
+    def json(self) -> str:
+        """JSON text frame."""
+        if self._json is None:
+            import json
+            self._json = json.dumps(self._envelope.to_dict())
+        return self._json
+    
+    @property
+    def proto(self) -> bytes:
+        """Protobuf binary frame."""
+        if self._proto is None:
+            from .protobuf_codec import envelope_to_proto_bytes
+            self._proto = envelope_to_proto_bytes(self._envelope)
+        return self._proto
+    
+    def for_format(self, wire_format: str) -> Union[str, bytes]:
+        """Return the frame for a negotiated wire format ("json" or "protobuf")."""
+        if wire_format == "protobuf":
+            return self.proto
+        return self.json
+    
+    def compressed(self, wire_format: str = "json") -> bytes:
+        """Return the zlib-compressed frame for a wire format."""
+        cached = self._compressed.get(wire_format)
+        if cached is None:
+            frame = self.for_format(wire_format)
+            raw = frame.encode("utf-8") if isinstance(frame, str) else frame
+            cached = zlib.compress(raw)
+            self._compressed[wire_format] = cached
+        return cached
+
+
 @dataclass
 class Envelope:
     """Structured message envelope for ArqonBus communication.
@@ -58,6 +107,29 @@ class Envelope:
     # Metadata
     metadata: Dict[str, Any] = field(default_factory=dict)  # Additional data
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any field reassignment makes previously encoded frames stale.
+        self.__dict__.pop("_wire_frames", None)
+        object.__setattr__(self, name, value)
+    
+    @property
+    def frames(self) -> WireFrames:
+        """Encode-once cache of this envelope's wire frames.
+        
+        Frames are invalidated whenever a field is reassigned. In-place
+        mutation of nested values (e.g. ``payload``) after encoding requires
+        an explicit ``invalidate_frames()`` call.
+        """
+        frames = self.__dict__.get("_wire_frames")
+        if frames is None:
+            frames = WireFrames(self)
+            self.__dict__["_wire_frames"] = frames
+        return frames
+    
+    def invalidate_frames(self) -> None:
+        """Drop cached wire frames after in-place mutation."""
+        self.__dict__.pop("_wire_frames", None)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert envelope to dictionary for JSON serialization."""
         data = {
@@ -124,14 +196,11 @@ class Envelope:
     
     def to_json(self) -> str:
         """Convert envelope to JSON string."""
-        import json
-        return json.dumps(self.to_dict())
+        return self.frames.json
 
     def to_proto_bytes(self) -> bytes:
         """Convert envelope to protobuf bytes for infrastructure transport."""
-        from .protobuf_codec import envelope_to_proto_bytes
-
-        return envelope_to_proto_bytes(self)
+        return self.frames.proto
     
     @classmethod
     def from_json(cls, json_str: str) -> "Envelope":
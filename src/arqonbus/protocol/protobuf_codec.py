@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from google.protobuf import json_format
 from google.protobuf.struct_pb2 import Struct
@@ -161,3 +161,11 @@ def envelope_from_proto_bytes(payload: bytes) -> Envelope:
     pb = envelope_pb2.Envelope()
     pb.ParseFromString(payload)
     return envelope_from_proto(pb)
+
+
+def envelope_batch_to_proto_bytes(envelopes: List[Envelope]) -> bytes:
+    """Encode several envelopes as one ``EnvelopeBatch`` frame."""
+    batch = bus_payload_pb2.EnvelopeBatch(
+        envelopes=[envelope.to_proto_bytes() for envelope in envelopes]
+    )
+    return batch.SerializeToString()
@@ -4,6 +4,7 @@ import logging
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+from ..proto import bus_payload_pb2
 from .envelope import Envelope
 from .ids import is_valid_message_id
 
@@ -22,6 +23,10 @@ class EnvelopeValidator:
     # Supported message types
     SUPPORTED_MESSAGE_TYPES = {"message", "command", "response", "error", "telemetry", "operator.join"}
     
+    # Leading tag of a protobuf EnvelopeBatch (field 100, length-delimited).
+    # arqon.v1.Envelope never uses field 100, so single envelopes never start with it.
+    PROTOBUF_BATCH_TAG = b"\xa2\x06"
+    
     # Supported protocol versions
     SUPPORTED_VERSIONS = {"1.0"}
     
@@ -169,6 +174,10 @@ class EnvelopeValidator:
         except json.JSONDecodeError as e:
             raise ValidationError(f"Invalid JSON: {e}")
             
+        return cls._validate_and_parse_dict(data)
+
+    @classmethod
+    def _validate_and_parse_dict(cls, data: Any) -> Tuple[Envelope, List[str]]:
         try:
             envelope = Envelope.from_dict(data)
         except Exception as e:
@@ -194,14 +203,58 @@ class EnvelopeValidator:
 
         Returns:
             (envelope, validation_errors, wire_format) where wire_format is `json` or `protobuf`.
+
+        Raises:
+            ValidationError: If the frame is a batch (see validate_and_parse_wire_frame)
+        """
+        items, wire_format, is_batch = cls.validate_and_parse_wire_frame(wire_data)
+        if is_batch:
+            raise ValidationError("Batch frames are not accepted here")
+        envelope, errors = items[0]
+        return envelope, errors, wire_format
+
+    @classmethod
+    def validate_and_parse_wire_frame(
+        cls, wire_data: Any
+    ) -> Tuple[List[Tuple[Optional[Envelope], List[str]]], str, bool]:
+        """Parse a wire frame carrying one envelope or a batch of envelopes.
+
+        A batch is a JSON array of envelope objects, or a protobuf
+        ``EnvelopeBatch``. The frame is decoded once and every item is
+        validated; an item that cannot be decoded yields ``(None, [error])``
+        rather than failing the whole batch.
+
+        Returns:
+            (items, wire_format, is_batch) where items is a list of
+            (envelope, validation_errors) pairs.
         """
         if isinstance(wire_data, (bytes, bytearray)):
-            envelope, errors = cls.validate_and_parse_protobuf(bytes(wire_data))
-            return envelope, errors, "protobuf"
+            payload = bytes(wire_data)
+            if payload.startswith(cls.PROTOBUF_BATCH_TAG):
+                try:
+                    batch = bus_payload_pb2.EnvelopeBatch.FromString(payload)
+                except Exception as e:
+                    raise ValidationError(f"Invalid protobuf envelope batch: {e}")
+                items = [cls._parse_batch_item(cls.validate_and_parse_protobuf, item) for item in batch.envelopes]
+                return items, "protobuf", True
+            return [cls.validate_and_parse_protobuf(payload)], "protobuf", False
         if isinstance(wire_data, str):
-            envelope, errors = cls.validate_and_parse_json(wire_data)
-            return envelope, errors, "json"
+            try:
+                data = json.loads(wire_data)
+            except json.JSONDecodeError as e:
+                raise ValidationError(f"Invalid JSON: {e}")
+            if isinstance(data, list):
+                items = [cls._parse_batch_item(cls._validate_and_parse_dict, item) for item in data]
+                return items, "json", True
+            return [cls._validate_and_parse_dict(data)], "json", False
         raise ValidationError(f"Unsupported wire payload type: {type(wire_data).__name__}")
+
+    @staticmethod
+    def _parse_batch_item(parse, item: Any) -> Tuple[Optional[Envelope], List[str]]:
+        try:
+            return parse(item)
+        except ValidationError as e:
+            return None, [str(e)]
     
     @classmethod
     def is_valid(cls, envelope: Envelope) -> bool:
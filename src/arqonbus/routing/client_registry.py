@@ -1,13 +1,17 @@
 """Client registry for managing connected clients in ArqonBus."""
 import asyncio
 import logging
-from typing import Dict, Set, Optional, List
-from datetime import datetime
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple, Set, Optional, List, Tuple
+from datetime import datetime, timezone
 import weakref
 import json
 
 from ..protocol.envelope import Envelope
 from ..protocol.ids import generate_client_id
+from ..utils.metrics import record_counter, record_histogram
+from .outbound import DROP_OLDEST, OutboundQueue, normalize_overflow_policy
 
 
 logger = logging.getLogger(__name__)
@@ -30,13 +34,25 @@ class ClientInfo:
         self.room = room
         self.channel = channel
         self.connected_at = datetime.utcnow()
-        self.last_activity = datetime.utcnow()
+        self.last_activity_ts = time.time()  # epoch seconds; cheap to update per message
         self.subscriptions: Set[str] = set()  # room:channel combinations
         self.metadata: Dict[str, any] = {}
+        self.outbox: Optional[OutboundQueue] = None
+    
+    @property
+    def last_activity(self) -> datetime:
+        """Last activity time (naive UTC)."""
+        return datetime.fromtimestamp(self.last_activity_ts, timezone.utc).replace(tzinfo=None)
+    
+    @last_activity.setter
+    def last_activity(self, value: datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        self.last_activity_ts = value.timestamp()
     
     def update_activity(self):
         """Update last activity timestamp."""
-        self.last_activity = datetime.utcnow()
+        self.last_activity_ts = time.time()
     
     def subscribe_to_room_channel(self, room: str, channel: str):
         """Subscribe client to room:channel combination."""
@@ -62,22 +78,95 @@ class ClientInfo:
             "connected_at": self.connected_at.isoformat(),
             "last_activity": self.last_activity.isoformat(),
             "subscriptions": list(self.subscriptions),
-            "metadata": self.metadata
+            "metadata": self.metadata,
+            "outbound": self.outbox.snapshot() if self.outbox is not None else None
+        }
+
+
+class Recipient(NamedTuple):
+    """Precomputed send target for one member of a room:channel."""
+    client_id: str
+    send: Callable[[Any], Any]
+    wire_format: str
+    outbox: Optional[OutboundQueue]
+    is_open: Callable[[], bool]
+
+
+@dataclass
+class BroadcastReport:
+    """Outcome of a single fan-out to a room/channel."""
+    room: str
+    channel: str
+    recipients: int = 0
+    delivered: int = 0
+    queued: int = 0
+    dropped: int = 0
+    timed_out: int = 0
+    failed: int = 0
+    forwarded: int = 0
+    duration_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert broadcast report to dictionary."""
+        return {
+            "room": self.room,
+            "channel": self.channel,
+            "recipients": self.recipients,
+            "delivered": self.delivered,
+            "queued": self.queued,
+            "dropped": self.dropped,
+            "timed_out": self.timed_out,
+            "failed": self.failed,
+            "forwarded": self.forwarded,
+            "duration_ms": self.duration_ms,
         }
 
 
 class ClientRegistry:
     """Registry for managing all connected clients.
     
-    Thread-safe client registry that tracks:
+    Tracks:
     - Active WebSocket connections
     - Client room/channel subscriptions
     - Client metadata and activity
+    
+    The registry is owned by a single event loop. Reads never take a lock:
+    they do not await, so they always see a consistent state, and room
+    membership sets are immutable snapshots replaced on every change
+    (copy-on-write), so callers may keep iterating one safely. Writes that
+    await part-way through (e.g. closing an outbound queue) are serialized
+    per client by a sharded lock, so unrelated clients never wait on each
+    other.
     """
     
-    def __init__(self):
-        """Initialize client registry."""
-        self._lock = asyncio.Lock()
+    def __init__(
+        self,
+        send_timeout: float = 5.0,
+        default_wire_format: str = "json",
+        outbound_queue_size: int = 0,
+        overflow_policy: str = DROP_OLDEST,
+        overflow_policies: Optional[Dict[str, str]] = None,
+        lock_shards: int = 16,
+    ):
+        """Initialize client registry.
+        
+        Args:
+            send_timeout: Per-client deadline in seconds for a single fan-out write
+            default_wire_format: Wire format for clients that have not negotiated one
+            outbound_queue_size: Per-connection outbound queue bound (0 sends inline)
+            overflow_policy: Default overflow policy for full outbound queues
+            overflow_policies: Overflow policies by "room:channel" (or "room:*")
+            lock_shards: Number of per-client write lock shards
+        """
+        self._lock_shards = [asyncio.Lock() for _ in range(max(1, int(lock_shards)))]
+        self.send_timeout = send_timeout
+        self.default_wire_format = default_wire_format
+        self.outbound_queue_size = outbound_queue_size
+        self.overflow_policy = normalize_overflow_policy(overflow_policy)
+        self.overflow_policies: Dict[str, str] = {
+            key: normalize_overflow_policy(policy)
+            for key, policy in (overflow_policies or {}).items()
+        }
         
         # Active clients by ID
         # {client_id: ClientInfo}
@@ -87,18 +176,48 @@ class ClientRegistry:
         # {websocket: client_id}
         self._ws_to_client: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
         
-        # Room membership tracking
-        # {room: {channel: {client_id}}}
-        self._room_membership: Dict[str, Dict[str, Set[str]]] = {}
+        # Room membership tracking (copy-on-write member sets)
+        # {room: {channel: frozenset(client_id)}}
+        self._room_membership: Dict[str, Dict[str, FrozenSet[str]]] = {}
+        
+        # Cross-worker fan-out hooks, installed by WorkerMesh in multi-process mode.
+        # peer_fanout(message, room, channel) returns the number of peer workers forwarded to;
+        # membership listeners fire with ("room:channel", present) when a room:channel
+        # gains its first or loses its last local member.
+        self.peer_fanout: Optional[Callable[[Envelope, str, str], int]] = None
+        self.membership_listeners: List[Callable[[str, bool], None]] = []
+        
+        # Immutable recipient snapshots, rebuilt lazily after a membership
+        # or wire-format change.
+        # {"room:channel": (Recipient, ...)}
+        self._recipients: Dict[str, Tuple[Recipient, ...]] = {}
         
         # Statistics
         self._stats = {
             "total_clients": 0,
             "clients_by_room": {},
             "clients_by_channel": {},
+            "broadcasts": 0,
+            "broadcast_deliveries": 0,
+            "broadcast_timeouts": 0,
+            "broadcast_failures": 0,
+            "broadcast_drops": 0,
+            "recipient_snapshot_rebuilds": 0,
             "created_at": datetime.utcnow(),
             "last_activity": datetime.utcnow()
         }
+        self.last_broadcast: Optional[BroadcastReport] = None
+
+    @classmethod
+    def from_config(cls, config) -> "ClientRegistry":
+        """Build a registry with the send deadline and outbound queues of ``config.websocket``."""
+        ws_config = config.websocket
+        return cls(
+            send_timeout=ws_config.send_timeout_seconds,
+            outbound_queue_size=ws_config.outbound_queue_size,
+            overflow_policy=ws_config.outbound_overflow_policy,
+            overflow_policies=ws_config.outbound_overflow_policies,
+        )
 
     @staticmethod
     def _websocket_is_open(websocket) -> bool:
@@ -124,6 +243,99 @@ class ClientRegistry:
             return str(state_name).upper() == "OPEN"
         return True
     
+    def _lock_for(self, client_id: str) -> asyncio.Lock:
+        """Return the write lock shard owning a client."""
+        return self._lock_shards[hash(client_id) % len(self._lock_shards)]
+    
+    @classmethod
+    def _open_probe(cls, websocket) -> Callable[[], bool]:
+        """Return a cheap liveness check for a connection, resolved once."""
+        if hasattr(websocket, "open"):
+            return lambda: bool(websocket.open)
+        if hasattr(websocket, "closed"):
+            return lambda: not bool(websocket.closed)
+        if hasattr(websocket, "state"):
+            return lambda: cls._websocket_is_open(websocket)
+        return lambda: True
+    
+    def recipients_for(self, room: str, channel: str) -> Tuple[Recipient, ...]:
+        """Return the immutable recipient snapshot of a room:channel."""
+        key = f"{room}:{channel}"
+        recipients = self._recipients.get(key)
+        if recipients is None:
+            recipients = tuple(
+                Recipient(
+                    client_id=client_id,
+                    send=client_info.websocket.send,
+                    wire_format=self.wire_format_for(client_info.websocket),
+                    outbox=client_info.outbox,
+                    is_open=self._open_probe(client_info.websocket),
+                )
+                for client_id in self._room_membership.get(room, {}).get(channel, ())
+                for client_info in (self._clients.get(client_id),)
+                if client_info is not None and hasattr(client_info.websocket, "send")
+            )
+            self._stats["recipient_snapshot_rebuilds"] += 1
+            # Empty snapshots are not cached: publishing to unknown rooms must not grow the cache.
+            if recipients:
+                self._recipients[key] = recipients
+        return recipients
+    
+    def refresh_recipients(self, websocket):
+        """Drop the recipient snapshots of a connection's subscriptions.
+        
+        Call after changing per-connection send state such as the wire format.
+        """
+        client_id = self._ws_to_client.get(websocket)
+        client_info = self._clients.get(client_id) if client_id else None
+        if client_info is not None:
+            for subscription in client_info.subscriptions:
+                self._recipients.pop(subscription, None)
+    
+    def wire_format_for(self, websocket) -> str:
+        """Return the negotiated wire format ("json" or "protobuf") for a connection."""
+        wire_format = getattr(websocket, "_arqon_wire_format", None)
+        if wire_format in ("json", "protobuf"):
+            return wire_format
+        return self.default_wire_format
+    
+    def overflow_policy_for(self, room: Optional[str], channel: Optional[str]) -> str:
+        """Resolve the outbound overflow policy for a room:channel."""
+        if room is not None:
+            policy = self.overflow_policies.get(f"{room}:{channel}")
+            if policy is None:
+                policy = self.overflow_policies.get(f"{room}:*")
+            if policy is not None:
+                return policy
+        return self.overflow_policy
+    
+    def outbox_for(self, websocket) -> Optional[OutboundQueue]:
+        """Return the outbound queue owned by a connection, if any."""
+        client_id = self._ws_to_client.get(websocket)
+        client_info = self._clients.get(client_id) if client_id else None
+        return client_info.outbox if client_info else None
+    
+    async def send_frame(self, client_info: ClientInfo, frame, key: Optional[str] = None) -> bool:
+        """Send a serialized frame to one client.
+        
+        Frames are enqueued on the client's outbound queue when one exists,
+        otherwise they are written inline.
+        
+        Args:
+            client_info: Recipient client
+            frame: Serialized frame (JSON text or protobuf bytes)
+            key: Optional room:channel key for coalescing and policy lookup
+            
+        Returns:
+            True if the frame was queued or sent
+        """
+        if client_info.outbox is not None:
+            room, _, channel = key.partition(":") if key else (None, "", None)
+            outcome = client_info.outbox.put(frame, key, self.overflow_policy_for(room, channel))
+            return outcome in ("queued", "coalesced")
+        await client_info.websocket.send(frame)
+        return True
+    
     async def register_client(self, websocket, room: Optional[str] = None, channel: Optional[str] = None, metadata: Optional[Dict] = None) -> str:
         """Register a new client connection.
         
@@ -136,13 +348,17 @@ class ClientRegistry:
         Returns:
             client_id: Unique identifier for the client
         """
-        async with self._lock:
-            client_id = generate_client_id()
-            
+        client_id = generate_client_id()
+        async with self._lock_for(client_id):
             # Create client info
             client_info = ClientInfo(client_id, websocket, room, channel)
             if metadata:
                 client_info.metadata.update(metadata)
+            if self.outbound_queue_size > 0:
+                client_info.outbox = OutboundQueue(
+                    client_id, websocket, self.outbound_queue_size, self.send_timeout
+                )
+                client_info.outbox.start()
             
             # Register client
             self._clients[client_id] = client_info
@@ -166,23 +382,24 @@ class ClientRegistry:
         Args:
             client_id: ID of client to unregister
         """
-        async with self._lock:
-            if client_id not in self._clients:
+        async with self._lock_for(client_id):
+            # Remove from registry first so readers stop seeing the client
+            client_info = self._clients.pop(client_id, None)
+            if client_info is None:
                 return
             
-            client_info = self._clients[client_id]
+            # Remove from WebSocket mapping
+            if client_info.websocket in self._ws_to_client:
+                del self._ws_to_client[client_info.websocket]
             
             # Remove from room memberships
             for subscription in client_info.subscriptions:
                 room, channel = subscription.split(":", 1)
                 await self._remove_from_room_membership(client_id, room, channel)
             
-            # Remove from registry
-            del self._clients[client_id]
-            
-            # Remove from WebSocket mapping
-            if client_info.websocket in self._ws_to_client:
-                del self._ws_to_client[client_info.websocket]
+            # Stop the outbound writer
+            if client_info.outbox is not None:
+                await client_info.outbox.close()
             
             # Update statistics
             self._stats["total_clients"] -= 1
@@ -199,8 +416,7 @@ class ClientRegistry:
         Returns:
             ClientInfo or None if not found
         """
-        async with self._lock:
-            return self._clients.get(client_id)
+        return self._clients.get(client_id)
     
     async def get_client_by_websocket(self, websocket) -> Optional[ClientInfo]:
         """Get client information by WebSocket connection.
@@ -211,11 +427,10 @@ class ClientRegistry:
         Returns:
             ClientInfo or None if not found
         """
-        async with self._lock:
-            client_id = self._ws_to_client.get(websocket)
-            if client_id:
-                return self._clients.get(client_id)
-            return None
+        client_id = self._ws_to_client.get(websocket)
+        if client_id:
+            return self._clients.get(client_id)
+        return None
     
     async def join_room_channel(self, client_id: str, room: str, channel: str):
         """Add client to a room/channel.
@@ -225,7 +440,7 @@ class ClientRegistry:
             room: Room to join
             channel: Channel to join
         """
-        async with self._lock:
+        async with self._lock_for(client_id):
             if client_id not in self._clients:
                 raise ValueError(f"Client {client_id} not found")
             
@@ -249,7 +464,7 @@ class ClientRegistry:
             room: Room to leave
             channel: Channel to leave
         """
-        async with self._lock:
+        async with self._lock_for(client_id):
             if client_id not in self._clients:
                 return
             
@@ -278,16 +493,9 @@ class ClientRegistry:
         Returns:
             List of ClientInfo objects
         """
-        async with self._lock:
-            clients = []
-            client_ids = self._room_membership.get(room, {}).get(channel, set())
-            
-            for client_id in client_ids:
-                client_info = self._clients.get(client_id)
-                if client_info:
-                    clients.append(client_info)
-            
-            return clients
+        client_ids = self._room_membership.get(room, {}).get(channel, ())
+        clients = self._clients
+        return [clients[client_id] for client_id in client_ids if client_id in clients]
     
     async def get_all_clients(self) -> List[ClientInfo]:
         """Get all registered clients.
@@ -295,8 +503,7 @@ class ClientRegistry:
         Returns:
             List of all ClientInfo objects
         """
-        async with self._lock:
-            return list(self._clients.values())
+        return list(self._clients.values())
     
     async def get_clients_by_room(self, room: str) -> List[ClientInfo]:
         """Get all clients in a specific room (all channels).
@@ -307,17 +514,16 @@ class ClientRegistry:
         Returns:
             List of ClientInfo objects
         """
-        async with self._lock:
-            clients = []
-            room_channels = self._room_membership.get(room, {})
-            
-            for channel_clients in room_channels.values():
-                for client_id in channel_clients:
-                    client_info = self._clients.get(client_id)
-                    if client_info:
-                        clients.append(client_info)
-            
-            return clients
+        clients = []
+        room_channels = self._room_membership.get(room, {})
+        
+        for channel_clients in list(room_channels.values()):
+            for client_id in channel_clients:
+                client_info = self._clients.get(client_id)
+                if client_info:
+                    clients.append(client_info)
+        
+        return clients
     
     async def broadcast_to_room_channel(
         self,
@@ -328,6 +534,9 @@ class ClientRegistry:
     ) -> int:
         """Broadcast message to all clients in room/channel.
         
+        Writes to all members concurrently so a stalled client only costs
+        its own send deadline, never the latency of the other recipients.
+        
         Args:
             message: Message to broadcast
             room: Target room
@@ -337,23 +546,153 @@ class ClientRegistry:
         Returns:
             Number of clients who received the message
         """
-        clients = await self.get_clients_in_room_channel(room, channel)
-        message_json = message.to_json()
-        sent_count = 0
+        report = await self.broadcast_with_report(message, room, channel, exclude_client_id)
+        return report.delivered
+    
+    async def broadcast_with_report(
+        self,
+        message: Envelope,
+        room: str,
+        channel: str,
+        exclude_client_id: Optional[str] = None,
+        local_only: bool = False
+    ) -> BroadcastReport:
+        """Broadcast message to room/channel and report per-broadcast outcome.
         
-        for client_info in clients:
-            if client_info.client_id == exclude_client_id:
-                continue
+        Args:
+            message: Message to broadcast
+            room: Target room
+            channel: Target channel
+            exclude_client_id: Client ID to exclude from broadcast
+            local_only: Skip forwarding to peer workers (used for forwarded messages)
             
-            try:
-                if hasattr(client_info.websocket, 'send') and self._websocket_is_open(client_info.websocket):
-                    await client_info.websocket.send(message_json)
-                    sent_count += 1
-            except Exception as e:
-                logger.error(f"Failed to send message to client {client_info.client_id}: {e}")
+        Returns:
+            BroadcastReport with delivery, timeout and failure counts
+        """
+        return await self.broadcast_many([message], room, channel, exclude_client_id, local_only)
+    
+    async def broadcast_many(
+        self,
+        messages: List[Envelope],
+        room: str,
+        channel: str,
+        exclude_client_id: Optional[str] = None,
+        local_only: bool = False
+    ) -> BroadcastReport:
+        """Broadcast several messages to one room/channel.
         
-        logger.debug(f"Broadcasted message to {sent_count} clients in room '{room}', channel '{channel}'")
-        return sent_count
+        Recipients are resolved and frames encoded once for the whole group;
+        each recipient receives the messages in order. Report counts are per
+        message frame.
+        
+        Args:
+            messages: Messages to broadcast, in order
+            room: Target room
+            channel: Target channel
+            exclude_client_id: Client ID to exclude from broadcast
+            local_only: Skip forwarding to peer workers (used for forwarded messages)
+            
+        Returns:
+            BroadcastReport with delivery, timeout and failure counts
+        """
+        report = BroadcastReport(room=room, channel=channel)
+        started = time.perf_counter()
+        
+        if messages:
+            key = f"{room}:{channel}"
+            policy = self.overflow_policy_for(room, channel)
+            frames_by_format: Dict[str, list] = {}
+            inline = []
+            for recipient in self.recipients_for(room, channel):
+                if recipient.client_id == exclude_client_id or not recipient.is_open():
+                    continue
+                report.recipients += 1
+                frames = frames_by_format.get(recipient.wire_format)
+                if frames is None:
+                    frames = [message.frames.for_format(recipient.wire_format) for message in messages]
+                    frames_by_format[recipient.wire_format] = frames
+                if recipient.outbox is None:
+                    inline.append(self._send_with_deadline(recipient, frames))
+                    continue
+                # Queued recipients never stall the producer; their writer applies the deadline.
+                for frame in frames:
+                    outcome = recipient.outbox.put(frame, key, policy)
+                    if outcome in ("queued", "coalesced"):
+                        report.queued += 1
+                    else:
+                        report.dropped += 1
+            
+            outcomes = await asyncio.gather(*inline) if inline else []
+            for sent, outcome in outcomes:
+                report.delivered += sent
+                if outcome == "timeout":
+                    report.timed_out += len(messages) - sent
+                elif outcome == "failed":
+                    report.failed += len(messages) - sent
+            report.delivered += report.queued
+        
+        if self.peer_fanout is not None and not local_only:
+            for message in messages:
+                report.forwarded += self.peer_fanout(message, room, channel)
+        
+        report.duration_ms = (time.perf_counter() - started) * 1000.0
+        self._record_broadcast(report)
+        
+        logger.debug(
+            f"Broadcasted {len(messages)} message(s) to {report.recipients} clients in room '{room}', "
+            f"channel '{channel}' ({report.delivered} delivered, {report.dropped} dropped, "
+            f"{report.timed_out} timed out, {report.failed} failed)"
+        )
+        return report
+    
+    async def _send_with_deadline(self, recipient: Recipient, frames: list):
+        """Send frames in order to a single client, each bounded by the send deadline.
+        
+        Stops at the first frame that times out or fails.
+        
+        Args:
+            recipient: Recipient snapshot entry
+            frames: Serialized frames to send
+            
+        Returns:
+            (frames_sent, outcome) where outcome is "delivered", "timeout" or "failed"
+        """
+        sent = 0
+        try:
+            for frame in frames:
+                if self.send_timeout and self.send_timeout > 0:
+                    await asyncio.wait_for(recipient.send(frame), timeout=self.send_timeout)
+                else:
+                    await recipient.send(frame)
+                sent += 1
+            return sent, "delivered"
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Send to client {recipient.client_id} exceeded {self.send_timeout}s deadline"
+            )
+            return sent, "timeout"
+        except Exception as e:
+            logger.error(f"Failed to send message to client {recipient.client_id}: {e}")
+            return sent, "failed"
+    
+    def _record_broadcast(self, report: BroadcastReport):
+        """Fold a broadcast report into registry statistics and metrics."""
+        self.last_broadcast = report
+        self._stats["broadcasts"] += 1
+        self._stats["broadcast_deliveries"] += report.delivered
+        self._stats["broadcast_timeouts"] += report.timed_out
+        self._stats["broadcast_failures"] += report.failed
+        self._stats["broadcast_drops"] += report.dropped
+        
+        try:
+            record_counter("broadcast_deliveries_total", report.delivered)
+            if report.timed_out:
+                record_counter("broadcast_send_timeouts_total", report.timed_out)
+            if report.failed:
+                record_counter("broadcast_send_failures_total", report.failed)
+            record_histogram("broadcast_fanout_duration_ms", report.duration_ms)
+        except Exception:
+            logger.debug("Broadcast metric recording failed", exc_info=True)
     
     async def _add_to_room_membership(self, client_id: str, room: str, channel: str):
         """Add client to room membership tracking.
@@ -363,13 +702,16 @@ class ClientRegistry:
             room: Room to add to
             channel: Channel to add to
         """
-        if room not in self._room_membership:
-            self._room_membership[room] = {}
-        
-        if channel not in self._room_membership[room]:
-            self._room_membership[room][channel] = set()
-        
-        self._room_membership[room][channel].add(client_id)
+        channels = self._room_membership.setdefault(room, {})
+        members = channels.get(channel)
+        if members is None:
+            channels[channel] = frozenset((client_id,))
+            self._notify_membership(f"{room}:{channel}", True)
+        elif client_id not in members:
+            channels[channel] = members | {client_id}
+        else:
+            return
+        self._recipients.pop(f"{room}:{channel}", None)
     
     async def _remove_from_room_membership(self, client_id: str, room: str, channel: str):
         """Remove client from room membership tracking.
@@ -379,15 +721,39 @@ class ClientRegistry:
             room: Room to remove from
             channel: Channel to remove from
         """
-        if room in self._room_membership and channel in self._room_membership[room]:
-            self._room_membership[room][channel].discard(client_id)
-            
-            # Clean up empty channels/rooms
-            if not self._room_membership[room][channel]:
-                del self._room_membership[room][channel]
-            
-            if not self._room_membership[room]:
-                del self._room_membership[room]
+        channels = self._room_membership.get(room)
+        members = channels.get(channel) if channels is not None else None
+        if members is None or client_id not in members:
+            return
+        
+        self._recipients.pop(f"{room}:{channel}", None)
+        remaining = members - {client_id}
+        if remaining:
+            channels[channel] = remaining
+            return
+        
+        # Clean up empty channels/rooms
+        del channels[channel]
+        self._notify_membership(f"{room}:{channel}", False)
+        if not channels:
+            del self._room_membership[room]
+    
+    def _notify_membership(self, key: str, present: bool):
+        """Tell membership listeners a room:channel became (un)populated."""
+        for listener in self.membership_listeners:
+            try:
+                listener(key, present)
+            except Exception as e:
+                logger.error(f"Membership listener failed for {key}: {e}")
+    
+    def populated_room_channels(self) -> List[str]:
+        """Return the "room:channel" keys that have at least one local member."""
+        return [
+            f"{room}:{channel}"
+            for room, channels in self._room_membership.items()
+            for channel, members in channels.items()
+            if members
+        ]
     
     async def update_client_activity(self, client_id: str):
         """Update client's last activity timestamp.
@@ -395,9 +761,9 @@ class ClientRegistry:
         Args:
             client_id: Client to update
         """
-        async with self._lock:
-            if client_id in self._clients:
-                self._clients[client_id].update_activity()
+        client_info = self._clients.get(client_id)
+        if client_info is not None:
+            client_info.update_activity()
     
     async def cleanup_disconnected_clients(self) -> int:
         """Clean up clients with closed WebSocket connections.
@@ -405,22 +771,20 @@ class ClientRegistry:
         Returns:
             Number of clients cleaned up
         """
-        async with self._lock:
-            disconnected = []
-            
-            for client_id, client_info in self._clients.items():
-                # Check if WebSocket is still open
-                if not self._websocket_is_open(client_info.websocket):
-                    disconnected.append(client_id)
-            
-            # Remove disconnected clients
-            for client_id in disconnected:
-                await self.unregister_client(client_id)
-            
-            if disconnected:
-                logger.info(f"Cleaned up {len(disconnected)} disconnected clients")
-            
-            return len(disconnected)
+        disconnected = [
+            client_id
+            for client_id, client_info in self._clients.items()
+            if not self._websocket_is_open(client_info.websocket)
+        ]
+        
+        # Remove disconnected clients
+        for client_id in disconnected:
+            await self.unregister_client(client_id)
+        
+        if disconnected:
+            logger.info(f"Cleaned up {len(disconnected)} disconnected clients")
+        
+        return len(disconnected)
     
     async def get_stats(self) -> Dict:
         """Get client registry statistics.
@@ -428,24 +792,33 @@ class ClientRegistry:
         Returns:
             Dictionary of statistics
         """
-        async with self._lock:
-            stats = self._stats.copy()
-            stats["current_clients"] = len(self._clients)
-            stats["active_rooms"] = len(self._room_membership)
-            
-            # Calculate clients by room/channel
-            clients_by_room = {}
-            for room, channels in self._room_membership.items():
-                total_clients = sum(len(clients) for clients in channels.values())
-                clients_by_room[room] = {
-                    "total_clients": total_clients,
-                    "channels": {ch: len(clients) for ch, clients in channels.items()}
-                }
-            
-            stats["room_stats"] = clients_by_room
-            stats["last_updated"] = datetime.utcnow()
-            
-            return stats
+        stats = self._stats.copy()
+        stats["current_clients"] = len(self._clients)
+        stats["active_rooms"] = len(self._room_membership)
+        stats["cached_recipient_snapshots"] = len(self._recipients)
+        
+        # Calculate clients by room/channel
+        clients_by_room = {}
+        for room, channels in self._room_membership.items():
+            total_clients = sum(len(clients) for clients in channels.values())
+            clients_by_room[room] = {
+                "total_clients": total_clients,
+                "channels": {ch: len(clients) for ch, clients in channels.items()}
+            }
+        
+        stats["room_stats"] = clients_by_room
+        stats["last_broadcast"] = self.last_broadcast.to_dict() if self.last_broadcast else None
+        
+        outboxes = [c.outbox for c in self._clients.values() if c.outbox is not None]
+        stats["outbound"] = {
+            "queue_size": self.outbound_queue_size,
+            "queued_frames": sum(len(outbox) for outbox in outboxes),
+            "max_depth": max((len(outbox) for outbox in outboxes), default=0),
+            "dropped": sum(outbox.stats["dropped"] for outbox in outboxes),
+        }
+        stats["last_updated"] = datetime.utcnow()
+        
+        return stats
     
     async def health_check(self) -> Dict[str, any]:
         """Perform health check on the client registry.
@@ -472,9 +845,9 @@ class ClientRegistry:
             
             # Check for stale clients
             stale_count = 0
-            cutoff_time = datetime.utcnow().timestamp() - 3600  # 1 hour ago
+            cutoff_time = time.time() - 3600  # 1 hour ago
             for client_info in self._clients.values():
-                if client_info.last_activity.timestamp() < cutoff_time:
+                if client_info.last_activity_ts < cutoff_time:
                     stale_count += 1
             
             if stale_count > 0:
@@ -0,0 +1,307 @@
+"""Bounded per-connection outbound queues for ArqonBus."""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple, Union
+
+from ..utils.metrics import record_counter, record_gauge, record_histogram
+
+
+logger = logging.getLogger(__name__)
+
+Frame = Union[str, bytes]
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+DISCONNECT = "disconnect"
+COALESCE = "coalesce"
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST, DISCONNECT, COALESCE)
+
+# Queue key of control frames (responses, errors, acks); never evicted or coalesced.
+_CONTROL = object()
+
+
+def normalize_overflow_policy(policy: str) -> str:
+    """Normalize overflow policy names (accepts dashes or underscores)."""
+    normalized = str(policy).strip().lower().replace("-", "_")
+    if normalized not in OVERFLOW_POLICIES:
+        raise ValueError(
+            f"Unsupported overflow policy: {policy}. "
+            f"Expected one of: {', '.join(OVERFLOW_POLICIES)}."
+        )
+    return normalized
+
+
+def parse_overflow_policies(raw: str) -> Dict[str, str]:
+    """Parse ``room:channel=policy`` pairs separated by commas."""
+    policies: Dict[str, str] = {}
+    for item in raw.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        key, sep, policy = item.rpartition("=")
+        if not sep or not key.strip():
+            raise ValueError(f"Invalid overflow policy entry: {item}")
+        policies[key.strip()] = normalize_overflow_policy(policy)
+    return policies
+
+
+class OutboundQueue:
+    """Bounded outbound frame queue drained by a dedicated writer task.
+
+    Producers call ``put`` which never awaits the socket; the writer task
+    sends frames in FIFO order, bounded by a per-frame send deadline.
+    When the queue is full the overflow policy decides what happens:
+
+    - ``drop_oldest``: evict the oldest queued frame
+    - ``drop_newest``: reject the incoming frame
+    - ``disconnect``: drop the queue and close the connection
+    - ``coalesce``: replace the queued frame with the same key (e.g. the
+      same room:channel), falling back to ``drop_oldest``
+
+    Control frames queued with ``put_control`` wait for a free slot instead
+    and are never evicted by later frames.
+    """
+
+    # Sum of the depths last reported by every queue in the process; exported
+    # as the ``outbound_queue_depth`` gauge.
+    _depth_total = 0
+
+    def __init__(self, client_id: str, websocket: Any, maxsize: int, send_timeout: float = 5.0):
+        """Initialize outbound queue.
+
+        Args:
+            client_id: Owning client ID (for logging)
+            websocket: Connection frames are written to
+            maxsize: Maximum number of queued frames
+            send_timeout: Per-frame send deadline in seconds
+        """
+        self.client_id = client_id
+        self.websocket = websocket
+        self.maxsize = max(1, int(maxsize))
+        self.send_timeout = send_timeout
+        # (frame, enqueued_at, coalesce_key)
+        self._items: Deque[Tuple[Frame, float, Any]] = deque()
+        self._wakeup = asyncio.Event()
+        # Set whenever the writer takes a frame off the queue.
+        self._drained = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+        self._reported_depth = 0
+        self.closed = False
+        self.stats = {
+            "enqueued": 0,
+            "sent": 0,
+            "dropped": 0,
+            "coalesced": 0,
+            "timeouts": 0,
+            "failures": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def start(self):
+        """Start the writer task."""
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._run_writer())
+
+    async def close(self):
+        """Stop the writer task and discard queued frames."""
+        self.closed = True
+        self._items.clear()
+        self._drained.set()
+        writer = self._writer
+        self._writer = None
+        if writer and writer is not asyncio.current_task():
+            writer.cancel()
+            try:
+                await writer
+            except asyncio.CancelledError:
+                pass
+
+    async def wait_for_room(self, high_water: Optional[int] = None) -> bool:
+        """Wait until at most ``high_water`` frames are queued.
+
+        Producers that can pause (e.g. a streamed history replay) call this
+        before each ``put`` so they never trip the overflow policy.
+
+        Args:
+            high_water: Queue depth to wait for (default half of ``maxsize``)
+
+        Returns:
+            False if the queue was closed while waiting
+        """
+        limit = self.maxsize // 2 if high_water is None else max(0, int(high_water))
+        while not self.closed and len(self._items) > limit:
+            self._drained.clear()
+            await self._drained.wait()
+        return not self.closed
+
+    def put(self, frame: Frame, key: Optional[str] = None, policy: str = DROP_OLDEST) -> str:
+        """Enqueue a frame without awaiting the socket.
+
+        Args:
+            frame: Serialized frame
+            key: Coalescing key (usually "room:channel")
+            policy: Overflow policy applied if the queue is full
+
+        Returns:
+            One of "queued", "coalesced", "dropped" or "disconnected"
+        """
+        if self.closed:
+            return "dropped"
+
+        outcome = "queued"
+        if len(self._items) >= self.maxsize:
+            if policy == DROP_NEWEST:
+                self._record_drop(policy)
+                return "dropped"
+            if policy == DISCONNECT:
+                self._record_drop(policy, len(self._items) + 1)
+                self._overflow_disconnect()
+                return "disconnected"
+            if policy == COALESCE and key is not None and self._coalesce(frame, key):
+                self.stats["coalesced"] += 1
+                return "coalesced"
+            if not self._evict_oldest():
+                # Only control frames are queued; they outrank this frame.
+                self._record_drop(policy)
+                return "dropped"
+            self._record_drop(DROP_OLDEST if policy != COALESCE else COALESCE)
+            outcome = "queued"
+
+        self._items.append((frame, time.perf_counter(), key))
+        self.stats["enqueued"] += 1
+        self._wakeup.set()
+        return outcome
+
+    async def put_control(self, frame: Frame) -> str:
+        """Enqueue a frame that must not be dropped (a response, error or ack).
+
+        Waits for a free slot rather than applying the overflow policy, and
+        the queued frame is never evicted or coalesced by later ``put`` calls.
+
+        Returns:
+            "queued", or "dropped" if the queue was closed while waiting
+        """
+        # Several waiters can wake together; each re-checks for a free slot.
+        while len(self._items) >= self.maxsize:
+            if not await self.wait_for_room(self.maxsize - 1):
+                return "dropped"
+        if self.closed:
+            return "dropped"
+        self._items.append((frame, time.perf_counter(), _CONTROL))
+        self.stats["enqueued"] += 1
+        self._wakeup.set()
+        return "queued"
+
+    def _evict_oldest(self) -> bool:
+        for index, (_, _, item_key) in enumerate(self._items):
+            if item_key is not _CONTROL:
+                del self._items[index]
+                return True
+        return False
+
+    def _coalesce(self, frame: Frame, key: str) -> bool:
+        for index in range(len(self._items) - 1, -1, -1):
+            _, enqueued_at, item_key = self._items[index]
+            if item_key == key:
+                # Keep the queue slot (and its position) but deliver the newest frame.
+                self._items[index] = (frame, enqueued_at, key)
+                return True
+        return False
+
+    def _record_drop(self, policy: str, count: int = 1):
+        self.stats["dropped"] += count
+        try:
+            record_counter("outbound_queue_drops_total", count, {"policy": policy})
+        except Exception:
+            logger.debug("Outbound drop metric recording failed", exc_info=True)
+
+    def _overflow_disconnect(self):
+        logger.warning(
+            f"Outbound queue for client {self.client_id} overflowed ({self.maxsize} frames); disconnecting"
+        )
+        self.closed = True
+        self._items.clear()
+        self._wakeup.set()
+        self._drained.set()
+        close = getattr(self.websocket, "close", None)
+        if close is not None:
+            try:
+                result = close(code=1013, reason="outbound queue overflow")
+                if asyncio.iscoroutine(result):
+                    asyncio.ensure_future(result)
+            except Exception as e:
+                logger.debug(f"Failed to close overflowing client {self.client_id}: {e}")
+
+    async def _run_writer(self):
+        """Drain queued frames to the socket."""
+        try:
+            while not self.closed:
+                if not self._items:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                max_lag = 0.0
+                while self._items and not self.closed:
+                    frame, enqueued_at, _ = self._items.popleft()
+                    self._drained.set()
+                    if not await self._send(frame):
+                        if self.closed:
+                            return
+                        continue
+                    max_lag = max(max_lag, time.perf_counter() - enqueued_at)
+
+                self._record_batch(max_lag)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Outbound writer for client {self.client_id} stopped: {e}")
+        finally:
+            self._report_depth(0)
+
+    async def _send(self, frame: Frame) -> bool:
+        try:
+            if self.send_timeout and self.send_timeout > 0:
+                await asyncio.wait_for(self.websocket.send(frame), timeout=self.send_timeout)
+            else:
+                await self.websocket.send(frame)
+            self.stats["sent"] += 1
+            return True
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            logger.warning(
+                f"Send to client {self.client_id} exceeded {self.send_timeout}s deadline"
+            )
+            return False
+        except Exception as e:
+            self.stats["failures"] += 1
+            logger.info(f"Outbound writer for client {self.client_id} closing: {e}")
+            self.closed = True
+            self._items.clear()
+            return False
+
+    def _report_depth(self, depth: int) -> int:
+        OutboundQueue._depth_total += depth - self._reported_depth
+        self._reported_depth = depth
+        return OutboundQueue._depth_total
+
+    def _record_batch(self, max_lag: float):
+        total_depth = self._report_depth(len(self._items))
+        try:
+            record_histogram("outbound_writer_lag_ms", max_lag * 1000.0)
+            record_gauge("outbound_queue_depth", float(total_depth))
+        except Exception:
+            logger.debug("Outbound writer metric recording failed", exc_info=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return queue statistics."""
+        return {
+            "depth": len(self._items),
+            "maxsize": self.maxsize,
+            "closed": self.closed,
+            **self.stats,
+        }
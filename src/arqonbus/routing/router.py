@@ -203,7 +203,8 @@ class MessageRouter:
         # Get all connected clients
         all_clients = await self.client_registry.get_all_clients()
         
-        # Send to all clients except sender
+        # Send to all clients except sender; each wire format is encoded once
+        frames = envelope.frames
         sent_count = 0
         for client_info in all_clients:
             if client_info.client_id == sender_client_id:
@@ -211,8 +212,9 @@ class MessageRouter:
             
             if client_info.websocket and self.client_registry._websocket_is_open(client_info.websocket):
                 try:
-                    await client_info.websocket.send(envelope.to_json())
-                    sent_count += 1
+                    wire_format = self.client_registry.wire_format_for(client_info.websocket)
+                    if await self.client_registry.send_frame(client_info, frames.for_format(wire_format)):
+                        sent_count += 1
                 except Exception as e:
                     logger.error(f"Error sending to client {client_info.client_id}: {e}")
         
@@ -244,8 +246,10 @@ class MessageRouter:
             # Add sender info to envelope
             envelope.sender = sender_client_id
             
-            # Send message
-            await target_client.websocket.send(envelope.to_json())
+            # Send message in the target's negotiated wire format
+            wire_format = self.client_registry.wire_format_for(target_client.websocket)
+            if not await self.client_registry.send_frame(target_client, envelope.frames.for_format(wire_format)):
+                raise RoutingError(f"Outbound queue for {target_client_id} rejected the message")
             
             logger.debug(f"Direct message from {sender_client_id} to {target_client_id}")
             return True
@@ -457,9 +461,14 @@ class MessageRouter:
 class RoutingCoordinator:
     """High-level routing coordinator that manages all routing components."""
     
-    def __init__(self):
-        """Initialize routing coordinator."""
-        self._client_registry = ClientRegistry()
+    def __init__(self, config: Optional[Any] = None):
+        """Initialize routing coordinator.
+        
+        Args:
+            config: Optional configuration; its websocket send deadline and
+                outbound queue settings are applied to the client registry
+        """
+        self._client_registry = ClientRegistry.from_config(config) if config is not None else ClientRegistry()
         self._room_manager = RoomManager()
         self._channel_manager = ChannelManager()
         self._operator_registry = OperatorRegistry()
@@ -39,7 +39,7 @@ class ArqonBusServer:
         if preflight_errors:
             raise ValueError(f"Startup preflight failed: {'; '.join(preflight_errors)}")
 
-        self.routing_coordinator = RoutingCoordinator()
+        self.routing_coordinator = RoutingCoordinator(self.config)
         await self.routing_coordinator.initialize()
 
         storage_kwargs = {"max_size": self.config.storage.max_history_size}
@@ -54,6 +54,15 @@ class ArqonBusServer:
                     f"{self.config.redis.port}/{self.config.redis.db}"
                 )
             storage_kwargs["redis_url"] = redis_url
+            storage_kwargs["retention_hours"] = self.config.storage.retention_hours
+            storage_kwargs["record_format"] = self.config.storage.record_format
+            storage_kwargs["write_behind"] = self.config.storage.write_behind
+            storage_kwargs["write_behind_flush_ms"] = self.config.storage.write_behind_flush_ms
+            storage_kwargs["write_behind_batch_size"] = self.config.storage.write_behind_batch_size
+            storage_kwargs["write_behind_queue_size"] = self.config.storage.write_behind_queue_size
+            storage_kwargs["write_behind_block_when_full"] = self.config.storage.write_behind_block_when_full
+            storage_kwargs["write_behind_max_retries"] = self.config.storage.write_behind_max_retries
+            storage_kwargs["write_behind_read_timeout"] = self.config.storage.write_behind_read_timeout
         elif self.config.storage.backend == "postgres":
             storage_kwargs["storage_mode"] = self.config.storage.mode
             postgres_url = self.config.storage.postgres_url
@@ -69,6 +78,15 @@ class ArqonBusServer:
                 if self.config.postgres.ssl:
                     postgres_url = f"{postgres_url}?ssl=require"
             storage_kwargs["postgres_url"] = postgres_url
+            storage_kwargs["batch_max_size"] = self.config.storage.postgres_batch_max_size
+            storage_kwargs["batch_flush_ms"] = self.config.storage.postgres_batch_flush_ms
+            storage_kwargs["partitioning"] = self.config.storage.postgres_partitioning
+            storage_kwargs["pool_min_size"] = self.config.storage.postgres_pool_min_size
+            storage_kwargs["pool_max_size"] = self.config.storage.postgres_pool_max_size
+            storage_kwargs["statement_cache_size"] = self.config.storage.postgres_statement_cache_size
+            storage_kwargs["command_timeout"] = self.config.storage.postgres_command_timeout
+            storage_kwargs["max_inactive_connection_lifetime"] = self.config.storage.postgres_connection_lifetime
+            storage_kwargs["retention_hours"] = self.config.storage.retention_hours
 
         storage_backend = await StorageRegistry.create_backend(
             self.config.storage.backend,
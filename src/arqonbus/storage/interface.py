@@ -1,7 +1,7 @@
 """Storage backend interface for ArqonBus."""
 import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 
@@ -42,6 +42,21 @@ class StorageBackend(ABC):
         """
         pass
     
+    async def append_many(self, envelopes: List[Envelope], **kwargs) -> List[StorageResult]:
+        """Append several messages to storage.
+        
+        Backends override this to write a batch in fewer round trips; the
+        default appends one envelope at a time.
+        
+        Args:
+            envelopes: Message envelopes to store, in order
+            **kwargs: Additional storage-specific parameters
+            
+        Returns:
+            One StorageResult per envelope, in the same order
+        """
+        return [await self.append(envelope, **kwargs) for envelope in envelopes]
+    
     @abstractmethod
     async def get_history(
         self, 
@@ -65,6 +80,41 @@ class StorageBackend(ABC):
         """
         pass
     
+    async def get_history_page(
+        self,
+        room: Optional[str] = None,
+        channel: Optional[str] = None,
+        limit: int = 100,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> Tuple[List[HistoryEntry], Optional[str]]:
+        """Get one page of message history.
+        
+        Backends override this with a keyset read so a window of any size
+        can be walked page by page. The default returns a single page from
+        get_history and cannot be resumed.
+        
+        Args:
+            room: Room to get history for (None for all rooms)
+            channel: Channel to get history for (None for all channels)
+            limit: Maximum number of messages in the page
+            since: Only return messages after this time
+            until: Only return messages before this time
+            cursor: next_cursor of the previous page under the same filters
+            ascending: Oldest first instead of most recent first
+            
+        Returns:
+            Tuple of (entries, next_cursor or None when exhausted)
+        """
+        if cursor is not None:
+            raise ValueError(f"{type(self).__name__} does not support history cursors")
+        entries = await self.get_history(room=room, channel=channel, limit=limit, since=since, until=until)
+        if ascending:
+            entries = sorted(entries, key=lambda entry: entry.stored_at)
+        return entries, None
+    
     @abstractmethod
     async def delete_message(self, message_id: str) -> StorageResult:
         """Delete a specific message by ID.
@@ -141,6 +191,31 @@ class StorageBackend(ABC):
         raise NotImplementedError("Consumer groups not supported by this backend")
 
 
+def check_sequence(entries: List[HistoryEntry], last_sequence: Optional[int] = None) -> Optional[int]:
+    """Check that metadata.sequence never decreases across chronological entries.
+    
+    Entries without a sequence are skipped. Pass the result back in as
+    ``last_sequence`` to continue the check across pages.
+    
+    Returns:
+        The last sequence seen, or ``last_sequence`` if the entries had none
+    
+    Raises:
+        ValueError: If a sequence is not an integer or goes backwards
+    """
+    for entry in entries:
+        metadata = entry.envelope.metadata or {}
+        sequence = metadata.get("sequence") if isinstance(metadata, dict) else None
+        if sequence is None:
+            continue
+        if not isinstance(sequence, int):
+            raise ValueError("metadata.sequence must be an integer for strict_sequence replay")
+        if last_sequence is not None and sequence < last_sequence:
+            raise ValueError("Sequence regression detected in replay window")
+        last_sequence = sequence
+    return last_sequence
+
+
 class MessageStorage:
     """High-level message storage interface."""
     
@@ -178,6 +253,20 @@ class MessageStorage:
             
         return await self.backend.append(envelope, **kwargs)
     
+    async def store_messages(self, envelopes: List[Envelope], **kwargs) -> List[StorageResult]:
+        """Store a batch of messages with one bulk append.
+        
+        Args:
+            envelopes: Message envelopes to store
+            **kwargs: Additional storage parameters
+            
+        Returns:
+            One StorageResult per envelope, in the same order
+        """
+        if not envelopes:
+            return []
+        return await self.backend.append_many(envelopes, **kwargs)
+    
     async def get_room_history(
         self,
         room: str,
@@ -265,20 +354,40 @@ class MessageStorage:
         entries = sorted(entries, key=lambda entry: entry.stored_at)
 
         if strict_sequence:
-            last_sequence: Optional[int] = None
-            for entry in entries:
-                metadata = entry.envelope.metadata or {}
-                sequence = metadata.get("sequence") if isinstance(metadata, dict) else None
-                if sequence is None:
-                    continue
-                if not isinstance(sequence, int):
-                    raise ValueError("metadata.sequence must be an integer for strict_sequence replay")
-                if last_sequence is not None and sequence < last_sequence:
-                    raise ValueError("Sequence regression detected in replay window")
-                last_sequence = sequence
+            check_sequence(entries)
 
         return entries
     
+    async def get_history_replay_page(
+        self,
+        *,
+        room: Optional[str] = None,
+        channel: Optional[str] = None,
+        from_ts: datetime,
+        to_ts: datetime,
+        limit: int = 1000,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[HistoryEntry], Optional[str]]:
+        """Get one chronological page of a replay window.
+        
+        Walking the window page by page holds at most ``limit`` entries at a
+        time; run check_sequence over each page to keep the strict check.
+        
+        Returns:
+            Tuple of (entries oldest first, next_cursor or None when exhausted)
+        """
+        if to_ts < from_ts:
+            raise ValueError("to_ts must be >= from_ts")
+        return await self.backend.get_history_page(
+            room=room,
+            channel=channel,
+            limit=limit,
+            since=from_ts,
+            until=to_ts,
+            cursor=cursor,
+            ascending=True,
+        )
+    
     async def search_messages(
         self,
         query: str,
@@ -1,7 +1,8 @@
 """In-memory storage backend for ArqonBus."""
 import asyncio
+import heapq
 from collections import defaultdict, deque
-from typing import List, Dict, Any, Optional, Iterator
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from datetime import datetime, timedelta, timezone
 import threading
 import logging
@@ -190,6 +191,84 @@ class MemoryStorageBackend(StorageBackend):
             logger.error(f"Failed to retrieve history: {e}")
             return []
     
+    async def get_history_page(
+        self,
+        room: Optional[str] = None,
+        channel: Optional[str] = None,
+        limit: int = 100,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> Tuple[List[HistoryEntry], Optional[str]]:
+        """Get one page of history, keyed on (stored_at, message ID).
+        
+        Only the page itself is copied out of memory, so a window can be
+        walked page by page however many messages it holds.
+        
+        Args:
+            room: Room to get history for (None for all rooms)
+            channel: Channel to get history for (None for all channels)
+            limit: Maximum number of messages in the page
+            since: Only return messages after this time
+            until: Only return messages before this time
+            cursor: next_cursor of the previous page under the same filters
+            ascending: Oldest first instead of most recent first
+            
+        Returns:
+            Tuple of (entries, next_cursor or None when exhausted)
+        """
+        after = self._parse_history_cursor(cursor) if cursor is not None else None
+        count = max(0, int(limit))
+        if count == 0:
+            return [], None
+        since_utc = self._as_utc(since) if since else None
+        until_utc = self._as_utc(until) if until else None
+        
+        def sort_key(entry: HistoryEntry) -> Tuple[datetime, str]:
+            return self._as_utc(entry.stored_at), entry.envelope.id
+        
+        def candidates() -> Iterator[HistoryEntry]:
+            for current_room, channels in list(self._messages.items()):
+                if room is not None and current_room != room:
+                    continue
+                for current_channel, messages in list(channels.items()):
+                    if channel is not None and current_channel != channel:
+                        continue
+                    for entry in messages:
+                        key = sort_key(entry)
+                        if since_utc and key[0] <= since_utc:
+                            continue
+                        if until_utc and key[0] >= until_utc:
+                            continue
+                        if after is not None and (key <= after if ascending else key >= after):
+                            continue
+                        yield entry
+        
+        with self._lock:
+            # One more than the page tells us whether another page follows.
+            select = heapq.nsmallest if ascending else heapq.nlargest
+            page = select(count + 1, candidates(), key=sort_key)
+            self._stats["last_accessed"] = datetime.now(timezone.utc)
+        
+        next_cursor = None
+        if len(page) > count:
+            page = page[:count]
+            stored_at, message_id = sort_key(page[-1])
+            next_cursor = f"{stored_at.isoformat()}|{message_id}"
+        return page, next_cursor
+    
+    @staticmethod
+    def _parse_history_cursor(cursor: str) -> Tuple[datetime, str]:
+        stored_at, separator, message_id = str(cursor).partition("|")
+        try:
+            if not separator or not message_id:
+                raise ValueError(cursor)
+            parsed = datetime.fromisoformat(stored_at)
+        except ValueError as exc:
+            raise ValueError(f"Invalid history cursor: {cursor}") from exc
+        return MemoryStorageBackend._as_utc(parsed), message_id
+    
     async def delete_message(self, message_id: str) -> StorageResult:
         """Delete a message from memory storage.
         
@@ -1,15 +1,20 @@
 """Postgres storage backend for ArqonBus."""
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import json
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from .interface import HistoryEntry, StorageBackend, StorageResult
 from .memory import MemoryStorageBackend
 from ..protocol.envelope import Envelope
 from ..protocol.protobuf_codec import envelope_from_proto_bytes, envelope_to_proto_bytes
+from ..utils.metrics import record_gauge, record_histogram
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +27,291 @@ except ImportError:  # pragma: no cover - exercised via create strict/degraded t
     POSTGRES_AVAILABLE = False
 
 
+PARTITIONING_MODES = ("none", "daily", "hourly")
+_PARTITION_PERIODS = {"daily": timedelta(days=1), "hourly": timedelta(hours=1)}
+_PARTITION_NAME_FORMATS = {"daily": "%Y%m%d", "hourly": "%Y%m%d%H"}
+_PARTITION_PREFIX = "arqonbus_message_history_p"
+_DEFAULT_PARTITION = "arqonbus_message_history_default"
+
+# NOTIFY channel carrying one JSON payload per projection insert/update.
+CONTINUUM_NOTIFY_CHANNEL = "arqonbus_continuum_projection"
+
+_HISTORY_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS arqonbus_message_history (
+    id BIGSERIAL PRIMARY KEY,
+    message_id TEXT UNIQUE NOT NULL,
+    room TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    sender TEXT,
+    stored_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    envelope JSONB NOT NULL,
+    envelope_proto BYTEA
+);
+ALTER TABLE arqonbus_message_history
+  ADD COLUMN IF NOT EXISTS envelope_proto BYTEA;
+"""
+
+# Unique constraints on a partitioned table must include the partition key,
+# so message IDs are claimed in arqonbus_message_ids instead. stored_at is
+# always the server's NOW(): the sender's clock never picks the partition,
+# the history window or the retention of a row.
+_PARTITIONED_HISTORY_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS arqonbus_message_history (
+    id BIGSERIAL,
+    message_id TEXT NOT NULL,
+    room TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    sender TEXT,
+    stored_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    envelope JSONB NOT NULL,
+    envelope_proto BYTEA,
+    PRIMARY KEY (id, stored_at),
+    UNIQUE (message_id, stored_at)
+) PARTITION BY RANGE (stored_at);
+CREATE TABLE IF NOT EXISTS arqonbus_message_history_default
+  PARTITION OF arqonbus_message_history DEFAULT;
+CREATE TABLE IF NOT EXISTS arqonbus_message_ids (
+    message_id TEXT PRIMARY KEY,
+    stored_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+CREATE INDEX IF NOT EXISTS idx_arqonbus_message_ids_stored_at
+  ON arqonbus_message_ids (stored_at);
+"""
+
+# Only rows whose message ID was newly claimed are inserted, so a replayed
+# ID is a duplicate whatever timestamp it carries.
+_INSERT_MANY_PARTITIONED_SQL = """
+    WITH incoming AS (
+        SELECT DISTINCT ON (m.message_id) m.*
+        FROM unnest($1::text[], $2::text[], $3::text[], $4::text[], $5::text[], $6::bytea[])
+            AS m(message_id, room, channel, sender, envelope, envelope_proto)
+    ),
+    claimed AS (
+        INSERT INTO arqonbus_message_ids (message_id)
+        SELECT message_id FROM incoming
+        ON CONFLICT (message_id) DO NOTHING
+        RETURNING message_id
+    )
+    INSERT INTO arqonbus_message_history
+        (message_id, room, channel, sender, envelope, envelope_proto)
+    SELECT i.message_id, i.room, i.channel, i.sender, i.envelope::jsonb, i.envelope_proto
+    FROM incoming i
+    JOIN claimed USING (message_id)
+    RETURNING message_id
+"""
+
+_INSERT_MANY_SQL = """
+    INSERT INTO arqonbus_message_history
+        (message_id, room, channel, sender, envelope, envelope_proto)
+    SELECT m.message_id, m.room, m.channel, m.sender, m.envelope::jsonb, m.envelope_proto
+    FROM unnest($1::text[], $2::text[], $3::text[], $4::text[], $5::text[], $6::bytea[])
+        AS m(message_id, room, channel, sender, envelope, envelope_proto)
+    ON CONFLICT (message_id) DO NOTHING
+    RETURNING message_id
+"""
+
+# Records a batch of continuum events and projects the newest recorded event
+# of each episode in one statement. The upsert only replaces a projection with
+# an event at least as new as the one it holds; ``prior`` reads the
+# projections as they were before the statement so callers can report which
+# events were stale.
+_CONTINUUM_PROJECT_SQL = """
+    WITH incoming AS (
+        SELECT e.*
+        FROM unnest(
+            $1::text[], $2::text[], $3::text[], $4::text[], $5::text[], $6::timestamptz[], $7::text[],
+            $8::text[], $9::text[], $10::text[], $11::text[], $12::text[], $13::boolean[]
+        ) WITH ORDINALITY AS e(
+            tenant_id, agent_id, event_id, episode_id, event_type, source_ts, event,
+            content_ref, summary, tags, embedding_ref, metadata, deleted, ord
+        )
+    ),
+    recorded AS (
+        INSERT INTO arqonbus_continuum_projection_events
+            (tenant_id, agent_id, event_id, episode_id, event_type, source_ts, event)
+        SELECT tenant_id, agent_id, event_id, episode_id, event_type, source_ts, event::jsonb
+        FROM incoming
+        ON CONFLICT (tenant_id, agent_id, event_id) DO NOTHING
+        RETURNING tenant_id, agent_id, event_id
+    ),
+    prior AS (
+        SELECT p.tenant_id, p.agent_id, p.episode_id, p.last_event_ts
+        FROM arqonbus_continuum_projection p
+        WHERE (p.tenant_id, p.agent_id, p.episode_id) IN
+            (SELECT tenant_id, agent_id, episode_id FROM incoming)
+    ),
+    latest AS (
+        SELECT DISTINCT ON (i.tenant_id, i.agent_id, i.episode_id) i.*
+        FROM incoming i
+        JOIN recorded r USING (tenant_id, agent_id, event_id)
+        ORDER BY i.tenant_id, i.agent_id, i.episode_id, i.source_ts DESC, i.ord DESC
+    ),
+    projected AS (
+        INSERT INTO arqonbus_continuum_projection
+            (
+                tenant_id, agent_id, episode_id, event_type,
+                content_ref, summary, tags, embedding_ref, metadata,
+                last_event_id, last_event_ts, updated_at, deleted
+            )
+        SELECT tenant_id, agent_id, episode_id, event_type,
+               content_ref, summary, tags::jsonb, embedding_ref, metadata::jsonb,
+               event_id, source_ts, NOW(), deleted
+        FROM latest
+        ON CONFLICT (tenant_id, agent_id, episode_id)
+        DO UPDATE SET
+            event_type = EXCLUDED.event_type,
+            content_ref = EXCLUDED.content_ref,
+            summary = EXCLUDED.summary,
+            tags = EXCLUDED.tags,
+            embedding_ref = EXCLUDED.embedding_ref,
+            metadata = EXCLUDED.metadata,
+            last_event_id = EXCLUDED.last_event_id,
+            last_event_ts = EXCLUDED.last_event_ts,
+            updated_at = NOW(),
+            deleted = EXCLUDED.deleted
+        WHERE arqonbus_continuum_projection.last_event_ts <= EXCLUDED.last_event_ts
+        RETURNING tenant_id, agent_id, episode_id
+    )
+    SELECT i.ord,
+           r.event_id IS NOT NULL AS recorded,
+           pr.episode_id IS NOT NULL AS projected,
+           p.last_event_ts AS prior_ts
+    FROM incoming i
+    LEFT JOIN recorded r USING (tenant_id, agent_id, event_id)
+    LEFT JOIN prior p USING (tenant_id, agent_id, episode_id)
+    LEFT JOIN projected pr USING (tenant_id, agent_id, episode_id)
+    ORDER BY i.ord
+"""
+
+
+def _affected_rows(status: Any) -> int:
+    """Row count from an asyncpg command status such as ``"DELETE 3"``."""
+    try:
+        return int(str(status).rsplit(" ", 1)[-1])
+    except ValueError:
+        return 0
+
+
+@functools.lru_cache(maxsize=None)
+def _history_query(has_room: bool, has_channel: bool, has_since: bool, has_until: bool) -> str:
+    """History SELECT for a filter combination.
+
+    The text is identical for every call with the same filters, so each
+    variant is prepared once per connection by the statement cache.
+    """
+    conditions = []
+    index = 0
+    for present, condition in (
+        (has_room, "room = ${}"),
+        (has_channel, "channel = ${}"),
+        (has_since, "stored_at >= ${}"),
+        (has_until, "stored_at <= ${}"),
+    ):
+        if present:
+            index += 1
+            conditions.append(condition.format(index))
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return f"""
+        SELECT envelope, envelope_proto, stored_at
+        FROM arqonbus_message_history
+        {where_clause}
+        ORDER BY stored_at DESC
+        LIMIT ${index + 1}
+    """
+
+
+@functools.lru_cache(maxsize=None)
+def _history_page_query(
+    has_room: bool,
+    has_channel: bool,
+    has_since: bool,
+    has_until: bool,
+    has_cursor: bool,
+    ascending: bool,
+) -> str:
+    """Keyset history SELECT for one page, ordered by (stored_at, id)."""
+    conditions = []
+    index = 0
+    for present, condition in (
+        (has_room, "room = ${}"),
+        (has_channel, "channel = ${}"),
+        (has_since, "stored_at >= ${}"),
+        (has_until, "stored_at <= ${}"),
+    ):
+        if present:
+            index += 1
+            conditions.append(condition.format(index))
+    if has_cursor:
+        conditions.append(f"(stored_at, id) {'>' if ascending else '<'} (${index + 1}, ${index + 2})")
+        index += 2
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    direction = "ASC" if ascending else "DESC"
+    return f"""
+        SELECT id, envelope, envelope_proto, stored_at
+        FROM arqonbus_message_history
+        {where_clause}
+        ORDER BY stored_at {direction}, id {direction}
+        LIMIT ${index + 1}
+    """
+
+
+class _BatchWriter:
+    """Group concurrent appends into multi-row inserts.
+
+    The first append of an idle writer is flushed straight away (after
+    ``flush_ms`` if set); appends arriving while a flush is running are
+    collected and written together by the next one, up to ``max_size``
+    per statement. Each caller gets the result for its own message.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[Envelope]], Awaitable[List[StorageResult]]],
+        max_size: int,
+        flush_ms: float = 0.0,
+    ) -> None:
+        self._flush = flush
+        self.max_size = max(1, int(max_size))
+        self.flush_ms = max(0.0, float(flush_ms))
+        self._pending: List[Tuple[Envelope, asyncio.Future]] = []
+        self._full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, envelope: Envelope) -> StorageResult:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((envelope, future))
+        if len(self._pending) >= self.max_size:
+            self._full.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self) -> None:
+        while self._pending:
+            if self.flush_ms > 0 and len(self._pending) < self.max_size:
+                self._full.clear()
+                try:
+                    await asyncio.wait_for(self._full.wait(), timeout=self.flush_ms / 1000.0)
+                except asyncio.TimeoutError:
+                    pass
+            group = self._pending[: self.max_size]
+            del self._pending[: self.max_size]
+            try:
+                results = await self._flush([envelope for envelope, _ in group])
+            except Exception as exc:
+                for _, future in group:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(group, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def close(self) -> None:
+        if self._task is not None and not self._task.done():
+            await asyncio.wait([self._task])
+
+
 class PostgresStorageBackend(StorageBackend):
     """Postgres-backed message history storage.
 
@@ -37,7 +327,17 @@ class PostgresStorageBackend(StorageBackend):
         storage_mode: str = "degraded",
         pool: Any = None,
         fallback_storage: Optional[MemoryStorageBackend] = None,
+        batch_max_size: int = 500,
+        batch_flush_ms: float = 0.0,
+        partitioning: str = "none",
+        retention_hours: float = 0,
+        partition_premake: int = 3,
+        pool_max_size: int = 10,
     ) -> None:
+        if partitioning not in PARTITIONING_MODES:
+            raise ValueError(
+                f"Unsupported partitioning mode: {partitioning}. Expected one of: {', '.join(PARTITIONING_MODES)}."
+            )
         self.postgres_url = postgres_url
         self.max_size = max_size
         self.storage_mode = storage_mode
@@ -50,13 +350,55 @@ class PostgresStorageBackend(StorageBackend):
             "fallback_operations": 0,
             "last_postgres_error": None,
             "degraded_mode_active": pool is None,
+            "batched_appends": 0,
+            "batch_flushes": 0,
+            "partitions_created": 0,
+            "partitions_dropped": 0,
+            "default_rows_moved": 0,
+            "default_rows_expired": 0,
+            "pool_acquires": 0,
+            "pool_wait_ms_total": 0.0,
+            "pool_wait_ms_max": 0.0,
         }
+        self.pool_max_size = max(1, int(pool_max_size))
+        # Single appends share multi-row inserts unless batching is disabled (max size 1).
+        self.batch_max_size = max(1, int(batch_max_size))
+        self._writer: Optional[_BatchWriter] = None
+        if self.batch_max_size > 1:
+            self._writer = _BatchWriter(self._insert_many, self.batch_max_size, batch_flush_ms)
+        # Declarative range partitions on stored_at; retention drops whole partitions.
+        self.partitioning = partitioning
+        self.retention_hours = retention_hours
+        self.partition_premake = max(1, int(partition_premake))
+        self._partitioned = False
+        self._maintenance_task: Optional[asyncio.Task] = None
 
     @classmethod
     async def create(cls, config: Dict[str, Any]) -> "PostgresStorageBackend":
         postgres_url = config.get("postgres_url", "postgresql://localhost:5432/arqonbus")
         storage_mode = str(config.get("storage_mode", "degraded")).strip().lower()
         max_size = int(config.get("max_size", 10000))
+        batching = {
+            key: config[key]
+            for key in (
+                "batch_max_size",
+                "batch_flush_ms",
+                "partitioning",
+                "retention_hours",
+                "partition_premake",
+            )
+            if key in config
+        }
+        command_timeout = config.get("command_timeout")
+        pool_options = {
+            "min_size": int(config.get("pool_min_size", 1)),
+            "max_size": int(config.get("pool_max_size", 10)),
+            "statement_cache_size": int(config.get("statement_cache_size", 100)),
+            "max_inactive_connection_lifetime": float(config.get("max_inactive_connection_lifetime", 300.0)),
+            # 0 or None disables the per-statement timeout
+            "command_timeout": float(command_timeout) if command_timeout else None,
+        }
+        batching["pool_max_size"] = pool_options["max_size"]
 
         if storage_mode not in ("degraded", "strict"):
             raise ValueError(f"Unsupported storage mode for Postgres backend: {storage_mode}")
@@ -70,18 +412,21 @@ class PostgresStorageBackend(StorageBackend):
                 max_size=max_size,
                 storage_mode=storage_mode,
                 pool=None,
+                **batching,
             )
 
         pool = None
         try:
-            pool = await asyncpg.create_pool(postgres_url, min_size=1, max_size=10)
+            pool = await asyncpg.create_pool(postgres_url, **pool_options)
             backend = cls(
                 postgres_url=postgres_url,
                 max_size=max_size,
                 storage_mode=storage_mode,
                 pool=pool,
+                **batching,
             )
             await backend._ensure_schema()
+            backend._start_partition_maintenance()
             logger.info("Connected to Postgres storage at %s", postgres_url)
             return backend
         except Exception as exc:
@@ -95,28 +440,34 @@ class PostgresStorageBackend(StorageBackend):
                 max_size=max_size,
                 storage_mode=storage_mode,
                 pool=None,
+                **batching,
             )
 
     async def _ensure_schema(self) -> None:
         if not self.pool:
             return
-        query = """
-        CREATE TABLE IF NOT EXISTS arqonbus_message_history (
-            id BIGSERIAL PRIMARY KEY,
-            message_id TEXT UNIQUE NOT NULL,
-            room TEXT NOT NULL,
-            channel TEXT NOT NULL,
-            sender TEXT,
-            stored_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-            envelope JSONB NOT NULL,
-            envelope_proto BYTEA
-        );
-        ALTER TABLE arqonbus_message_history
-          ADD COLUMN IF NOT EXISTS envelope_proto BYTEA;
+        if self.partitioning != "none":
+            async with self._acquire() as conn:
+                relkind = await conn.fetchval(
+                    "SELECT relkind FROM pg_class WHERE relname = 'arqonbus_message_history'"
+                )
+            relkind = relkind.decode() if isinstance(relkind, bytes) else relkind
+            if relkind is None or relkind == "p":
+                self._partitioned = True
+            else:
+                logger.warning(
+                    "arqonbus_message_history exists and is not partitioned; "
+                    "%s partitioning disabled until the table is migrated",
+                    self.partitioning,
+                )
+        history_table = _PARTITIONED_HISTORY_TABLE_SQL if self._partitioned else _HISTORY_TABLE_SQL
+        query = history_table + """
         CREATE INDEX IF NOT EXISTS idx_arqonbus_room_channel_stored_at
           ON arqonbus_message_history (room, channel, stored_at DESC);
         CREATE INDEX IF NOT EXISTS idx_arqonbus_stored_at
           ON arqonbus_message_history (stored_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_arqonbus_room_channel_stored_at_id
+          ON arqonbus_message_history (room, channel, stored_at, id);
 
         CREATE TABLE IF NOT EXISTS arqonbus_continuum_projection (
             tenant_id TEXT NOT NULL,
@@ -159,9 +510,225 @@ class PostgresStorageBackend(StorageBackend):
         );
         CREATE INDEX IF NOT EXISTS idx_arqonbus_cont_proj_dlq_queued_at
           ON arqonbus_continuum_projection_dlq (queued_at DESC);
+
+        -- Keyset pagination orders
+        CREATE INDEX IF NOT EXISTS idx_arqonbus_cont_proj_updated_at
+          ON arqonbus_continuum_projection (updated_at DESC, tenant_id DESC, agent_id DESC, episode_id DESC);
+        CREATE INDEX IF NOT EXISTS idx_arqonbus_cont_proj_dlq_queued_at_id
+          ON arqonbus_continuum_projection_dlq (queued_at DESC, dlq_id DESC);
+        CREATE INDEX IF NOT EXISTS idx_arqonbus_cont_proj_events_source_ts_key
+          ON arqonbus_continuum_projection_events (source_ts, tenant_id, agent_id, event_id);
+
+        -- Tag (@>, ?|) and attribute (@>) filters
+        CREATE INDEX IF NOT EXISTS idx_arqonbus_cont_proj_tags
+          ON arqonbus_continuum_projection USING GIN (tags);
+        CREATE INDEX IF NOT EXISTS idx_arqonbus_cont_proj_metadata
+          ON arqonbus_continuum_projection USING GIN (metadata jsonb_path_ops);
+
+        -- Change feed: every projection write is announced on the NOTIFY channel
+        CREATE OR REPLACE FUNCTION arqonbus_continuum_projection_notify() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('arqonbus_continuum_projection', json_build_object(
+                'tenant_id', NEW.tenant_id,
+                'agent_id', NEW.agent_id,
+                'episode_id', NEW.episode_id,
+                'event_type', NEW.event_type,
+                'last_event_id', NEW.last_event_id,
+                'last_event_ts', NEW.last_event_ts,
+                'updated_at', NEW.updated_at,
+                'deleted', NEW.deleted
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        -- Created only when missing: dropping and recreating it on every startup
+        -- would lock the table and briefly stop NOTIFY for other instances.
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_trigger
+                WHERE tgname = 'arqonbus_continuum_projection_notify'
+                  AND tgrelid = 'arqonbus_continuum_projection'::regclass
+            ) THEN
+                CREATE TRIGGER arqonbus_continuum_projection_notify
+                  AFTER INSERT OR UPDATE ON arqonbus_continuum_projection
+                  FOR EACH ROW EXECUTE FUNCTION arqonbus_continuum_projection_notify();
+            END IF;
+        END
+        $$;
         """
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             await conn.execute(query)
+        if self._partitioned:
+            await self.maintain_partitions()
+
+    def _partition_bounds(self, moment: datetime) -> Tuple[datetime, datetime]:
+        """UTC [start, end) of the partition period containing ``moment``."""
+        moment = moment.astimezone(timezone.utc)
+        if self.partitioning == "hourly":
+            start = moment.replace(minute=0, second=0, microsecond=0)
+        else:
+            start = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+        return start, start + _PARTITION_PERIODS[self.partitioning]
+
+    def _partition_name(self, start: datetime) -> str:
+        return _PARTITION_PREFIX + start.strftime(_PARTITION_NAME_FORMATS[self.partitioning])
+
+    async def maintain_partitions(self, now: Optional[datetime] = None) -> Dict[str, List[str]]:
+        """Create upcoming partitions and drop those past retention.
+
+        Partitions are created for the current period and the next
+        ``partition_premake`` periods. A partition is dropped once its
+        whole range is older than ``retention_hours``, and default-partition
+        rows older than the cutoff are deleted. When the default partition
+        already holds rows for a new period, they are moved into it.
+
+        Returns:
+            Names of the partitions created and dropped
+        """
+        if not self.pool or not self._partitioned:
+            return {"created": [], "dropped": []}
+        now = now or datetime.now(timezone.utc)
+        period = _PARTITION_PERIODS[self.partitioning]
+        name_format = _PARTITION_NAME_FORMATS[self.partitioning]
+        created: List[str] = []
+        dropped: List[str] = []
+
+        async with self._acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT child.relname AS name
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = 'arqonbus_message_history'
+                """
+            )
+            existing = {row["name"] for row in rows}
+
+            start, _ = self._partition_bounds(now)
+            for offset in range(self.partition_premake + 1):
+                lower = start + period * offset
+                name = self._partition_name(lower)
+                if name in existing:
+                    continue
+                bounds = f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{(lower + period).isoformat()}')"
+                try:
+                    await conn.execute(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF arqonbus_message_history {bounds}"
+                    )
+                    created.append(name)
+                    continue
+                except Exception as exc:
+                    # Typically rows for this range already sit in the default partition.
+                    logger.info("Moving default-partition rows into history partition %s: %s", name, exc)
+                try:
+                    await self._adopt_default_rows(conn, name, lower, lower + period, bounds)
+                    created.append(name)
+                except Exception as exc:
+                    logger.warning("Could not create history partition %s: %s", name, exc)
+
+            if self.retention_hours and self.retention_hours > 0:
+                cutoff = now - timedelta(hours=self.retention_hours)
+                for name in sorted(existing):
+                    if not name.startswith(_PARTITION_PREFIX):
+                        continue
+                    try:
+                        lower = datetime.strptime(name[len(_PARTITION_PREFIX):], name_format)
+                    except ValueError:
+                        continue
+                    if lower.replace(tzinfo=timezone.utc) + period <= cutoff:
+                        await conn.execute(f"DROP TABLE IF EXISTS {name}")
+                        dropped.append(name)
+                # Rows outside every managed range land in the default partition; expire them too.
+                status = await conn.execute(
+                    f"DELETE FROM {_DEFAULT_PARTITION} WHERE stored_at < $1", cutoff
+                )
+                self._stats["default_rows_expired"] += _affected_rows(status)
+                await conn.execute("DELETE FROM arqonbus_message_ids WHERE stored_at < $1", cutoff)
+
+        self._stats["partitions_created"] += len(created)
+        self._stats["partitions_dropped"] += len(dropped)
+        if created or dropped:
+            logger.info("History partitions created=%s dropped=%s", created, dropped)
+        return {"created": created, "dropped": dropped}
+
+    async def _adopt_default_rows(
+        self, conn: Any, name: str, lower: datetime, upper: datetime, bounds: str
+    ) -> None:
+        """Create partition ``name`` from rows already in the default partition.
+
+        Postgres refuses to attach a range while the default partition holds
+        rows for it, so the rows are moved into a standalone table first and
+        the table is attached afterwards, all in one transaction.
+        """
+        async with conn.transaction():
+            await conn.execute(
+                f"CREATE TABLE {name} (LIKE arqonbus_message_history INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+            status = await conn.execute(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {_DEFAULT_PARTITION}
+                    WHERE stored_at >= $1 AND stored_at < $2
+                    RETURNING *
+                )
+                INSERT INTO {name} SELECT * FROM moved
+                """,
+                lower,
+                upper,
+            )
+            await conn.execute(f"ALTER TABLE arqonbus_message_history ATTACH PARTITION {name} {bounds}")
+        self._stats["default_rows_moved"] += _affected_rows(status)
+
+    def _start_partition_maintenance(self) -> None:
+        if self._partitioned and self._maintenance_task is None:
+            self._maintenance_task = asyncio.create_task(self._partition_maintenance_loop())
+
+    async def _partition_maintenance_loop(self) -> None:
+        # Several checks per period so a missed run never leaves the next period without a partition.
+        interval = _PARTITION_PERIODS[self.partitioning].total_seconds() / 4
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.maintain_partitions()
+            except Exception as exc:
+                logger.warning("History partition maintenance failed: %s", exc)
+
+    @contextlib.asynccontextmanager
+    async def _acquire(self) -> AsyncIterator[Any]:
+        """Acquire a pooled connection, recording wait time and utilization."""
+        started = time.perf_counter()
+        async with self.pool.acquire() as conn:
+            self._record_pool_acquire((time.perf_counter() - started) * 1000.0)
+            yield conn
+
+    def _pool_usage(self) -> Dict[str, Any]:
+        size = getattr(self.pool, "get_size", None)
+        idle = getattr(self.pool, "get_idle_size", None)
+        if size is None or idle is None:
+            return {}
+        size_now, idle_now = size(), idle()
+        return {
+            "size": size_now,
+            "idle": idle_now,
+            "in_use": size_now - idle_now,
+            "max_size": self.pool_max_size,
+            "utilization": (size_now - idle_now) / self.pool_max_size,
+        }
+
+    def _record_pool_acquire(self, wait_ms: float) -> None:
+        self._stats["pool_acquires"] += 1
+        self._stats["pool_wait_ms_total"] += wait_ms
+        self._stats["pool_wait_ms_max"] = max(self._stats["pool_wait_ms_max"], wait_ms)
+        try:
+            record_histogram("postgres_pool_wait_ms", wait_ms)
+            usage = self._pool_usage()
+            if usage:
+                record_gauge("postgres_pool_in_use", usage["in_use"])
+                record_gauge("postgres_pool_utilization", usage["utilization"])
+        except Exception:
+            logger.debug("Postgres pool metric recording failed", exc_info=True)
 
     async def _handle_postgres_failure(self, error: Exception) -> None:
         self._stats["last_postgres_error"] = str(error)
@@ -176,37 +743,67 @@ class PostgresStorageBackend(StorageBackend):
         if not self.pool:
             self._stats["fallback_operations"] += 1
             return await self.fallback_storage.append(envelope, **kwargs)
+        if self._writer is not None:
+            return await self._writer.submit(envelope)
+        return (await self._insert_many([envelope]))[0]
+
+    async def append_many(self, envelopes: List[Envelope], **kwargs) -> List[StorageResult]:
+        if not envelopes:
+            return []
+        if not self.pool:
+            self._stats["fallback_operations"] += len(envelopes)
+            return await self.fallback_storage.append_many(envelopes, **kwargs)
+        results: List[StorageResult] = []
+        for start in range(0, len(envelopes), self.batch_max_size):
+            results.extend(await self._insert_many(envelopes[start : start + self.batch_max_size]))
+        return results
+
+    async def _insert_many(self, envelopes: List[Envelope]) -> List[StorageResult]:
+        """Insert envelopes with one multi-row statement.
 
+        RETURNING reports which rows were new, so messages already stored
+        are marked as duplicates rather than failures.
+        """
         try:
             self._stats["postgres_operations"] += 1
-            room = envelope.room or "default"
-            channel = envelope.channel or "default"
-            envelope_json = json.dumps(envelope.to_dict())
-            envelope_proto = envelope_to_proto_bytes(envelope)
-            async with self.pool.acquire() as conn:
-                await conn.execute(
-                    """
-                    INSERT INTO arqonbus_message_history
-                        (message_id, room, channel, sender, envelope, envelope_proto)
-                    VALUES ($1, $2, $3, $4, $5::jsonb, $6::bytea)
-                    ON CONFLICT (message_id) DO NOTHING
-                    """,
-                    envelope.id,
-                    room,
-                    channel,
-                    envelope.sender,
-                    envelope_json,
-                    envelope_proto,
+            columns: Tuple[List[Any], ...] = ([], [], [], [], [], [])
+            for envelope in envelopes:
+                for column, value in zip(
+                    columns,
+                    (
+                        envelope.id,
+                        envelope.room or "default",
+                        envelope.channel or "default",
+                        envelope.sender,
+                        json.dumps(envelope.to_dict()),
+                        envelope_to_proto_bytes(envelope),
+                    ),
+                ):
+                    column.append(value)
+            query = _INSERT_MANY_PARTITIONED_SQL if self._partitioned else _INSERT_MANY_SQL
+            async with self._acquire() as conn:
+                rows = await conn.fetch(query, *columns)
+            inserted = {row["message_id"] for row in rows}
+            self._stats["batched_appends"] += len(envelopes)
+            self._stats["batch_flushes"] += 1
+            try:
+                record_histogram("postgres_append_batch_size", len(envelopes))
+            except Exception:
+                logger.debug("Postgres batch metric recording failed", exc_info=True)
+            stored_at = datetime.now(timezone.utc)
+            return [
+                StorageResult(
+                    success=True,
+                    message_id=envelope.id,
+                    timestamp=stored_at,
+                    metadata=None if envelope.id in inserted else {"duplicate": True},
                 )
-            return StorageResult(
-                success=True,
-                message_id=envelope.id,
-                timestamp=datetime.now(timezone.utc),
-            )
+                for envelope in envelopes
+            ]
         except Exception as exc:
             await self._handle_postgres_failure(exc)
-            self._stats["fallback_operations"] += 1
-            return await self.fallback_storage.append(envelope, **kwargs)
+            self._stats["fallback_operations"] += len(envelopes)
+            return await self.fallback_storage.append_many(envelopes)
 
     async def get_history(
         self,
@@ -228,55 +825,16 @@ class PostgresStorageBackend(StorageBackend):
 
         try:
             self._stats["postgres_operations"] += 1
-            conditions = []
-            params: List[Any] = []
-
-            if room is not None:
-                params.append(room)
-                conditions.append(f"room = ${len(params)}")
-            if channel is not None:
-                params.append(channel)
-                conditions.append(f"channel = ${len(params)}")
-            if since is not None:
-                params.append(since)
-                conditions.append(f"stored_at >= ${len(params)}")
-            if until is not None:
-                params.append(until)
-                conditions.append(f"stored_at <= ${len(params)}")
-
-            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            params: List[Any] = [
+                value for value in (room, channel, since, until) if value is not None
+            ]
             params.append(max(1, int(limit)))
+            query = _history_query(room is not None, channel is not None, since is not None, until is not None)
 
-            query = f"""
-                SELECT envelope, envelope_proto, stored_at
-                FROM arqonbus_message_history
-                {where_clause}
-                ORDER BY stored_at DESC
-                LIMIT ${len(params)}
-            """
-
-            async with self.pool.acquire() as conn:
+            async with self._acquire() as conn:
                 rows = await conn.fetch(query, *params)
 
-            entries: List[HistoryEntry] = []
-            for row in rows:
-                if row.get("envelope_proto"):
-                    envelope = envelope_from_proto_bytes(bytes(row["envelope_proto"]))
-                else:
-                    envelope_dict = (
-                        json.loads(row["envelope"])
-                        if isinstance(row["envelope"], str)
-                        else (row["envelope"] or {})
-                    )
-                    envelope = Envelope.from_dict(envelope_dict)
-                entries.append(
-                    HistoryEntry(
-                        envelope=envelope,
-                        stored_at=row["stored_at"],
-                        storage_metadata={"backend": "postgres"},
-                    )
-                )
-            return entries
+            return [self._history_entry(row) for row in rows]
         except Exception as exc:
             await self._handle_postgres_failure(exc)
             self._stats["fallback_operations"] += 1
@@ -288,6 +846,90 @@ class PostgresStorageBackend(StorageBackend):
                 until=until,
             )
 
+    async def get_history_page(
+        self,
+        room: Optional[str] = None,
+        channel: Optional[str] = None,
+        limit: int = 100,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> Tuple[List[HistoryEntry], Optional[str]]:
+        """Read one history page with a keyset on (stored_at, id).
+
+        Each page is a single index range scan that starts where the
+        previous page stopped, so later pages cost the same as the first.
+        """
+        if not self.pool:
+            self._stats["fallback_operations"] += 1
+            return await self.fallback_storage.get_history_page(
+                room, channel, limit, since, until, cursor=cursor, ascending=ascending
+            )
+
+        after = self._parse_history_cursor(cursor) if cursor is not None else None
+        count = max(1, int(limit))
+        try:
+            self._stats["postgres_operations"] += 1
+            params: List[Any] = [
+                value for value in (room, channel, since, until) if value is not None
+            ]
+            if after is not None:
+                params.extend(after)
+            # One more than the page tells us whether another page follows.
+            params.append(count + 1)
+            query = _history_page_query(
+                room is not None,
+                channel is not None,
+                since is not None,
+                until is not None,
+                after is not None,
+                ascending,
+            )
+
+            async with self._acquire() as conn:
+                rows = await conn.fetch(query, *params)
+
+            next_cursor = None
+            if len(rows) > count:
+                rows = rows[:count]
+                next_cursor = f"{rows[-1]['stored_at'].isoformat()}|{rows[-1]['id']}"
+            return [self._history_entry(row) for row in rows], next_cursor
+        except Exception as exc:
+            await self._handle_postgres_failure(exc)
+            self._stats["fallback_operations"] += 1
+            entries, _ = await self.fallback_storage.get_history_page(
+                room, channel, limit, since, until, ascending=ascending
+            )
+            return entries, None
+
+    @staticmethod
+    def _parse_history_cursor(cursor: str) -> Tuple[datetime, int]:
+        stored_at, separator, row_id = str(cursor).partition("|")
+        try:
+            if not separator:
+                raise ValueError(cursor)
+            return datetime.fromisoformat(stored_at), int(row_id)
+        except ValueError as exc:
+            raise ValueError(f"Invalid history cursor: {cursor}") from exc
+
+    @staticmethod
+    def _history_entry(row: Any) -> HistoryEntry:
+        if row.get("envelope_proto"):
+            envelope = envelope_from_proto_bytes(bytes(row["envelope_proto"]))
+        else:
+            envelope_dict = (
+                json.loads(row["envelope"])
+                if isinstance(row["envelope"], str)
+                else (row["envelope"] or {})
+            )
+            envelope = Envelope.from_dict(envelope_dict)
+        return HistoryEntry(
+            envelope=envelope,
+            stored_at=row["stored_at"],
+            storage_metadata={"backend": "postgres"},
+        )
+
     async def delete_message(self, message_id: str) -> StorageResult:
         if not self.pool:
             self._stats["fallback_operations"] += 1
@@ -295,7 +937,7 @@ class PostgresStorageBackend(StorageBackend):
 
         try:
             self._stats["postgres_operations"] += 1
-            async with self.pool.acquire() as conn:
+            async with self._acquire() as conn:
                 result = await conn.execute(
                     "DELETE FROM arqonbus_message_history WHERE message_id = $1",
                     message_id,
@@ -341,7 +983,7 @@ class PostgresStorageBackend(StorageBackend):
                 params.append(before)
                 conditions.append(f"stored_at < ${len(params)}")
             where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-            async with self.pool.acquire() as conn:
+            async with self._acquire() as conn:
                 result = await conn.execute(
                     f"DELETE FROM arqonbus_message_history {where_clause}",
                     *params,
@@ -359,17 +1001,30 @@ class PostgresStorageBackend(StorageBackend):
     async def get_stats(self) -> Dict[str, Any]:
         stats = dict(self._stats)
         stats["max_size"] = self.max_size
+        stats["partitioning"] = self.partitioning if self._partitioned else "none"
+        if self.pool:
+            acquires = self._stats["pool_acquires"]
+            stats["pool"] = {
+                **self._pool_usage(),
+                "avg_wait_ms": self._stats["pool_wait_ms_total"] / acquires if acquires else 0.0,
+                "max_wait_ms": self._stats["pool_wait_ms_max"],
+            }
         if not self.pool:
             stats["fallback_stats"] = await self.fallback_storage.get_stats()
             return stats
 
         try:
-            async with self.pool.acquire() as conn:
+            async with self._acquire() as conn:
                 row = await conn.fetchrow(
                     "SELECT COUNT(*) AS count, MAX(stored_at) AS last_stored_at FROM arqonbus_message_history"
                 )
             stats["total_messages"] = int(row["count"]) if row else 0
             stats["last_stored_at"] = row["last_stored_at"].isoformat() if row and row["last_stored_at"] else None
+            if self._partitioned:
+                async with self._acquire() as conn:
+                    stats["default_partition_rows"] = int(
+                        await conn.fetchval(f"SELECT COUNT(*) FROM {_DEFAULT_PARTITION}") or 0
+                    )
             return stats
         except Exception as exc:
             await self._handle_postgres_failure(exc)
@@ -380,120 +1035,177 @@ class PostgresStorageBackend(StorageBackend):
         if not self.pool:
             return await self.fallback_storage.health_check()
         try:
-            async with self.pool.acquire() as conn:
+            async with self._acquire() as conn:
                 await conn.execute("SELECT 1")
             return True
         except Exception:
             return False
 
     async def close(self) -> None:
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            try:
+                await self._maintenance_task
+            except asyncio.CancelledError:
+                pass
+            self._maintenance_task = None
+        if self._writer is not None:
+            await self._writer.close()
         if self.pool:
             await self.pool.close()
         await self.fallback_storage.close()
 
     # Continuum projector persistence hooks
     async def continuum_project_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        return (await self.continuum_project_events([event]))[0]
+
+    async def continuum_project_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Project events in order, one statement per ``batch_max_size`` events.
+
+        Results match projecting the events one at a time: an event ID seen
+        before is a duplicate, and an event older than the projection it
+        would replace (including one set earlier in the same batch) is
+        recorded but stale_rejected. The statements share one transaction,
+        so if any of them fails none of the events are applied.
+        """
         if not self.pool:
             raise RuntimeError("Postgres projector backend unavailable")
-        tenant_id = str(event["tenant_id"])
-        agent_id = str(event["agent_id"])
-        episode_id = str(event["episode_id"])
-        event_id = str(event["event_id"])
-        event_type = str(event["event_type"])
-        source_ts = datetime.fromisoformat(str(event["source_ts"]).replace("Z", "+00:00"))
-        payload = dict(event["payload"])
-
-        async with self.pool.acquire() as conn:
+        results: List[Dict[str, Any]] = []
+        async with self._acquire() as conn:
             async with conn.transaction():
-                inserted = await conn.fetchrow(
-                    """
-                    INSERT INTO arqonbus_continuum_projection_events
-                        (tenant_id, agent_id, event_id, episode_id, event_type, source_ts, event)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7::jsonb)
-                    ON CONFLICT (tenant_id, agent_id, event_id) DO NOTHING
-                    RETURNING event_id
-                    """,
-                    tenant_id,
-                    agent_id,
-                    event_id,
-                    episode_id,
-                    event_type,
-                    source_ts,
-                    json.dumps(event),
-                )
-                if inserted is None:
-                    return {
-                        "status": "duplicate",
-                        "event_id": event_id,
-                        "projection_key": (tenant_id, agent_id, episode_id),
-                    }
+                for start in range(0, len(events), self.batch_max_size):
+                    results.extend(
+                        await self._project_continuum_chunk(conn, events[start : start + self.batch_max_size])
+                    )
+        return results
 
-                existing = await conn.fetchrow(
-                    """
-                    SELECT last_event_ts
-                    FROM arqonbus_continuum_projection
-                    WHERE tenant_id = $1 AND agent_id = $2 AND episode_id = $3
-                    """,
+    async def _project_continuum_chunk(self, conn: Any, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        parsed = []
+        first_seen: Dict[Tuple[str, str, str], int] = {}
+        for index, event in enumerate(events):
+            tenant_id = str(event["tenant_id"])
+            agent_id = str(event["agent_id"])
+            event_id = str(event["event_id"])
+            parsed.append(
+                (
                     tenant_id,
                     agent_id,
-                    episode_id,
+                    event_id,
+                    str(event["episode_id"]),
+                    str(event["event_type"]),
+                    datetime.fromisoformat(str(event["source_ts"]).replace("Z", "+00:00")),
+                    dict(event["payload"]),
                 )
-                if existing and source_ts < existing["last_event_ts"]:
-                    return {
-                        "status": "stale_rejected",
-                        "event_id": event_id,
-                        "projection_key": (tenant_id, agent_id, episode_id),
-                        "existing_last_event_ts": existing["last_event_ts"].isoformat(),
-                    }
+            )
+            first_seen.setdefault((tenant_id, agent_id, event_id), index)
 
-                await conn.execute(
-                    """
-                    INSERT INTO arqonbus_continuum_projection
-                        (
-                            tenant_id, agent_id, episode_id, event_type,
-                            content_ref, summary, tags, embedding_ref, metadata,
-                            last_event_id, last_event_ts, updated_at, deleted
-                        )
-                    VALUES
-                        ($1, $2, $3, $4, $5, $6, $7::jsonb, $8, $9::jsonb, $10, $11, NOW(), $12)
-                    ON CONFLICT (tenant_id, agent_id, episode_id)
-                    DO UPDATE SET
-                        event_type = EXCLUDED.event_type,
-                        content_ref = EXCLUDED.content_ref,
-                        summary = EXCLUDED.summary,
-                        tags = EXCLUDED.tags,
-                        embedding_ref = EXCLUDED.embedding_ref,
-                        metadata = EXCLUDED.metadata,
-                        last_event_id = EXCLUDED.last_event_id,
-                        last_event_ts = EXCLUDED.last_event_ts,
-                        updated_at = NOW(),
-                        deleted = EXCLUDED.deleted
-                    """,
+        # Repeats within the batch never reach the database; the unique
+        # events are sent in order and matched back by ordinality.
+        unique = [index for index in range(len(events)) if first_seen[parsed[index][:3]] == index]
+        columns: List[List[Any]] = [[] for _ in range(13)]
+        for index in unique:
+            tenant_id, agent_id, event_id, episode_id, event_type, source_ts, payload = parsed[index]
+            for column, value in zip(
+                columns,
+                (
                     tenant_id,
                     agent_id,
+                    event_id,
                     episode_id,
                     event_type,
+                    source_ts,
+                    json.dumps(events[index]),
                     str(payload.get("content_ref")),
                     payload.get("summary"),
                     json.dumps(payload.get("tags", [])),
                     payload.get("embedding_ref"),
                     json.dumps(payload.get("metadata", {})),
-                    event_id,
-                    source_ts,
                     event_type == "episode.deleted",
+                ),
+            ):
+                column.append(value)
+        rows = await conn.fetch(_CONTINUUM_PROJECT_SQL, *columns)
+        outcome = {unique[int(row["ord"]) - 1]: row for row in rows}
+        try:
+            record_histogram("postgres_continuum_project_batch_size", float(len(unique)))
+        except Exception:
+            logger.debug("Postgres metric recording failed", exc_info=True)
+
+        results: List[Dict[str, Any]] = []
+        latest: Dict[Tuple[str, str, str], Optional[datetime]] = {}
+        for index, (tenant_id, agent_id, event_id, episode_id, event_type, source_ts, _) in enumerate(parsed):
+            projection_key = (tenant_id, agent_id, episode_id)
+            row = outcome.get(index)
+            if row is None or not row["recorded"]:
+                results.append({"status": "duplicate", "event_id": event_id, "projection_key": projection_key})
+                continue
+            current = latest.get(projection_key, row["prior_ts"])
+            if not row["projected"] or (current is not None and source_ts < current):
+                results.append(
+                    {
+                        "status": "stale_rejected",
+                        "event_id": event_id,
+                        "projection_key": projection_key,
+                        "existing_last_event_ts": current.isoformat() if current is not None else None,
+                    }
                 )
+                continue
+            latest[projection_key] = source_ts
+            results.append(
+                {
+                    "status": "projected",
+                    "event_id": event_id,
+                    "projection_key": projection_key,
+                    "deleted": event_type == "episode.deleted",
+                }
+            )
+        return results
 
-        return {
-            "status": "projected",
-            "event_id": event_id,
-            "projection_key": (tenant_id, agent_id, episode_id),
-            "deleted": event_type == "episode.deleted",
-        }
+    async def continuum_listen(
+        self,
+        callback: Callable[[Dict[str, Any]], None],
+        on_lost: Optional[Callable[[], None]] = None,
+    ) -> Callable[[], Awaitable[None]]:
+        """LISTEN for projection changes on a dedicated connection.
+
+        ``callback`` runs on the event loop with each decoded change, and
+        ``on_lost`` once if the connection drops. The returned stop function
+        is then no longer needed; the caller decides whether to listen again.
+        Returns a coroutine function that stops listening and closes the
+        connection.
+        """
+        if not self.pool or asyncpg is None:
+            raise RuntimeError("Postgres projector backend unavailable")
+        conn = await asyncpg.connect(self.postgres_url)
+
+        def on_notify(connection: Any, pid: int, channel: str, payload: str) -> None:
+            try:
+                change = json.loads(payload)
+            except ValueError:
+                logger.warning("Ignoring malformed continuum projection notification")
+                return
+            callback(change)
+
+        def on_terminate(connection: Any) -> None:
+            logger.warning("Continuum change feed connection closed")
+            if on_lost is not None:
+                on_lost()
+
+        await conn.add_listener(CONTINUUM_NOTIFY_CHANNEL, on_notify)
+        conn.add_termination_listener(on_terminate)
+
+        async def stop() -> None:
+            conn.remove_termination_listener(on_terminate)
+            with contextlib.suppress(Exception):
+                await conn.remove_listener(CONTINUUM_NOTIFY_CHANNEL, on_notify)
+            await conn.close()
+
+        return stop
 
     async def continuum_projector_status(self) -> Dict[str, Any]:
         if not self.pool:
             raise RuntimeError("Postgres projector backend unavailable")
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             projection_count = await conn.fetchval(
                 "SELECT COUNT(*) FROM arqonbus_continuum_projection"
             )
@@ -514,7 +1226,7 @@ class PostgresStorageBackend(StorageBackend):
     ) -> Optional[Dict[str, Any]]:
         if not self.pool:
             raise RuntimeError("Postgres projector backend unavailable")
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             row = await conn.fetchrow(
                 """
                 SELECT tenant_id, agent_id, episode_id, event_type, content_ref, summary,
@@ -551,7 +1263,18 @@ class PostgresStorageBackend(StorageBackend):
         limit: int = 100,
         tenant_id: Optional[str] = None,
         agent_id: Optional[str] = None,
+        after: Optional[Tuple[str, str, str, str]] = None,
+        tags_all: Optional[List[str]] = None,
+        tags_any: Optional[List[str]] = None,
+        attributes: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
+        """Projections, most recently updated first.
+
+        ``after`` is the (updated_at, tenant_id, agent_id, episode_id) of the
+        last row of the previous page; rows sorting after it are returned.
+        Tag and attribute filters are jsonb containment/existence tests
+        served by the GIN indexes on ``tags`` and ``metadata``.
+        """
         if not self.pool:
             raise RuntimeError("Postgres projector backend unavailable")
         conditions = []
@@ -562,6 +1285,21 @@ class PostgresStorageBackend(StorageBackend):
         if agent_id:
             params.append(agent_id)
             conditions.append(f"agent_id = ${len(params)}")
+        if tags_all:
+            params.append(json.dumps(list(tags_all)))
+            conditions.append(f"tags @> ${len(params)}::jsonb")
+        if tags_any:
+            params.append(list(tags_any))
+            conditions.append(f"tags ?| ${len(params)}::text[]")
+        if attributes:
+            params.append(json.dumps(attributes))
+            conditions.append(f"metadata @> ${len(params)}::jsonb")
+        if after is not None:
+            params.extend([datetime.fromisoformat(after[0]), after[1], after[2], after[3]])
+            conditions.append(
+                "(updated_at, tenant_id, agent_id, episode_id) < "
+                f"(${len(params) - 3}, ${len(params) - 2}, ${len(params) - 1}, ${len(params)})"
+            )
         params.append(max(1, int(limit)))
         where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
         query = f"""
@@ -570,10 +1308,10 @@ class PostgresStorageBackend(StorageBackend):
                    updated_at, deleted
             FROM arqonbus_continuum_projection
             {where_clause}
-            ORDER BY updated_at DESC
+            ORDER BY updated_at DESC, tenant_id DESC, agent_id DESC, episode_id DESC
             LIMIT ${len(params)}
         """
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             rows = await conn.fetch(query, *params)
         return [
             {
@@ -598,7 +1336,7 @@ class PostgresStorageBackend(StorageBackend):
         if not self.pool:
             raise RuntimeError("Postgres projector backend unavailable")
         dlq_id = f"dlq_{event.get('event_id', 'evt')}_{datetime.now(timezone.utc).timestamp()}"
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             await conn.execute(
                 """
                 INSERT INTO arqonbus_continuum_projection_dlq (dlq_id, reason, event)
@@ -620,18 +1358,30 @@ class PostgresStorageBackend(StorageBackend):
             "queued_at": row["queued_at"].isoformat() if row else datetime.now(timezone.utc).isoformat(),
         }
 
-    async def continuum_projector_dlq_list(self, *, limit: int = 100) -> List[Dict[str, Any]]:
+    async def continuum_projector_dlq_list(
+        self,
+        *,
+        limit: int = 100,
+        after: Optional[Tuple[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """DLQ records, most recently queued first; ``after`` is (queued_at, dlq_id)."""
         if not self.pool:
             raise RuntimeError("Postgres projector backend unavailable")
-        async with self.pool.acquire() as conn:
+        params: List[Any] = [max(1, int(limit))]
+        where_clause = ""
+        if after is not None:
+            params.extend([datetime.fromisoformat(after[0]), after[1]])
+            where_clause = "WHERE (queued_at, dlq_id) < ($2, $3)"
+        async with self._acquire() as conn:
             rows = await conn.fetch(
-                """
+                f"""
                 SELECT dlq_id, reason, event, queued_at
                 FROM arqonbus_continuum_projection_dlq
-                ORDER BY queued_at DESC
+                {where_clause}
+                ORDER BY queued_at DESC, dlq_id DESC
                 LIMIT $1
                 """,
-                max(1, int(limit)),
+                *params,
             )
         return [
             {
@@ -647,7 +1397,7 @@ class PostgresStorageBackend(StorageBackend):
     async def continuum_projector_dlq_get(self, dlq_id: str) -> Optional[Dict[str, Any]]:
         if not self.pool:
             raise RuntimeError("Postgres projector backend unavailable")
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             row = await conn.fetchrow(
                 """
                 SELECT dlq_id, reason, event, queued_at
@@ -669,7 +1419,7 @@ class PostgresStorageBackend(StorageBackend):
     async def continuum_projector_dlq_remove(self, dlq_id: str) -> bool:
         if not self.pool:
             raise RuntimeError("Postgres projector backend unavailable")
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             result = await conn.execute(
                 "DELETE FROM arqonbus_continuum_projection_dlq WHERE dlq_id = $1",
                 dlq_id,
@@ -683,7 +1433,15 @@ class PostgresStorageBackend(StorageBackend):
         to_ts: datetime,
         tenant_id: Optional[str] = None,
         agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, str, str, str]] = None,
     ) -> List[Dict[str, Any]]:
+        """Recorded events in source order.
+
+        With ``limit``, at most that many events are returned; ``after`` is
+        the (source_ts, tenant_id, agent_id, event_id) of the last event of
+        the previous page.
+        """
         if not self.pool:
             raise RuntimeError("Postgres projector backend unavailable")
         conditions = ["source_ts >= $1", "source_ts <= $2"]
@@ -694,13 +1452,24 @@ class PostgresStorageBackend(StorageBackend):
         if agent_id:
             params.append(agent_id)
             conditions.append(f"agent_id = ${len(params)}")
+        if after is not None:
+            params.extend(after)
+            conditions.append(
+                "(source_ts, tenant_id, agent_id, event_id) > "
+                f"(${len(params) - 3}, ${len(params) - 2}, ${len(params) - 1}, ${len(params)})"
+            )
+        limit_clause = ""
+        if limit is not None:
+            params.append(max(1, int(limit)))
+            limit_clause = f"LIMIT ${len(params)}"
         where_clause = " AND ".join(conditions)
         query = f"""
             SELECT event
             FROM arqonbus_continuum_projection_events
             WHERE {where_clause}
-            ORDER BY source_ts ASC
+            ORDER BY source_ts ASC, tenant_id ASC, agent_id ASC, event_id ASC
+            {limit_clause}
         """
-        async with self.pool.acquire() as conn:
+        async with self._acquire() as conn:
             rows = await conn.fetch(query, *params)
         return [json.loads(row["event"]) if isinstance(row["event"], str) else (row["event"] or {}) for row in rows]
@@ -4,10 +4,14 @@ This module provides a Redis-based storage backend using Redis Streams
 for scalable message persistence and history retrieval.
 """
 
+import asyncio
 import json
 import base64
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import re
+import time
+import zlib
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Tuple
 
 try:
     import redis.asyncio as redis
@@ -26,11 +30,26 @@ except ImportError:
 from ..protocol.envelope import Envelope
 from ..protocol.protobuf_codec import envelope_from_proto_bytes, envelope_to_proto_bytes
 from ..utils.logging import get_logger
+from ..utils.metrics import record_counter, record_gauge, record_histogram
 from .interface import StorageBackend, StorageResult, HistoryEntry
 from .memory import MemoryStorageBackend
 
 logger = get_logger(__name__)
 
+_STREAM_ID_RE = re.compile(r"^\d+-\d+$")
+
+# Stream record formats. "legacy" writes the flat JSON fields plus a base64
+# protobuf copy; the others write a versioned header and a single body.
+RECORD_FORMATS = ("legacy", "json", "protobuf", "compressed")
+RECORD_VERSION = 1
+RECORD_HEADER_FIELD = "hdr"
+RECORD_BODY_FIELD = "body"
+_RECORD_ENCODINGS = {"json": "json", "protobuf": "pb", "compressed": "pb+zlib"}
+
+# Backoff between write-behind group commit retries: base, doubled per attempt, capped.
+_WRITE_BEHIND_RETRY_BASE = 0.05
+_WRITE_BEHIND_RETRY_MAX = 2.0
+
 
 class RedisStreamsStorage(StorageBackend):
     """Redis Streams-based storage backend for ArqonBus.
@@ -49,6 +68,18 @@ class RedisStreamsStorage(StorageBackend):
         stream_prefix: str = "arqonbus",
         history_limit: int = 1000,
         key_ttl: int = 3600,
+        retention_hours: float = 0,
+        write_behind: bool = False,
+        write_behind_flush_ms: float = 5.0,
+        write_behind_batch_size: int = 256,
+        write_behind_queue_size: int = 10000,
+        write_behind_block_when_full: bool = True,
+        write_behind_max_retries: int = 3,
+        write_behind_read_timeout: float = 1.0,
+        record_format: str = "legacy",
+        stats_cache_ttl: float = 5.0,
+        stats_scan_count: int = 500,
+        stats_scan_max_calls: int = 10,
         fallback_storage: Optional[MemoryStorageBackend] = None,
         **kwargs,
     ):
@@ -61,7 +92,27 @@ class RedisStreamsStorage(StorageBackend):
             storage_mode: degraded|strict storage behavior
             stream_prefix: Prefix for Redis Stream keys
             history_limit: Maximum number of messages to keep in history
-            key_ttl: Time-to-live for stream keys in seconds
+            key_ttl: Minimum time-to-live for idle stream keys in seconds
+            retention_hours: Trim stream entries older than this (MINID);
+                0 caps each stream at roughly max_size entries (MAXLEN ~)
+            write_behind: Acknowledge appends once queued and commit them
+                in background pipelined groups
+            write_behind_flush_ms: Max time a queued message waits for its group
+            write_behind_batch_size: Max messages per group commit
+            write_behind_queue_size: Max messages awaiting commit
+            write_behind_block_when_full: Block appends while the queue is
+                full; otherwise reject them
+            write_behind_max_retries: Retries of a failed group commit before
+                its messages are dropped (and counted)
+            write_behind_read_timeout: Max seconds a history read waits for
+                earlier write-behind messages to be committed
+            record_format: Stream record encoding: legacy, json, protobuf
+                or compressed. Binary formats need a client without
+                decode_responses.
+            stats_cache_ttl: Seconds to reuse Redis-derived stats between calls
+            stats_scan_count: COUNT hint for each SCAN made by get_stats
+            stats_scan_max_calls: Max SCAN calls per get_stats; the stream
+                count is a lower bound when the scan stops early
             fallback_storage: Fallback memory storage for Redis failures
         """
         self.max_size = max_size
@@ -72,6 +123,36 @@ class RedisStreamsStorage(StorageBackend):
         self.stream_prefix = stream_prefix
         self.history_limit = history_limit
         self.key_ttl = key_ttl
+        self.retention_hours = retention_hours
+        if record_format not in RECORD_FORMATS:
+            raise ValueError(
+                f"Unsupported record format: {record_format}. Expected one of: {', '.join(RECORD_FORMATS)}."
+            )
+        self.record_format = record_format
+        self.stats_key = f"{stream_prefix}:stats"
+        self.stats_cache_ttl = stats_cache_ttl
+        self.stats_scan_count = max(1, int(stats_scan_count))
+        self.stats_scan_max_calls = max(1, int(stats_scan_max_calls))
+        # (monotonic time, Redis-derived stats)
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # {stream: monotonic time of the last EXPIRE refresh}
+        self._expiry_refreshed: Dict[str, float] = {}
+        
+        # Write-behind group commit
+        self.write_behind = write_behind
+        self.write_behind_flush_ms = write_behind_flush_ms
+        self.write_behind_batch_size = max(1, int(write_behind_batch_size))
+        self.write_behind_block_when_full = write_behind_block_when_full
+        self.write_behind_max_retries = max(0, int(write_behind_max_retries))
+        self.write_behind_read_timeout = write_behind_read_timeout
+        # Queue of (enqueue sequence, envelope)
+        self._write_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, int(write_behind_queue_size)))
+        self._committer: Optional[asyncio.Task] = None
+        # Groups are settled in queue order, so every message up to
+        # _settled_seq has been committed (or dropped after its retries).
+        self._enqueued_seq = 0
+        self._settled_seq = 0
+        self._settled = asyncio.Event()
         fallback_max_size = kwargs.get("max_size", max_size)
         self.fallback_storage = fallback_storage or MemoryStorageBackend(max_size=fallback_max_size)
         
@@ -88,6 +169,14 @@ class RedisStreamsStorage(StorageBackend):
             "connection_failures": 0,
             "last_redis_error": None,
             "degraded_mode_active": self.redis_client is None,
+            "pipelined_appends": 0,
+            "pipeline_round_trips": 0,
+            "write_behind_commits": 0,
+            "write_behind_rejected": 0,
+            "write_behind_errors": 0,
+            "write_behind_retries": 0,
+            "write_behind_dropped": 0,
+            "last_write_behind_error": None,
         }
     
     async def connect(self):
@@ -99,7 +188,8 @@ class RedisStreamsStorage(StorageBackend):
             # Configure connection pool
             kwargs = {
                 "encoding": "utf-8",
-                "decode_responses": True, # For string handling
+                # Binary record formats must come back as bytes
+                "decode_responses": self.record_format in ("legacy", "json"),
                 "socket_timeout": 5.0,
                 "socket_connect_timeout": 5.0,
                 "retry_on_timeout": True,
@@ -137,6 +227,24 @@ class RedisStreamsStorage(StorageBackend):
         stream_prefix = config.get("stream_prefix", "arqonbus")
         history_limit = config.get("history_limit", 1000)
         key_ttl = config.get("key_ttl", 3600)
+        retention_hours = config.get("retention_hours", 0)
+        options = {
+            key: config[key]
+            for key in (
+                "record_format",
+                "write_behind",
+                "write_behind_flush_ms",
+                "write_behind_batch_size",
+                "write_behind_queue_size",
+                "write_behind_block_when_full",
+                "write_behind_max_retries",
+                "write_behind_read_timeout",
+                "stats_cache_ttl",
+                "stats_scan_count",
+                "stats_scan_max_calls",
+            )
+            if key in config
+        }
         max_size = config.get("max_size", 1000)
         
         # Create fallback memory storage
@@ -157,6 +265,8 @@ class RedisStreamsStorage(StorageBackend):
                     stream_prefix=stream_prefix,
                     history_limit=history_limit,
                     key_ttl=key_ttl,
+                    retention_hours=retention_hours,
+                    **options,
                     fallback_storage=fallback_storage
                 )
             
@@ -188,6 +298,8 @@ class RedisStreamsStorage(StorageBackend):
                 stream_prefix=stream_prefix,
                 history_limit=history_limit,
                 key_ttl=key_ttl,
+                retention_hours=retention_hours,
+                **options,
                 fallback_storage=fallback_storage
             )
         
@@ -199,6 +311,8 @@ class RedisStreamsStorage(StorageBackend):
             stream_prefix=stream_prefix,
             history_limit=history_limit,
             key_ttl=key_ttl,
+            retention_hours=retention_hours,
+            **options,
             fallback_storage=fallback_storage
         )
 
@@ -211,6 +325,108 @@ class RedisStreamsStorage(StorageBackend):
                 f"Redis operation failed in strict storage mode: {error}"
             ) from error
     
+    def _trim_kwargs(self) -> Dict[str, Any]:
+        """XADD trimming arguments derived from the retention settings."""
+        if self.retention_hours and self.retention_hours > 0:
+            cutoff_ms = int((time.time() - self.retention_hours * 3600) * 1000)
+            return {"minid": f"{max(cutoff_ms, 0)}-0", "approximate": True}
+        if self.max_size and self.max_size > 0:
+            return {"maxlen": self.max_size, "approximate": True}
+        return {}
+    
+    def _expiring_streams(self, streams: List[str]) -> List[str]:
+        """Streams whose idle-key TTL is due for a refresh.
+        
+        Trimming bounds live streams; the TTL only reaps streams that stop
+        receiving writes, so it is refreshed at most every half TTL.
+        """
+        now = time.monotonic()
+        interval = self._stream_ttl() / 2
+        if len(self._expiry_refreshed) > 10000:
+            self._expiry_refreshed.clear()
+        due = []
+        for stream in streams:
+            if now - self._expiry_refreshed.get(stream, float("-inf")) >= interval:
+                self._expiry_refreshed[stream] = now
+                due.append(stream)
+        return due
+    
+    def _stream_ttl(self) -> int:
+        retention_seconds = int((self.retention_hours or 0) * 3600)
+        return max(int(self.key_ttl), retention_seconds)
+    
+    def _streams_for(self, envelope: Envelope) -> List[str]:
+        streams = [f"{self.stream_prefix}:messages"]
+        if envelope.sender:
+            streams.append(f"{self.stream_prefix}:sender_{envelope.sender}")
+        if envelope.room:
+            streams.append(f"{self.stream_prefix}:room_{envelope.room}")
+        if envelope.channel:
+            streams.append(f"{self.stream_prefix}:channel_{envelope.channel}")
+        if envelope.room and envelope.channel:
+            streams.append(self._history_stream(envelope.room, envelope.channel))
+        return streams
+    
+    def _history_stream(self, room: Optional[str], channel: Optional[str]) -> str:
+        """Index stream holding exactly the messages of a room/channel filter.
+
+        The room+channel key lives in its own namespace with a length-prefixed
+        room, so it cannot equal a room-only key or another room/channel pair.
+        """
+        if room and channel:
+            return f"{self.stream_prefix}:roomchannel:{len(room)}:{room}:{channel}"
+        if room:
+            return f"{self.stream_prefix}:room_{room}"
+        if channel:
+            return f"{self.stream_prefix}:channel_{channel}"
+        return f"{self.stream_prefix}:messages"
+    
+    @staticmethod
+    def _message_data(envelope: Envelope) -> Dict[str, str]:
+        return {
+            "id": envelope.id,
+            "type": envelope.type,
+            "timestamp": envelope.timestamp.isoformat() if isinstance(envelope.timestamp, datetime) else str(envelope.timestamp),
+            "sender": envelope.sender or "",
+            "room": envelope.room or "",
+            "channel": envelope.channel or "",
+            "payload": json.dumps(envelope.payload) if envelope.payload else "{}",
+            "envelope_proto_b64": base64.b64encode(envelope_to_proto_bytes(envelope)).decode("ascii"),
+        }
+    
+    def _record_fields(self, envelope: Envelope) -> Dict[str, Any]:
+        """Encode an envelope as a stream record in the configured format."""
+        if self.record_format == "legacy":
+            return self._message_data(envelope)
+        encoding = _RECORD_ENCODINGS[self.record_format]
+        if encoding == "json":
+            body: Any = envelope.to_json()
+        else:
+            body = envelope.to_proto_bytes()
+            if encoding == "pb+zlib":
+                body = zlib.compress(body)
+        return {RECORD_HEADER_FIELD: f"{RECORD_VERSION}:{encoding}", RECORD_BODY_FIELD: body}
+    
+    @classmethod
+    def _decode_record(cls, fields: Dict[str, Any]) -> Optional[Envelope]:
+        """Decode a headered stream record; None for records without a header."""
+        header = fields.get(RECORD_HEADER_FIELD)
+        if header is None:
+            return None
+        version, _, encoding = cls._text(header).partition(":")
+        if version != str(RECORD_VERSION):
+            raise ValueError(f"Unsupported record version: {version}")
+        body = fields.get(RECORD_BODY_FIELD)
+        if encoding == "json":
+            return Envelope.from_json(cls._text(body))
+        if isinstance(body, str):
+            raise ValueError("Binary stream records require a Redis client without decode_responses")
+        if encoding == "pb":
+            return envelope_from_proto_bytes(body)
+        if encoding == "pb+zlib":
+            return envelope_from_proto_bytes(zlib.decompress(body))
+        raise ValueError(f"Unsupported record encoding: {encoding}")
+    
     async def append(self, envelope: Envelope, **kwargs) -> StorageResult:
         """Append message to Redis Streams.
         
@@ -221,67 +437,202 @@ class RedisStreamsStorage(StorageBackend):
         Returns:
             StorageResult indicating success/failure
         """
+        results = await self.append_many([envelope], **kwargs)
+        return results[0]
+    
+    async def append_many(self, envelopes: List[Envelope], **kwargs) -> List[StorageResult]:
+        """Append messages to Redis Streams in a single pipelined round trip.
+        
+        Every message is added to the main stream and its sender, room and
+        channel index streams, trimmed by MINID (retention_hours) or
+        MAXLEN ~ (max_size) as part of the same XADD. In write-behind mode
+        the messages are queued instead and committed by a background task.
+        
+        Args:
+            envelopes: Message envelopes to store, in order
+            **kwargs: Additional parameters (ignored for Redis)
+            
+        Returns:
+            One StorageResult per envelope, in order
+        """
+        if not envelopes:
+            return []
+        if self.write_behind and self.redis_client:
+            return await self._enqueue(envelopes)
+        return await self._commit(envelopes, **kwargs)
+    
+    async def _commit(self, envelopes: List[Envelope], **kwargs) -> List[StorageResult]:
+        """Write envelopes to Redis with one pipeline execute."""
         # Use fallback storage if Redis unavailable
         if not self.redis_client:
-            self._stats["fallback_operations"] += 1
-            return await self.fallback_storage.append(envelope, **kwargs)
+            self._stats["fallback_operations"] += len(envelopes)
+            return await self.fallback_storage.append_many(envelopes, **kwargs)
         
         try:
             self._stats["redis_operations"] += 1
+            trim = self._trim_kwargs()
+            pipe = self.redis_client.pipeline(transaction=False)
+            touched: Dict[str, None] = {}
+            for envelope in envelopes:
+                message_data = self._record_fields(envelope)
+                for stream in self._streams_for(envelope):
+                    pipe.xadd(stream, message_data, **trim)
+                    touched[stream] = None
             
-            # Prepare message data for Redis Streams
-            message_data = {
-                "id": envelope.id,
-                "type": envelope.type,
-                "timestamp": envelope.timestamp.isoformat() if isinstance(envelope.timestamp, datetime) else str(envelope.timestamp),
-                "sender": envelope.sender or "",
-                "room": envelope.room or "",
-                "channel": envelope.channel or "",
-                "payload": json.dumps(envelope.payload) if envelope.payload else "{}",
-                "envelope_proto_b64": base64.b64encode(envelope_to_proto_bytes(envelope)).decode("ascii"),
-            }
+            ttl = self._stream_ttl()
+            for stream in self._expiring_streams(list(touched)):
+                pipe.expire(stream, ttl)
             
-            # Main message stream
-            main_stream = f"{self.stream_prefix}:messages"
-            await self.redis_client.xadd(main_stream, message_data)
-            
-            # Sender-specific streams for history
-            if envelope.sender:
-                sender_stream = f"{self.stream_prefix}:sender_{envelope.sender}"
-                await self.redis_client.xadd(sender_stream, message_data)
-            
-            # Room/channel streams if applicable
-            if envelope.room:
-                room_stream = f"{self.stream_prefix}:room_{envelope.room}"
-                await self.redis_client.xadd(room_stream, message_data)
-            
-            if envelope.channel:
-                channel_stream = f"{self.stream_prefix}:channel_{envelope.channel}"
-                await self.redis_client.xadd(channel_stream, message_data)
-            
-            # Set TTL on streams for cleanup
-            await self.redis_client.expire(main_stream, self.key_ttl)
-            if envelope.sender:
-                await self.redis_client.expire(sender_stream, self.key_ttl)
-            if envelope.room:
-                await self.redis_client.expire(room_stream, self.key_ttl)
-            if envelope.channel:
-                await self.redis_client.expire(channel_stream, self.key_ttl)
-            
-            logger.debug(f"Stored message {envelope.id} in Redis Streams")
-            return StorageResult(
-                success=True,
-                message_id=envelope.id,
-                timestamp=datetime.utcnow()
-            )
+            # Counters kept alongside the data so get_stats never walks the keyspace
+            pipe.hincrby(self.stats_key, "messages_appended", len(envelopes))
+            pipe.hset(self.stats_key, "last_append_ms", int(time.time() * 1000))
+            
+            await pipe.execute()
+            self._stats["pipelined_appends"] += len(envelopes)
+            self._stats["pipeline_round_trips"] += 1
+            
+            logger.debug(f"Stored {len(envelopes)} message(s) in Redis Streams")
+            stored_at = datetime.utcnow()
+            return [
+                StorageResult(success=True, message_id=envelope.id, timestamp=stored_at)
+                for envelope in envelopes
+            ]
             
         except Exception as e:
             logger.error(f"Redis storage error: {e}")
+            # Streams written before the failure may have been refreshed; re-arm them.
+            self._expiry_refreshed.clear()
             await self._handle_redis_failure(e)
             
             # Fallback to memory storage
-            self._stats["fallback_operations"] += 1
-            return await self.fallback_storage.append(envelope, **kwargs)
+            self._stats["fallback_operations"] += len(envelopes)
+            return await self.fallback_storage.append_many(envelopes, **kwargs)
+    
+    async def _enqueue(self, envelopes: List[Envelope]) -> List[StorageResult]:
+        """Queue envelopes for the write-behind committer."""
+        if self._committer is None or self._committer.done():
+            self._committer = asyncio.create_task(self._run_committer())
+        
+        results = []
+        for envelope in envelopes:
+            if self._write_queue.full() and not self.write_behind_block_when_full:
+                self._stats["write_behind_rejected"] += 1
+                results.append(StorageResult(
+                    success=False,
+                    message_id=envelope.id,
+                    timestamp=datetime.utcnow(),
+                    error_message="Write-behind queue full",
+                ))
+                continue
+            self._enqueued_seq += 1
+            await self._write_queue.put((self._enqueued_seq, envelope))
+            results.append(StorageResult(
+                success=True,
+                message_id=envelope.id,
+                timestamp=datetime.utcnow(),
+                metadata={"write_behind": True},
+            ))
+        return results
+    
+    async def _next_group(self) -> List[Tuple[int, Envelope]]:
+        """Wait for a message, then gather more until the group is full or its flush interval elapses."""
+        loop = asyncio.get_running_loop()
+        group = [await self._write_queue.get()]
+        deadline = loop.time() + self.write_behind_flush_ms / 1000.0
+        while len(group) < self.write_behind_batch_size:
+            try:
+                group.append(self._write_queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                group.append(await asyncio.wait_for(self._write_queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return group
+    
+    async def _commit_group(self, envelopes: List[Envelope]) -> bool:
+        """Commit a group, retrying with backoff; False if it was dropped."""
+        for attempt in range(self.write_behind_max_retries + 1):
+            try:
+                await self._commit(envelopes)
+                self._stats["write_behind_commits"] += 1
+                return True
+            except Exception as e:
+                # Strict mode raises from _commit; the publisher was already acknowledged.
+                self._stats["write_behind_errors"] += 1
+                self._stats["last_write_behind_error"] = str(e)
+                if attempt == self.write_behind_max_retries:
+                    break
+                self._stats["write_behind_retries"] += 1
+                delay = min(_WRITE_BEHIND_RETRY_MAX, _WRITE_BEHIND_RETRY_BASE * (2 ** attempt))
+                logger.warning(
+                    f"Write-behind commit of {len(envelopes)} message(s) failed: {e}; retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+        self._stats["write_behind_dropped"] += len(envelopes)
+        logger.error(
+            f"Dropping {len(envelopes)} acknowledged write-behind message(s) after "
+            f"{self.write_behind_max_retries} retries: {self._stats['last_write_behind_error']}"
+        )
+        try:
+            record_counter("redis_write_behind_dropped_total", len(envelopes))
+        except Exception:
+            logger.debug("Write-behind metric recording failed", exc_info=True)
+        return False
+    
+    async def _run_committer(self):
+        """Commit queued messages in pipelined groups until cancelled."""
+        while True:
+            group = await self._next_group()
+            started = time.perf_counter()
+            try:
+                await self._commit_group([envelope for _, envelope in group])
+            finally:
+                for _ in group:
+                    self._write_queue.task_done()
+                self._settled_seq = group[-1][0]
+                self._settled.set()
+            try:
+                record_histogram("redis_write_behind_flush_latency_ms", (time.perf_counter() - started) * 1000.0)
+                record_histogram("redis_write_behind_batch_size", len(group))
+                record_gauge("redis_write_behind_queue_depth", self._write_queue.qsize())
+            except Exception:
+                logger.debug("Write-behind metric recording failed", exc_info=True)
+    
+    async def flush(self, timeout: Optional[float] = None):
+        """Wait until every message queued before this call has been committed.
+        
+        Only messages already queued are waited for, so the wait is bounded
+        even while publishers keep queueing more.
+        
+        Raises:
+            asyncio.TimeoutError: If ``timeout`` elapses first
+        """
+        if self._committer is None or self._committer.done():
+            return
+        watermark = self._enqueued_seq
+        
+        async def settled():
+            while self._settled_seq < watermark:
+                self._settled.clear()
+                await self._settled.wait()
+        
+        await asyncio.wait_for(settled(), timeout=timeout)
+    
+    @staticmethod
+    def _stream_ms(moment: datetime) -> int:
+        """Milliseconds since the epoch, treating naive datetimes as UTC."""
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return int(moment.timestamp() * 1000)
+    
+    @staticmethod
+    def _text(value: Any) -> Any:
+        return value.decode() if isinstance(value, bytes) else value
     
     async def get_history(
         self,
@@ -301,79 +652,96 @@ class RedisStreamsStorage(StorageBackend):
             until: Only return messages before this time
             
         Returns:
-            List of history entries in chronological order
+            List of history entries, most recent first
+        """
+        entries, _ = await self.get_history_page(room, channel, limit, since, until)
+        return entries
+    
+    async def get_history_page(
+        self,
+        room: Optional[str] = None,
+        channel: Optional[str] = None,
+        limit: int = 100,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> Tuple[List[HistoryEntry], Optional[str]]:
+        """Retrieve one page of history with a single XREVRANGE (XRANGE when ascending).
+        
+        since/until become stream-ID bounds (millisecond prefixes, both
+        exclusive), so the read costs the same however long the stream is.
+        
+        Args:
+            room: Room ID to get history for
+            channel: Channel ID to get history for
+            limit: Maximum number of messages to retrieve
+            since: Only return messages stored after this time
+            until: Only return messages stored before this time
+            cursor: next_cursor of the previous page; continues with older
+                messages (newer ones when ascending)
+            ascending: Oldest first instead of most recent first
+            
+        Returns:
+            Tuple of (entries, next_cursor or None when exhausted)
         """
         # Use fallback storage if Redis unavailable
         if not self.redis_client:
             self._stats["fallback_operations"] += 1
-            return await self.fallback_storage.get_history(room, channel, limit, since, until)
+            return await self.fallback_storage.get_history_page(
+                room, channel, limit, since, until, cursor=cursor, ascending=ascending
+            )
+        
+        if cursor is not None and not _STREAM_ID_RE.match(cursor):
+            raise ValueError(f"Invalid history cursor: {cursor}")
+        stream_name = self._history_stream(room, channel)
+        count = max(0, min(limit, self.history_limit))
+        if count == 0:
+            return [], None
         
         try:
+            # Read-your-writes: history includes acknowledged write-behind messages.
+            try:
+                await self.flush(timeout=self.write_behind_read_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("History read did not wait for slow write-behind commits")
             self._stats["redis_operations"] += 1
             
-            # Determine which stream to query
-            if room and channel:
-                stream_name = f"{self.stream_prefix}:room_{room}_channel_{channel}"
-            elif room:
-                stream_name = f"{self.stream_prefix}:room_{room}"
-            elif channel:
-                stream_name = f"{self.stream_prefix}:channel_{channel}"
+            upper = "+"
+            if until is not None:
+                upper = str(self._stream_ms(until) - 1)
+            lower = str(self._stream_ms(since) + 1) if since is not None else "-"
+            # Cursors come from a previous page under the same bounds, so they are inside them.
+            if ascending:
+                if cursor:
+                    lower = f"({cursor}"
+                messages = await self.redis_client.xrange(
+                    stream_name,
+                    min=lower,
+                    max=upper,
+                    count=count,
+                )
             else:
-                stream_name = f"{self.stream_prefix}:messages"
-            
-            # Query Redis Streams with limit
-            messages = await self.redis_client.xrange(
-                stream_name,
-                count=min(limit, self.history_limit)
-            )
+                if cursor:
+                    upper = f"({cursor}"
+                messages = await self.redis_client.xrevrange(
+                    stream_name,
+                    max=upper,
+                    min=lower,
+                    count=count,
+                )
             
-            # Convert Redis Stream messages to HistoryEntry objects
             history_entries = []
             for msg_id, msg_data in messages:
+                msg_id = self._text(msg_id)
                 try:
-                    # Parse timestamp
-                    timestamp_str = msg_data.get("timestamp", "")
-                    if timestamp_str:
-                        try:
-                            timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                        except ValueError:
-                            timestamp = datetime.utcnow()
-                    else:
-                        timestamp = datetime.utcnow()
-                    
-                    # Skip if outside time range
-                    if since and timestamp <= since:
-                        continue
-                    if until and timestamp >= until:
-                        continue
-                    
-                    proto_b64 = msg_data.get("envelope_proto_b64")
-                    if proto_b64:
-                        envelope = envelope_from_proto_bytes(base64.b64decode(proto_b64))
-                    else:
-                        envelope = Envelope(
-                            id=msg_data.get("id", ""),
-                            type=msg_data.get("type", ""),
-                            timestamp=timestamp,
-                            sender=msg_data.get("sender") or None,
-                            room=msg_data.get("room") or None,
-                            channel=msg_data.get("channel") or None,
-                            payload=json.loads(msg_data.get("payload", "{}"))
-                        )
-                    
-                    history_entry = HistoryEntry(
-                        envelope=envelope,
-                        stored_at=timestamp,
-                        storage_metadata={"backend": "redis_streams", "stream": stream_name}
-                    )
-                    history_entries.append(history_entry)
-                    
+                    history_entries.append(self._history_entry(stream_name, msg_id, msg_data))
                 except Exception as e:
                     logger.warning(f"Failed to parse message {msg_id}: {e}")
-                    continue
             
+            next_cursor = self._text(messages[-1][0]) if len(messages) == count else None
             logger.debug(f"Retrieved {len(history_entries)} messages from {stream_name}")
-            return history_entries[:limit]
+            return history_entries, next_cursor
             
         except Exception as e:
             logger.error(f"Redis history retrieval error: {e}")
@@ -381,7 +749,52 @@ class RedisStreamsStorage(StorageBackend):
             
             # Fallback to memory storage
             self._stats["fallback_operations"] += 1
-            return await self.fallback_storage.get_history(room, channel, limit, since, until)
+            entries, _ = await self.fallback_storage.get_history_page(
+                room, channel, limit, since, until, ascending=ascending
+            )
+            return entries, None
+    
+    def _history_entry(self, stream_name: str, msg_id: str, msg_data: Dict[Any, Any]) -> HistoryEntry:
+        """Build a HistoryEntry from a stream entry; stored_at is the stream-ID time."""
+        fields = {self._text(key): value for key, value in msg_data.items()}
+        try:
+            stored_at = datetime.utcfromtimestamp(int(msg_id.split("-", 1)[0]) / 1000.0)
+        except ValueError:
+            stored_at = datetime.utcnow()
+        
+        envelope = self._decode_record(fields)
+        if envelope is None:
+            envelope = self._decode_legacy_record(
+                {key: self._text(value) for key, value in fields.items()},
+                stored_at,
+            )
+        
+        return HistoryEntry(
+            envelope=envelope,
+            stored_at=stored_at,
+            storage_metadata={"backend": "redis_streams", "stream": stream_name, "stream_id": msg_id}
+        )
+    
+    @staticmethod
+    def _decode_legacy_record(fields: Dict[str, str], stored_at: datetime) -> Envelope:
+        """Decode a legacy flat record, preferring its protobuf copy."""
+        proto_b64 = fields.get("envelope_proto_b64")
+        if proto_b64:
+            return envelope_from_proto_bytes(base64.b64decode(proto_b64))
+        timestamp_str = fields.get("timestamp", "")
+        try:
+            timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        except ValueError:
+            timestamp = stored_at
+        return Envelope(
+            id=fields.get("id", ""),
+            type=fields.get("type", ""),
+            timestamp=timestamp,
+            sender=fields.get("sender") or None,
+            room=fields.get("room") or None,
+            channel=fields.get("channel") or None,
+            payload=json.loads(fields.get("payload", "{}"))
+        )
     
     async def delete_message(self, message_id: str) -> StorageResult:
         """Delete a specific message by ID.
@@ -470,38 +883,84 @@ class RedisStreamsStorage(StorageBackend):
                 "stream_prefix": self.stream_prefix,
                 "history_limit": self.history_limit,
                 "key_ttl": self.key_ttl,
+                "retention_hours": self.retention_hours,
+                "write_behind": self.write_behind,
+                "write_behind_flush_ms": self.write_behind_flush_ms,
+                "write_behind_batch_size": self.write_behind_batch_size,
                 "max_size": self.max_size
             },
             "stats": self._stats.copy()
         }
+        if self.write_behind:
+            base_stats["stats"]["write_behind_queue_depth"] = self._write_queue.qsize()
         
         if self.redis_client:
             try:
-                # Get Redis-specific stats
-                info = await self.redis_client.info()
-                base_stats["redis_info"] = {
-                    "connected_clients": info.get("connected_clients", 0),
-                    "used_memory": info.get("used_memory", 0),
-                    "used_memory_human": info.get("used_memory_human", "0B"),
-                    "total_commands_processed": info.get("total_commands_processed", 0),
-                    "keyspace_hits": info.get("keyspace_hits", 0),
-                    "keyspace_misses": info.get("keyspace_misses", 0)
-                }
-                
-                # Count active streams
-                pattern = f"{self.stream_prefix}:*"
-                stream_keys = await self.redis_client.keys(pattern)
-                base_stats["stream_stats"] = {
-                    "total_streams": len(stream_keys),
-                    "stream_names": [key.decode() for key in stream_keys[:10]]  # First 10
-                }
-                
+                base_stats.update(await self._redis_stats())
             except Exception as e:
                 logger.warning(f"Failed to get Redis stats: {e}")
                 base_stats["redis_info_error"] = str(e)
         
         return base_stats
     
+    async def _redis_stats(self) -> Dict[str, Any]:
+        """Redis-side stats, cached for stats_cache_ttl seconds.
+        
+        Costs one INFO, one HGETALL of the counters hash and at most
+        stats_scan_max_calls SCAN calls, never a KEYS over the keyspace.
+        """
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cache[0] < self.stats_cache_ttl:
+            return self._stats_cache[1]
+        
+        redis_stats: Dict[str, Any] = {}
+        try:
+            info = await self.redis_client.info()
+            redis_stats["redis_info"] = {
+                "connected_clients": info.get("connected_clients", 0),
+                "used_memory": info.get("used_memory", 0),
+                "used_memory_human": info.get("used_memory_human", "0B"),
+                "total_commands_processed": info.get("total_commands_processed", 0),
+                "keyspace_hits": info.get("keyspace_hits", 0),
+                "keyspace_misses": info.get("keyspace_misses", 0)
+            }
+        except Exception as e:
+            # Some Redis-compatible servers restrict INFO; the remaining stats still apply.
+            logger.warning(f"Failed to get Redis info: {e}")
+            redis_stats["redis_info_error"] = str(e)
+        
+        counters = await self.redis_client.hgetall(self.stats_key) or {}
+        redis_stats["counters"] = {
+            self._text(key): int(self._text(value)) for key, value in counters.items()
+        }
+        
+        # Count active streams with a bounded SCAN
+        pattern = f"{self.stream_prefix}:*"
+        cursor: Any = 0
+        stream_names: List[str] = []
+        total_streams = 0
+        for _ in range(self.stats_scan_max_calls):
+            cursor, keys = await self.redis_client.scan(
+                cursor=cursor, match=pattern, count=self.stats_scan_count
+            )
+            for key in keys:
+                key = self._text(key)
+                if key == self.stats_key:
+                    continue
+                total_streams += 1
+                if len(stream_names) < 10:  # First 10
+                    stream_names.append(key)
+            if int(cursor) == 0:
+                break
+        redis_stats["stream_stats"] = {
+            "total_streams": total_streams,
+            "stream_names": stream_names,
+            "complete": int(cursor) == 0,
+        }
+        
+        self._stats_cache = (now, redis_stats)
+        return redis_stats
+    
     async def health_check(self) -> bool:
         """Check if storage backend is healthy.
         
@@ -521,6 +980,20 @@ class RedisStreamsStorage(StorageBackend):
     
     async def close(self):
         """Close Redis connection and cleanup resources."""
+        if self._committer is not None:
+            try:
+                await self.flush(timeout=5.0)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Closing with {self._write_queue.qsize()} uncommitted write-behind message(s)"
+                )
+            self._committer.cancel()
+            try:
+                await self._committer
+            except asyncio.CancelledError:
+                pass
+            self._committer = None
+        
         if self.redis_client:
             try:
                 await self.redis_client.close()
@@ -574,6 +1047,13 @@ class RedisStreamsStorage(StorageBackend):
                 if isinstance(msg_id, bytes):
                     msg_id = msg_id.decode()
                 
+                # Headered records decode exactly; no field guessing
+                fields = {self._text(k): v for k, v in data.items()}
+                envelope = self._decode_record(fields)
+                if envelope is not None:
+                    decoded_messages.append((msg_id, envelope.to_dict()))
+                    continue
+                
                 # Decode data dict
                 decoded_data = {}
                 for k, v in data.items():
@@ -0,0 +1,108 @@
+"""Per-connection acknowledgement modes for ArqonBus."""
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+
+ACK_LEGACY = "legacy"  # message_response echoing the payload, plus command_response
+ACK_NONE = "none"  # no acknowledgements
+ACK_ID = "id"  # message_response carrying only the message ID
+ACK_BATCH = "batch"  # cumulative message_response covering every message up to ack_seq
+ACK_MODES = (ACK_LEGACY, ACK_NONE, ACK_ID, ACK_BATCH)
+
+_ACK_MODE_ALIASES = {
+    "id_only": ACK_ID,
+    "id-only": ACK_ID,
+    "batched": ACK_BATCH,
+    "cumulative": ACK_BATCH,
+    "off": ACK_NONE,
+}
+
+
+def normalize_ack_mode(mode: str) -> str:
+    """Normalize an acknowledgement mode name."""
+    normalized = str(mode).strip().lower()
+    normalized = _ACK_MODE_ALIASES.get(normalized, normalized)
+    if normalized not in ACK_MODES:
+        raise ValueError(
+            f"Unsupported ack mode: {mode}. Expected one of: {', '.join(ACK_MODES)}."
+        )
+    return normalized
+
+
+@dataclass
+class AckState:
+    """Acknowledgement state of one connection.
+
+    ``seq`` counts every accepted message on the connection, whatever the
+    mode, so a cumulative ack for ``ack_seq=N`` covers the first N messages
+    the client sent.
+
+    Frames may finish out of order when a connection is pipelined, so each
+    message frame reserves a slot in arrival order and ``seq`` only advances
+    over the prefix of slots that have all finished. A cumulative ack never
+    covers a message that is still in flight behind one already done.
+    """
+    mode: str = ACK_LEGACY
+    batch_size: int = 64
+    flush_ms: float = 50.0
+    seq: int = 0
+    acked_seq: int = 0
+    last_id: Optional[str] = None
+    flush_handle: Optional[asyncio.TimerHandle] = field(default=None, repr=False)
+    # Next slot handed out, and the oldest slot not yet folded into ``seq``.
+    next_slot: int = 0
+    committed_slot: int = 0
+    # {slot: (accepted messages, last accepted ID)} for slots finished early
+    _finished: Dict[int, Tuple[int, Optional[str]]] = field(default_factory=dict, repr=False)
+
+    @property
+    def pending(self) -> int:
+        return self.seq - self.acked_seq
+
+    @property
+    def in_flight(self) -> int:
+        return self.next_slot - self.committed_slot - len(self._finished)
+
+    def reserve(self) -> int:
+        """Reserve the next slot, in the order frames arrive."""
+        slot = self.next_slot
+        self.next_slot += 1
+        return slot
+
+    def complete(self, slot: int, accepted: int = 0, last_id: Optional[str] = None) -> bool:
+        """Record how many messages a slot's frame accepted.
+
+        Completing a slot twice, or with nothing accepted, is allowed; the
+        first completion wins.
+
+        Returns:
+            True if ``seq`` advanced
+        """
+        if slot < self.committed_slot or slot in self._finished:
+            return False
+        self._finished[slot] = (accepted, last_id)
+        advanced = False
+        while self.committed_slot in self._finished:
+            count, slot_last_id = self._finished.pop(self.committed_slot)
+            self.committed_slot += 1
+            if count:
+                self.seq += count
+                self.last_id = slot_last_id
+                advanced = True
+        return advanced
+
+    def cancel_flush(self):
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "batch_size": self.batch_size,
+            "flush_ms": self.flush_ms,
+            "seq": self.seq,
+            "acked_seq": self.acked_seq,
+            "in_flight": self.in_flight,
+        }
@@ -0,0 +1,370 @@
+"""Multi-process worker mode for ArqonBus.
+
+A supervisor process starts N worker processes that each run a full
+WebSocket server bound to the same port (``SO_REUSEPORT``), so the kernel
+spreads connections across cores. Routing state (client registry, operator
+state) stays per worker; room:channel broadcasts are forwarded between
+workers over Unix-domain sockets, and only to workers that currently have
+local subscribers for that room:channel. Message history is not forwarded,
+so multi-worker mode requires a shared storage backend (Redis/Valkey or
+Postgres); config validation rejects it with memory storage.
+
+Peer wire format is a length-prefixed frame::
+
+    [4-byte big-endian length][1-byte op][body]
+
+- ``HELLO``: JSON ``{"worker_id": int, "interest": ["room:channel", ...]}``
+- ``SUB`` / ``UNSUB``: UTF-8 ``room:channel`` key
+- ``FANOUT``: UTF-8 ``room:channel`` key, ``\\n``, envelope JSON
+"""
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import signal
+import struct
+import tempfile
+import time
+from typing import Any, Dict, Optional, Set
+
+from ..protocol.envelope import Envelope
+from ..utils.metrics import record_counter
+
+
+logger = logging.getLogger(__name__)
+
+OP_HELLO = 1
+OP_SUB = 2
+OP_UNSUB = 3
+OP_FANOUT = 4
+
+_HEADER = struct.Struct("!IB")
+
+
+def encode_peer_frame(op: int, body: bytes) -> bytes:
+    """Encode a peer frame."""
+    return _HEADER.pack(len(body) + 1, op) + body
+
+
+async def read_peer_frame(reader: asyncio.StreamReader):
+    """Read one peer frame, returning ``(op, body)``."""
+    header = await reader.readexactly(_HEADER.size)
+    length, op = _HEADER.unpack(header)
+    body = await reader.readexactly(length - 1) if length > 1 else b""
+    return op, body
+
+
+def worker_socket_path(socket_dir: str, worker_id: int) -> str:
+    """Return the Unix socket path a worker listens on for peer traffic."""
+    return os.path.join(socket_dir, f"arqonbus-worker-{worker_id}.sock")
+
+
+class WorkerMesh:
+    """Cross-worker room:channel fan-out over Unix-domain sockets.
+
+    Each worker listens on its own socket and keeps one outbound connection
+    to every peer. A worker announces which room:channel keys it has local
+    members for; peers only forward broadcasts for announced keys.
+    """
+
+    def __init__(
+        self,
+        worker_id: int,
+        worker_count: int,
+        socket_dir: str,
+        max_peer_buffer: int = 8 * 1024 * 1024,
+        reconnect_delay: float = 0.5,
+    ):
+        """Initialize worker mesh.
+
+        Args:
+            worker_id: This worker's index (0-based)
+            worker_count: Total number of workers
+            socket_dir: Directory holding the per-worker Unix sockets
+            max_peer_buffer: Bytes buffered to a slow peer before frames are dropped
+            reconnect_delay: Seconds between peer connection attempts
+        """
+        self.worker_id = worker_id
+        self.worker_count = worker_count
+        self.socket_dir = socket_dir
+        self.max_peer_buffer = max_peer_buffer
+        self.reconnect_delay = reconnect_delay
+        self.client_registry = None
+
+        # {peer_id: StreamWriter} for outbound connections
+        self._peer_writers: Dict[int, asyncio.StreamWriter] = {}
+        # {peer_id: {"room:channel"}} announced by each peer
+        self._peer_interest: Dict[int, Set[str]] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._running = False
+        self.stats = {
+            "forwarded": 0,
+            "received": 0,
+            "dropped": 0,
+        }
+
+    @property
+    def peer_ids(self):
+        return [peer for peer in range(self.worker_count) if peer != self.worker_id]
+
+    def attach(self, client_registry):
+        """Install fan-out and membership hooks on a client registry."""
+        self.client_registry = client_registry
+        client_registry.peer_fanout = self.forward
+        client_registry.membership_listeners.append(self.on_membership_change)
+
+    async def start(self):
+        """Start listening for peers and connecting to them."""
+        if self._running:
+            return
+        os.makedirs(self.socket_dir, exist_ok=True)
+        path = worker_socket_path(self.socket_dir, self.worker_id)
+        if os.path.exists(path):
+            os.unlink(path)
+        self._server = await asyncio.start_unix_server(self._handle_peer, path=path)
+        self._running = True
+        for peer_id in self.peer_ids:
+            task = asyncio.create_task(self._maintain_peer(peer_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        logger.info(f"Worker {self.worker_id} mesh listening on {path}")
+
+    async def stop(self):
+        """Close peer connections and the peer listener."""
+        self._running = False
+        for task in list(self._tasks):
+            task.cancel()
+        for task in list(self._tasks):
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        for writer in self._peer_writers.values():
+            writer.close()
+        self._peer_writers.clear()
+        self._peer_interest.clear()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        path = worker_socket_path(self.socket_dir, self.worker_id)
+        if os.path.exists(path):
+            os.unlink(path)
+
+    def forward(self, message: Envelope, room: str, channel: str) -> int:
+        """Forward a broadcast to peers with subscribers for room:channel.
+
+        Never awaits: frames are written to the peer transport buffer and
+        dropped if a peer has fallen ``max_peer_buffer`` bytes behind.
+
+        Returns:
+            Number of peers the message was forwarded to
+        """
+        key = f"{room}:{channel}"
+        targets = [
+            peer_id
+            for peer_id, interest in self._peer_interest.items()
+            if key in interest and peer_id in self._peer_writers
+        ]
+        if not targets:
+            return 0
+
+        frame = encode_peer_frame(OP_FANOUT, key.encode() + b"\n" + message.frames.json.encode())
+        forwarded = 0
+        for peer_id in targets:
+            writer = self._peer_writers[peer_id]
+            if writer.transport.get_write_buffer_size() > self.max_peer_buffer:
+                self.stats["dropped"] += 1
+                self._record("cluster_forward_drops_total", 1, {"peer": str(peer_id)})
+                continue
+            writer.write(frame)
+            forwarded += 1
+        self.stats["forwarded"] += forwarded
+        if forwarded:
+            self._record("cluster_forwarded_total", forwarded)
+        return forwarded
+
+    def on_membership_change(self, key: str, present: bool):
+        """Announce a local room:channel gaining or losing all members."""
+        frame = encode_peer_frame(OP_SUB if present else OP_UNSUB, key.encode())
+        for writer in self._peer_writers.values():
+            writer.write(frame)
+
+    async def _maintain_peer(self, peer_id: int):
+        """Keep an outbound connection to a peer, reconnecting on loss."""
+        path = worker_socket_path(self.socket_dir, peer_id)
+        while self._running:
+            try:
+                reader, writer = await asyncio.open_unix_connection(path)
+            except (FileNotFoundError, ConnectionError, OSError):
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+
+            hello = {"worker_id": self.worker_id, "interest": self._local_interest()}
+            writer.write(encode_peer_frame(OP_HELLO, json.dumps(hello).encode()))
+            self._peer_writers[peer_id] = writer
+            logger.info(f"Worker {self.worker_id} connected to peer {peer_id}")
+            try:
+                # Peers never write back on this connection; EOF means it closed.
+                await reader.read()
+            except (ConnectionError, OSError):
+                pass
+            finally:
+                if self._peer_writers.get(peer_id) is writer:
+                    del self._peer_writers[peer_id]
+                writer.close()
+            logger.warning(f"Worker {self.worker_id} lost connection to peer {peer_id}")
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _handle_peer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Process frames sent by one peer."""
+        peer_id: Optional[int] = None
+        try:
+            while True:
+                op, body = await read_peer_frame(reader)
+                if op == OP_FANOUT:
+                    await self._deliver(body)
+                elif op == OP_HELLO:
+                    hello = json.loads(body)
+                    peer_id = int(hello["worker_id"])
+                    self._peer_interest[peer_id] = set(hello.get("interest") or [])
+                elif op == OP_SUB and peer_id is not None:
+                    self._peer_interest.setdefault(peer_id, set()).add(body.decode())
+                elif op == OP_UNSUB and peer_id is not None:
+                    self._peer_interest.get(peer_id, set()).discard(body.decode())
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id} peer stream failed: {e}")
+        finally:
+            if peer_id is not None:
+                self._peer_interest.pop(peer_id, None)
+            writer.close()
+
+    async def _deliver(self, body: bytes):
+        key, _, payload = body.partition(b"\n")
+        room, _, channel = key.decode().partition(":")
+        self.stats["received"] += 1
+        if self.client_registry is None:
+            return
+        message = Envelope.from_json(payload.decode())
+        await self.client_registry.broadcast_with_report(message, room, channel, local_only=True)
+
+    def _local_interest(self):
+        if self.client_registry is None:
+            return []
+        return self.client_registry.populated_room_channels()
+
+    def _record(self, name: str, value: int, labels: Optional[Dict[str, str]] = None):
+        try:
+            record_counter(name, value, labels)
+        except Exception:
+            logger.debug("Cluster metric recording failed", exc_info=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return mesh statistics."""
+        return {
+            "worker_id": self.worker_id,
+            "worker_count": self.worker_count,
+            "connected_peers": sorted(self._peer_writers),
+            "peer_interest": {peer: len(keys) for peer, keys in self._peer_interest.items()},
+            **self.stats,
+        }
+
+
+def _worker_main(worker_id: int, worker_count: int, socket_dir: str):
+    """Entry point of a worker process."""
+    from .websocket_bus import run_server
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        asyncio.run(run_server(worker_id=worker_id, worker_count=worker_count, socket_dir=socket_dir))
+    except KeyboardInterrupt:
+        pass
+
+
+class WorkerSupervisor:
+    """Start and supervise N worker processes sharing one listening port."""
+
+    def __init__(self, worker_count: int, socket_dir: str = "", restart_delay: float = 1.0):
+        """Initialize worker supervisor.
+
+        Args:
+            worker_count: Number of worker processes
+            socket_dir: Directory for peer sockets (a temp dir, removed on stop, when empty)
+            restart_delay: Seconds to wait before restarting a crashed worker
+        """
+        if worker_count < 1:
+            raise ValueError(f"Invalid worker count: {worker_count}")
+        self.worker_count = worker_count
+        self._owns_socket_dir = not socket_dir
+        self.socket_dir = socket_dir or tempfile.mkdtemp(prefix="arqonbus-workers-")
+        self.restart_delay = restart_delay
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: Dict[int, Any] = {}
+        self._stopping = False
+
+    def _spawn(self, worker_id: int):
+        process = self._context.Process(
+            target=_worker_main,
+            args=(worker_id, self.worker_count, self.socket_dir),
+            name=f"arqonbus-worker-{worker_id}",
+            daemon=False,
+        )
+        process.start()
+        self._workers[worker_id] = process
+        logger.info(f"Started worker {worker_id} (pid {process.pid})")
+
+    def start(self):
+        """Spawn all worker processes."""
+        for worker_id in range(self.worker_count):
+            self._spawn(worker_id)
+
+    def stop(self, timeout: float = 10.0):
+        """Terminate all workers and wait for them to exit."""
+        self._stopping = True
+        for process in self._workers.values():
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + timeout
+        for process in self._workers.values():
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.kill()
+                process.join()
+        if self._owns_socket_dir:
+            shutil.rmtree(self.socket_dir, ignore_errors=True)
+
+    async def run(self):
+        """Spawn workers and restart any that exit until cancelled or signalled."""
+        loop = asyncio.get_running_loop()
+        stop_event = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        self.start()
+        try:
+            while not stop_event.is_set():
+                for worker_id, process in list(self._workers.items()):
+                    if not process.is_alive() and not self._stopping:
+                        logger.error(
+                            f"Worker {worker_id} exited with code {process.exitcode}; restarting"
+                        )
+                        try:
+                            record_counter("worker_restarts_total", 1, {"worker": str(worker_id)})
+                        except Exception:
+                            logger.debug("Worker restart metric recording failed", exc_info=True)
+                        await asyncio.sleep(self.restart_delay)
+                        self._spawn(worker_id)
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await loop.run_in_executor(None, self.stop)
@@ -0,0 +1,331 @@
+"""Bounded in-memory state for the Continuum projector lane."""
+import asyncio
+import base64
+import json
+import logging
+import sys
+from collections import OrderedDict
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Sequence, Set, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+# One watermark entry: the (tenant_id, agent_id, episode_id) key plus a datetime.
+_WATERMARK_ENTRY_BYTES = 200
+
+
+class ContinuumDedup:
+    """Remember projected event IDs within a bounded window.
+
+    The most recent ``window_size`` event IDs are kept exactly, in LRU
+    order. Evicting an ID raises its episode's watermark to that event's
+    ``source_ts``. From then on, any event of that episode at or before the
+    watermark counts as already seen; late events of the agent's other
+    episodes are unaffected. Memory is bounded by the window plus one
+    timestamp per episode, which the projection map already holds one
+    entry for.
+    """
+
+    def __init__(self, window_size: int):
+        """Initialize the dedup window.
+
+        Args:
+            window_size: Number of recent event IDs remembered exactly
+        """
+        self.window_size = max(1, int(window_size))
+        # {(tenant_id, agent_id, episode_id, event_id): source_ts}, least recent first
+        self._recent: "OrderedDict[Tuple[str, str, str, str], datetime]" = OrderedDict()
+        # {(tenant_id, agent_id, episode_id): newest source_ts evicted from the window}
+        self._watermarks: Dict[Tuple[str, str, str], datetime] = {}
+        self._recent_bytes = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    @staticmethod
+    def _utc(source_ts: datetime) -> datetime:
+        # Naive timestamps are UTC; aware and naive values must never be compared.
+        if source_ts.tzinfo is None:
+            return source_ts.replace(tzinfo=timezone.utc)
+        return source_ts.astimezone(timezone.utc)
+
+    def seen(self, tenant_id: str, agent_id: str, episode_id: str, event_id: str, source_ts: datetime) -> bool:
+        """Return True if the event was projected before (or may have been)."""
+        key = (tenant_id, agent_id, episode_id, event_id)
+        if key in self._recent:
+            self._recent.move_to_end(key)
+            return True
+        watermark = self._watermarks.get((tenant_id, agent_id, episode_id))
+        return watermark is not None and self._utc(source_ts) <= watermark
+
+    def add(self, tenant_id: str, agent_id: str, episode_id: str, event_id: str, source_ts: datetime) -> None:
+        """Record a projected event, evicting the least recent IDs past the window."""
+        key = (tenant_id, agent_id, episode_id, event_id)
+        if key in self._recent:
+            self._recent.move_to_end(key)
+            return
+        self._recent[key] = self._utc(source_ts)
+        self._recent_bytes += self._entry_bytes(key)
+        while len(self._recent) > self.window_size:
+            evicted_key, evicted_ts = self._recent.popitem(last=False)
+            self._recent_bytes -= self._entry_bytes(evicted_key)
+            self.evicted += 1
+            episode = evicted_key[:3]
+            watermark = self._watermarks.get(episode)
+            if watermark is None or evicted_ts > watermark:
+                self._watermarks[episode] = evicted_ts
+
+    @staticmethod
+    def _entry_bytes(key: Tuple[str, str, str, str]) -> int:
+        # Key tuple, its strings and the datetime value; the dict slot is ignored.
+        return sys.getsizeof(key) + sum(sys.getsizeof(part) for part in key) + sys.getsizeof(datetime.min)
+
+    def approx_bytes(self) -> int:
+        return self._recent_bytes + len(self._watermarks) * _WATERMARK_ENTRY_BYTES
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "window_size": self.window_size,
+            "recent_ids": len(self._recent),
+            "watermark_episodes": len(self._watermarks),
+            "evicted": self.evicted,
+        }
+
+
+ProjectionKey = Tuple[str, str, str]
+
+
+def tag_token(tag: str) -> str:
+    return f"tag:{tag}"
+
+
+def attribute_token(key: str, value: Any) -> str:
+    # JSON keeps 1 and "1" apart, matching jsonb containment in Postgres.
+    return f"attr:{key}={json.dumps(value, sort_keys=True)}"
+
+
+class ContinuumTagIndex:
+    """Inverted index from tags and metadata attributes to projections.
+
+    Each projection is indexed under one token per tag and one per scalar
+    metadata value. Re-indexing a projection only touches the postings
+    whose tokens changed, so each projected event costs O(tags + attributes).
+    """
+
+    def __init__(self):
+        # {token: {projection_key}}
+        self._postings: Dict[str, Set[ProjectionKey]] = {}
+        # {projection_key: tokens it is indexed under}
+        self._tokens: Dict[ProjectionKey, FrozenSet[str]] = {}
+
+    @staticmethod
+    def tokens_for(tags: Iterable[str], metadata: Dict[str, Any]) -> FrozenSet[str]:
+        tokens = {tag_token(str(tag)) for tag in tags}
+        tokens.update(
+            attribute_token(str(key), value)
+            for key, value in metadata.items()
+            if value is None or isinstance(value, (str, int, float, bool))
+        )
+        return frozenset(tokens)
+
+    def update(self, key: ProjectionKey, tags: Iterable[str], metadata: Dict[str, Any]) -> None:
+        """Index a projection under its current tags and attributes."""
+        tokens = self.tokens_for(tags, metadata)
+        previous = self._tokens.get(key, frozenset())
+        for token in previous - tokens:
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[token]
+        for token in tokens - previous:
+            self._postings.setdefault(token, set()).add(key)
+        if tokens:
+            self._tokens[key] = tokens
+        else:
+            self._tokens.pop(key, None)
+
+    def match(self, all_of: Iterable[str] = (), any_of: Iterable[str] = ()) -> Set[ProjectionKey]:
+        """Projections indexed under every ``all_of`` token and at least one ``any_of`` token.
+
+        An empty ``all_of`` or ``any_of`` places no constraint; at least one
+        of them must be given.
+        """
+        required = sorted((self._postings.get(token, set()) for token in set(all_of)), key=len)
+        optional = [self._postings.get(token, set()) for token in set(any_of)]
+        if not required and not optional:
+            raise ValueError("At least one tag or attribute filter is required")
+        if required:
+            matched = set(required[0])
+            for posting in required[1:]:
+                if not matched:
+                    break
+                matched &= posting
+            if optional:
+                matched = {key for key in matched if any(key in posting for posting in optional)}
+            return matched
+        return set().union(*optional)
+
+    def approx_bytes(self) -> int:
+        return (
+            sys.getsizeof(self._postings)
+            + sum(sys.getsizeof(token) + sys.getsizeof(posting) for token, posting in self._postings.items())
+            + sys.getsizeof(self._tokens)
+            + sum(sys.getsizeof(tokens) for tokens in self._tokens.values())
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"tokens": len(self._postings), "indexed_projections": len(self._tokens)}
+
+
+class ContinuumChangeFeed:
+    """Push projection changes to subscribed clients, coalesced per agent.
+
+    The first change for an agent opens a ``window_ms`` window. Later
+    changes for that agent within the window replace the pending change for
+    the same episode. When the window closes, each matching subscriber gets
+    one delta holding the latest change per episode.
+    """
+
+    def __init__(self, window_ms: float, deliver: Callable[[str, Dict[str, Any]], Awaitable[Any]]):
+        """Initialize the change feed.
+
+        Args:
+            window_ms: Coalescing window per agent (0 = deliver on the next loop turn)
+            deliver: Called with (client_id, delta) for every subscriber a delta matches
+        """
+        self.window_ms = max(0.0, float(window_ms))
+        self._deliver = deliver
+        # {client_id: (tenant_id filter, agent_id filter)}
+        self._subscribers: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        # {(tenant_id, agent_id): {episode_id: latest change}}
+        self._pending: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
+        self._timers: Dict[Tuple[str, str], asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.stats = {
+            "published": 0,
+            "coalesced": 0,
+            "deltas": 0,
+            "delivered": 0,
+        }
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, client_id: str, tenant_id: Optional[str] = None, agent_id: Optional[str] = None) -> None:
+        self._subscribers[client_id] = (tenant_id, agent_id)
+
+    def unsubscribe(self, client_id: str) -> bool:
+        return self._subscribers.pop(client_id, None) is not None
+
+    def publish(self, change: Dict[str, Any]) -> None:
+        """Queue a projection change; must be called from the event loop thread."""
+        if not self._subscribers:
+            return
+        self.stats["published"] += 1
+        agent = (str(change.get("tenant_id")), str(change.get("agent_id")))
+        episodes = self._pending.get(agent)
+        if episodes is None:
+            episodes = self._pending[agent] = {}
+            self._timers[agent] = asyncio.get_running_loop().call_later(
+                self.window_ms / 1000.0, self._flush, agent
+            )
+        elif str(change.get("episode_id")) in episodes:
+            self.stats["coalesced"] += 1
+        episodes[str(change.get("episode_id"))] = change
+
+    def _flush(self, agent: Tuple[str, str]) -> None:
+        self._timers.pop(agent, None)
+        episodes = self._pending.pop(agent, None)
+        if not episodes:
+            return
+        tenant_id, agent_id = agent
+        delta = {"tenant_id": tenant_id, "agent_id": agent_id, "changes": list(episodes.values())}
+        self.stats["deltas"] += 1
+        for client_id, (tenant_filter, agent_filter) in list(self._subscribers.items()):
+            if tenant_filter and tenant_filter != tenant_id:
+                continue
+            if agent_filter and agent_filter != agent_id:
+                continue
+            task = asyncio.create_task(self._send(client_id, delta))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, client_id: str, delta: Dict[str, Any]) -> None:
+        try:
+            await self._deliver(client_id, delta)
+            self.stats["delivered"] += 1
+        except Exception:
+            logger.debug("Continuum delta delivery to %s failed", client_id, exc_info=True)
+
+    async def close(self) -> None:
+        """Drop pending changes and subscribers, and wait for in-flight deliveries."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._pending.clear()
+        self._subscribers.clear()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "window_ms": self.window_ms,
+            "subscribers": len(self._subscribers),
+            "pending_agents": len(self._pending),
+            **self.stats,
+        }
+
+
+def approx_size(value: Any) -> int:
+    """Approximate deep size in bytes of a JSON-like value."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(approx_size(k) + approx_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(approx_size(item) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += approx_size(vars(value))
+    return size
+
+
+def estimate_bytes(items: Iterable[Any], count: int, sample: int = 32) -> int:
+    """Estimate the total size of ``count`` items from the first ``sample`` of them."""
+    if count <= 0:
+        return 0
+    sampled = [approx_size(item) for item in islice(items, sample)]
+    if not sampled:
+        return 0
+    return int(sum(sampled) / len(sampled) * count)
+
+
+def encode_cursor(kind: str, values: Sequence[str]) -> str:
+    """Encode keyset values as an opaque, URL-safe page cursor."""
+    raw = json.dumps([kind, *values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(kind: str, cursor: str, size: int) -> Tuple[str, ...]:
+    """Decode a cursor made by ``encode_cursor`` for the same ``kind``.
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another listing
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as exc:
+        raise ValueError("Invalid 'cursor'") from exc
+    if (
+        not isinstance(values, list)
+        or len(values) != size + 1
+        or values[0] != kind
+        or not all(isinstance(value, str) for value in values[1:])
+    ):
+        raise ValueError("Invalid 'cursor'")
+    return tuple(values[1:])
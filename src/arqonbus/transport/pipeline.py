@@ -0,0 +1,132 @@
+"""Bounded, order-preserving per-connection processing for ArqonBus."""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Union
+
+from ..utils.metrics import record_histogram
+
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPipeline:
+    """Run a connection's frames concurrently, in order per ordering key.
+
+    Frames submitted with the same key (usually "room:channel") run one at
+    a time in submission order; frames with different keys, or with no key,
+    run in parallel. A frame with several keys (a batch spanning several
+    room:channels) waits for every one of those lanes and holds them all
+    until it finishes. At most ``max_in_flight`` frames are admitted at once;
+    ``submit`` waits for a free slot, which stops the reader from pulling
+    more frames off the socket.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        on_change: Optional[Callable[[int], None]] = None,
+    ):
+        """Initialize connection pipeline.
+
+        Args:
+            max_in_flight: Maximum number of frames admitted at once
+            on_change: Called with +1/-1 as frames are admitted and finish
+        """
+        self.max_in_flight = max(1, int(max_in_flight))
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._on_change = on_change
+        # {ordering_key: last task submitted for that key}
+        self._lanes: Dict[str, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.in_flight = 0
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "max_in_flight_seen": 0,
+        }
+
+    async def submit(
+        self,
+        key: Union[None, str, Iterable[str]],
+        work: Callable[[], Awaitable[Any]],
+    ) -> asyncio.Task:
+        """Admit a unit of work once a slot is free.
+
+        Args:
+            key: Ordering key, or several; None means no ordering constraint
+            work: Factory returning the awaitable to run
+
+        Returns:
+            The task running the work
+        """
+        keys = () if key is None else ((key,) if isinstance(key, str) else tuple(set(key)))
+        submitted_at = time.perf_counter()
+        await self._slots.acquire()
+        self.in_flight += 1
+        self.stats["submitted"] += 1
+        self.stats["max_in_flight_seen"] = max(self.stats["max_in_flight_seen"], self.in_flight)
+        self._notify(1)
+
+        previous = [self._lanes[lane] for lane in keys if lane in self._lanes]
+        task = asyncio.create_task(self._run(previous, work, submitted_at))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        for lane in keys:
+            self._lanes[lane] = task
+            task.add_done_callback(lambda done, lane=lane: self._release_lane(lane, done))
+        return task
+
+    async def _run(self, previous: List[asyncio.Task], work: Callable[[], Awaitable[Any]], submitted_at: float):
+        try:
+            pending = [task for task in previous if not task.done()]
+            if pending:
+                # Only ordering matters here; the previous frames' outcomes do not.
+                await asyncio.wait(pending)
+            try:
+                record_histogram("pipeline_queue_wait_ms", (time.perf_counter() - submitted_at) * 1000.0)
+            except Exception:
+                logger.debug("Pipeline metric recording failed", exc_info=True)
+            await work()
+            self.stats["completed"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.error(f"Pipelined frame failed: {e}")
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+            self._notify(-1)
+
+    def _release_lane(self, key: str, task: asyncio.Task):
+        if self._lanes.get(key) is task:
+            del self._lanes[key]
+
+    def _notify(self, delta: int):
+        if self._on_change is not None:
+            try:
+                self._on_change(delta)
+            except Exception:
+                logger.debug("Pipeline change callback failed", exc_info=True)
+
+    async def close(self, timeout: Optional[float] = None):
+        """Wait for admitted work to finish, cancelling whatever exceeds ``timeout``."""
+        pending = set(self._tasks)
+        if not pending:
+            return
+        _, still_running = await asyncio.wait(pending, timeout=timeout)
+        for task in still_running:
+            task.cancel()
+        if still_running:
+            await asyncio.wait(still_running)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return pipeline statistics."""
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "active_lanes": len(self._lanes),
+            **self.stats,
+        }
@@ -1,6 +1,10 @@
 """WebSocket server for ArqonBus real-time messaging."""
 import asyncio
+from collections import deque
 from copy import deepcopy
+import contextlib
+import heapq
+import inspect
 import json
 import logging
 import time
@@ -9,7 +13,7 @@ import urllib.request
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Optional, Set, Callable, Any
+from typing import AsyncIterator, Dict, FrozenSet, List, Optional, Callable, Any, Tuple, Union
 from urllib.parse import parse_qs, urlsplit
 from websockets import Response, serve
 from websockets.exceptions import ConnectionClosed
@@ -19,6 +23,20 @@ from ..protocol.envelope import Envelope
 from ..protocol.ids import generate_message_id
 from ..protocol.validator import EnvelopeValidator
 from ..routing.client_registry import ClientRegistry
+from ..routing.outbound import OutboundQueue
+from ..storage.interface import check_sequence
+from .pipeline import ConnectionPipeline
+from .acks import ACK_BATCH, ACK_ID, ACK_LEGACY, ACK_NONE, AckState, normalize_ack_mode
+from .continuum import (
+    ContinuumChangeFeed,
+    ContinuumDedup,
+    ContinuumTagIndex,
+    attribute_token,
+    decode_cursor,
+    encode_cursor,
+    estimate_bytes,
+    tag_token,
+)
 from ..config.config import get_config
 from ..casil.integration import CasilIntegration
 from ..casil.outcome import CASILDecision
@@ -29,6 +47,21 @@ from ..utils.metrics import record_counter, record_gauge, record_histogram
 
 logger = logging.getLogger(__name__)
 
+_CONTINUUM_BACKFILL_DEFAULT_CHUNK = 500
+_CONTINUUM_BACKFILL_MAX_CHUNK = 10000
+_CONTINUUM_BACKFILL_DEFAULT_PARALLELISM = 4
+_CONTINUUM_BACKFILL_MAX_PARALLELISM = 64
+# Events read from the event source per keyset page.
+_CONTINUUM_BACKFILL_PAGE_SIZE = 5000
+# Finished backfill jobs kept for op.continuum.projector.backfill.status.
+_CONTINUUM_BACKFILL_JOB_HISTORY = 32
+# Backoff between attempts to LISTEN again after the change-feed connection drops.
+_CONTINUUM_RELISTEN_BACKOFF = 0.5
+_CONTINUUM_RELISTEN_MAX_BACKOFF = 30.0
+# Entries per chunk frame of a streamed op.history.get / op.history.replay.
+_HISTORY_STREAM_DEFAULT_CHUNK = 500
+_HISTORY_STREAM_MAX_CHUNK = 5000
+
 
 @dataclass
 class _WebhookRule:
@@ -82,10 +115,59 @@ class _ContinuumProjection:
     deleted: bool = False
 
 
+@dataclass
+class _ContinuumBackfillJob:
+    job_id: str
+    owner_client_id: str
+    backend: str
+    from_ts: str
+    to_ts: str
+    tenant_id: Optional[str]
+    agent_id: Optional[str]
+    chunk_size: int
+    parallelism: int
+    created_at: str
+    status: str = "running"
+    selected_count: int = 0
+    agent_lanes: int = 0
+    processed: int = 0
+    projected: int = 0
+    duplicates: int = 0
+    stale_rejected: int = 0
+    dlq_queued: int = 0
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+
+
 class _FeatureDisabledError(RuntimeError):
     """Raised when a feature-flagged command path is disabled."""
 
 
+class _NotFoundError(LookupError):
+    """Raised when a command targets a resource that does not exist."""
+
+    def __init__(self, message: str, data: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.data = data or {}
+
+
+@dataclass(frozen=True)
+class _CommandSpec:
+    """Declarative operator command registration.
+
+    ``handler`` receives ``(client_id, args)`` and returns the response data.
+    Admin and feature-flag requirements are enforced before it runs.
+    Streaming handlers also receive the command ID, which their chunk
+    frames carry as ``request_id`` ahead of the final response.
+    """
+    name: str
+    handler: Callable[..., Any]
+    message: str
+    admin_action: Optional[str] = None
+    feature: Optional[str] = None
+    streaming: bool = False
+
+
 class WebSocketBus:
     """WebSocket server for ArqonBus message routing.
     
@@ -114,6 +196,8 @@ class WebSocketBus:
         self.running = False
         self._server_task = None
         self.casil = CasilIntegration(self.config.casil)
+        # Broadcast fan-out must pick the same default wire format as direct sends.
+        self.client_registry.default_wire_format = self._default_wire_format()
         
         # Connection handlers
         self.message_handlers: Dict[str, Callable] = {
@@ -136,10 +220,31 @@ class WebSocketBus:
         self._omega_events: list[Dict[str, Any]] = []
         self._omega_firecracker = FirecrackerOmegaRuntime(self.config.tier_omega)
         self._continuum_projection: Dict[tuple[str, str, str], _ContinuumProjection] = {}
-        self._continuum_seen_events: Set[tuple[str, str, str]] = set()
+        self._continuum_dedup = ContinuumDedup(self.config.continuum.dedup_window_size)
+        self._continuum_tag_index = ContinuumTagIndex()
+        self._continuum_feed = ContinuumChangeFeed(
+            self.config.continuum.change_feed_window_ms,
+            self._send_continuum_delta,
+        )
+        # Stops the backend LISTEN connection; None while deltas come from this process.
+        self._continuum_unlisten: Optional[Callable[[], Any]] = None
+        self._continuum_relisten_task: Optional[asyncio.Task] = None
         self._continuum_dlq: list[Dict[str, Any]] = []
-        self._continuum_event_log: list[Dict[str, Any]] = []
+        # Ring buffer of projected events, the source for in-memory backfill.
+        self._continuum_event_log: deque[Dict[str, Any]] = deque(maxlen=self.config.continuum.event_log_size)
+        self._continuum_backfill_jobs: Dict[str, _ContinuumBackfillJob] = {}
+        self._continuum_backfill_tasks: Dict[str, asyncio.Task] = {}
         self._ops_lock = asyncio.Lock()
+
+        # Per-connection processing pipelines (max_in_flight_per_connection > 1)
+        # {client_id: ConnectionPipeline}
+        self._pipelines: Dict[str, ConnectionPipeline] = {}
+
+        # Cross-worker fan-out mesh (multi-process worker mode only)
+        self.worker_mesh = None
+
+        # Operator command table {command: _CommandSpec}
+        self._command_table: Dict[str, _CommandSpec] = self._build_command_table()
         
         # Statistics
         self._stats = {
@@ -148,6 +253,7 @@ class WebSocketBus:
             "messages_processed": 0,
             "events_emitted": 0,
             "errors": 0,
+            "in_flight": 0,
             "started_at": None,
             "last_activity": None
         }
@@ -164,7 +270,7 @@ class WebSocketBus:
             return
         
         host = host or self.config.server.host
-        port = port or self.config.websocket.port
+        port = port or getattr(self.config.websocket, "port", None) or self.config.server.port
         
         logger.info(f"Starting ArqonBus WebSocket server on {host}:{port}")
         
@@ -227,6 +333,8 @@ class WebSocketBus:
 
         # Cleanup scheduled operator jobs.
         await self._cancel_all_cron_jobs()
+        await self._cancel_continuum_backfills()
+        await self._close_continuum_feed()
         await self._omega_firecracker.close()
         
         # Close server
@@ -236,7 +344,14 @@ class WebSocketBus:
         logger.info("ArqonBus WebSocket server stopped")
     
     async def _process_request(self, connection: Any, request: Any) -> Optional[Response]:
-        """Process incoming handshake request for edge authentication."""
+        """Process incoming handshake request for ack negotiation and edge authentication."""
+        requested_ack_mode = self._extract_ack_mode(request)
+        if requested_ack_mode is not None:
+            try:
+                setattr(connection, "_arqon_ack_mode", normalize_ack_mode(requested_ack_mode))
+            except ValueError as exc:
+                return self._bad_request_response(str(exc))
+
         if not self.config.security.enable_authentication:
             return None
 
@@ -268,6 +383,31 @@ class WebSocketBus:
         headers["WWW-Authenticate"] = 'Bearer realm="arqonbus"'
         return Response(401, "Unauthorized", headers, body)
 
+    @staticmethod
+    def _bad_request_response(details: str) -> Response:
+        body = (
+            '{"error":"Bad Request","details":"' + details.replace('"', "'") + '"}'
+        ).encode("utf-8")
+        headers = Headers()
+        headers["Content-Type"] = "application/json"
+        return Response(400, "Bad Request", headers, body)
+
+    @staticmethod
+    def _extract_ack_mode(request: Any) -> Optional[str]:
+        headers = getattr(request, "headers", None)
+        if headers is not None:
+            header_value = headers.get("X-Arqon-Ack-Mode")
+            if header_value:
+                return header_value.strip()
+
+        raw_path = getattr(request, "path", "")
+        if raw_path:
+            values = parse_qs(urlsplit(raw_path).query).get("ack")
+            if values and values[0]:
+                return values[0]
+
+        return None
+
     @staticmethod
     def _extract_auth_token(request: Any) -> Optional[str]:
         headers = getattr(request, "headers", None)
@@ -419,7 +559,110 @@ class WebSocketBus:
             )
         return serialized
 
-    async def _history_get(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    async def _wait_for_outbound_room(self, client_id: str) -> bool:
+        """Hold a streamed response until the client's outbound queue has drained.
+
+        Without an outbound queue the send itself awaits the socket, which
+        already paces the stream.
+        """
+        client_info = await self.client_registry.get_client(client_id)
+        if client_info is None:
+            return False
+        outbox = self.client_registry.outbox_for(getattr(client_info, "websocket", None))
+        if isinstance(outbox, OutboundQueue):
+            return await outbox.wait_for_room()
+        return True
+
+    async def _stream_history(
+        self,
+        client_id: str,
+        request_id: Optional[str],
+        kind: str,
+        fetch_page: Callable[[Optional[str], int], Any],
+        args: Dict[str, Any],
+        *,
+        strict_sequence: bool = False,
+    ) -> Dict[str, Any]:
+        """Send a history window as chunk frames and return the summary.
+
+        Each chunk is one storage page, sent as a ``pending`` response for
+        ``request_id`` once the client's outbound queue has room, so only one
+        page is held in memory at a time. ``max_chunks`` pauses the stream;
+        the summary's ``next_cursor`` resumes it.
+        """
+        chunk_size = self._normalize_limit(
+            args.get("chunk_size"),
+            "chunk_size",
+            default=_HISTORY_STREAM_DEFAULT_CHUNK,
+            max_value=_HISTORY_STREAM_MAX_CHUNK,
+        )
+        max_chunks = (
+            self._normalize_limit(args["max_chunks"], "max_chunks", default=1, max_value=1_000_000)
+            if args.get("max_chunks") is not None
+            else None
+        )
+        page_cursor: Optional[str] = None
+        last_sequence: Optional[int] = None
+        if args.get("cursor"):
+            page_cursor_raw, sequence_raw = decode_cursor(kind, str(args["cursor"]), 2)
+            page_cursor = page_cursor_raw or None
+            last_sequence = int(sequence_raw) if sequence_raw else None
+
+        chunks = 0
+        count = 0
+        complete = False
+        next_cursor: Optional[str] = None
+        while max_chunks is None or chunks < max_chunks:
+            entries, page_cursor = await fetch_page(page_cursor, chunk_size)
+            if strict_sequence:
+                last_sequence = check_sequence(entries, last_sequence)
+            next_cursor = (
+                encode_cursor(kind, [page_cursor, "" if last_sequence is None else str(last_sequence)])
+                if page_cursor
+                else None
+            )
+            if entries:
+                if not await self._wait_for_outbound_room(client_id):
+                    break
+                chunks += 1
+                frame = Envelope(
+                    type="response",
+                    request_id=request_id,
+                    status="pending",
+                    payload={
+                        "message": "History chunk",
+                        "data": {
+                            "chunk": chunks,
+                            "count": len(entries),
+                            "entries": self._serialize_history_entries(entries),
+                            "cursor": next_cursor,
+                        },
+                    },
+                    sender="arqonbus",
+                )
+                if not await self.send_to_client(client_id, frame):
+                    break
+                count += len(entries)
+                self._safe_record_counter("history_stream_chunks_total", 1, {"kind": kind})
+            if page_cursor is None:
+                complete = True
+                break
+
+        return {
+            "stream": True,
+            "chunks": chunks,
+            "count": count,
+            "chunk_size": chunk_size,
+            "complete": complete,
+            "next_cursor": None if complete else next_cursor,
+        }
+
+    async def _history_get(
+        self,
+        client_id: str,
+        args: Dict[str, Any],
+        request_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
         if not self.storage:
             raise RuntimeError("History commands require configured storage backend")
 
@@ -429,7 +672,12 @@ class WebSocketBus:
         channel = str(channel_raw).strip() if channel_raw is not None else None
         room = room or None
         channel = channel or None
-        limit = self._normalize_limit(args.get("limit"), "limit", default=100, max_value=1000)
+        stream = self._coerce_bool(args.get("stream", False), "stream")
+        limit = (
+            None
+            if stream
+            else self._normalize_limit(args.get("limit"), "limit", default=100, max_value=1000)
+        )
         since = self._parse_iso8601(args["since"], "since") if args.get("since") else None
         until = self._parse_iso8601(args["until"], "until") if args.get("until") else None
 
@@ -440,6 +688,28 @@ class WebSocketBus:
         if not is_admin and not room:
             raise PermissionError("Only admin clients can query global history; provide 'room'")
 
+        if stream:
+            async def fetch_page(cursor: Optional[str], page_size: int):
+                return await self.storage.backend.get_history_page(
+                    room=room,
+                    channel=channel,
+                    limit=page_size,
+                    since=since,
+                    until=until,
+                    cursor=cursor,
+                )
+
+            summary = await self._stream_history(client_id, request_id, "history_get", fetch_page, args)
+            self._safe_record_counter("history_get_requests_total", 1, {"role": "admin" if is_admin else "user"})
+            self._safe_record_histogram("history_get_entries_returned", float(summary["count"]), {"role": "admin" if is_admin else "user"})
+            return {
+                **summary,
+                "room": room,
+                "channel": channel,
+                "since": since.isoformat() if since else None,
+                "until": until.isoformat() if until else None,
+            }
+
         entries = await self.storage.backend.get_history(
             room=room,
             channel=channel,
@@ -460,7 +730,12 @@ class WebSocketBus:
             "limit": limit,
         }
 
-    async def _history_replay(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    async def _history_replay(
+        self,
+        client_id: str,
+        args: Dict[str, Any],
+        request_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
         if not self.storage:
             raise RuntimeError("History commands require configured storage backend")
 
@@ -477,13 +752,51 @@ class WebSocketBus:
         from_ts = self._parse_iso8601(from_ts_raw, "from_ts")
         to_ts = self._parse_iso8601(to_ts_raw, "to_ts")
         strict_sequence = self._coerce_bool(args.get("strict_sequence", True), "strict_sequence")
-        limit = self._normalize_limit(args.get("limit"), "limit", default=1000, max_value=5000)
+        stream = self._coerce_bool(args.get("stream", False), "stream")
+        limit = (
+            None
+            if stream
+            else self._normalize_limit(args.get("limit"), "limit", default=1000, max_value=5000)
+        )
 
         is_admin = await self._client_is_admin(client_id)
         if not is_admin and not room:
             raise PermissionError("Only admin clients can replay global history; provide 'room'")
 
         started = time.perf_counter()
+        if stream:
+            async def fetch_page(cursor: Optional[str], page_size: int):
+                return await self.storage.get_history_replay_page(
+                    room=room,
+                    channel=channel,
+                    from_ts=from_ts,
+                    to_ts=to_ts,
+                    limit=page_size,
+                    cursor=cursor,
+                )
+
+            summary = await self._stream_history(
+                client_id,
+                request_id,
+                "history_replay",
+                fetch_page,
+                args,
+                strict_sequence=strict_sequence,
+            )
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            self._safe_record_counter("history_replay_requests_total", 1, {"role": "admin" if is_admin else "user"})
+            self._safe_record_histogram("history_replay_entries_returned", float(summary["count"]), {"role": "admin" if is_admin else "user"})
+            self._safe_record_histogram("history_replay_latency_ms", elapsed_ms, {"role": "admin" if is_admin else "user"})
+            return {
+                **summary,
+                "room": room,
+                "channel": channel,
+                "from_ts": from_ts.isoformat(),
+                "to_ts": to_ts.isoformat(),
+                "strict_sequence": strict_sequence,
+                "latency_ms": elapsed_ms,
+            }
+
         entries = await self.storage.get_history_replay(
             room=room,
             channel=channel,
@@ -891,9 +1204,6 @@ class WebSocketBus:
         }
 
     async def _reload_casil_policy(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
-        if not await self._client_is_admin(client_id):
-            raise PermissionError("Only admin clients can reload CASIL policy")
-
         candidate = deepcopy(self.config.casil)
 
         if "enabled" in args:
@@ -1070,6 +1380,8 @@ class WebSocketBus:
                 "continuum_projector_events_total",
                 labels={"status": status, "event_type": event_type, "backend": "postgres"},
             )
+            if status == "projected" and self._continuum_unlisten is None:
+                self._continuum_feed.publish(self._continuum_change(event))
             return result
 
         tenant_id = str(event["tenant_id"])
@@ -1079,13 +1391,12 @@ class WebSocketBus:
         source_ts = str(event["source_ts"])
         event_type = str(event["event_type"])
         payload = event["payload"]
-        dedup_key = (tenant_id, agent_id, event_id)
         projection_key = (tenant_id, agent_id, episode_id)
 
         incoming_ts = self._parse_iso8601(source_ts, "source_ts")
 
         async with self._ops_lock:
-            if dedup_key in self._continuum_seen_events:
+            if self._continuum_dedup.seen(tenant_id, agent_id, episode_id, event_id, incoming_ts):
                 result = {
                     "status": "duplicate",
                     "event_id": event_id,
@@ -1129,7 +1440,8 @@ class WebSocketBus:
                 deleted=event_type == "episode.deleted",
             )
             self._continuum_projection[projection_key] = projection
-            self._continuum_seen_events.add(dedup_key)
+            self._continuum_tag_index.update(projection_key, projection.tags, projection.metadata)
+            self._continuum_dedup.add(tenant_id, agent_id, episode_id, event_id, incoming_ts)
             self._continuum_event_log.append(
                 {"event": deepcopy(event), "projected_at": self._utc_now_iso()}
             )
@@ -1144,31 +1456,130 @@ class WebSocketBus:
             "continuum_projector_events_total",
             labels={"status": "projected", "event_type": event_type, "backend": "memory"},
         )
+        self._continuum_feed.publish(self._continuum_change(event, updated_at=projection.updated_at))
         return result
 
+    def _continuum_change(self, event: Dict[str, Any], updated_at: Optional[str] = None) -> Dict[str, Any]:
+        """Change-feed record for a projected event; same fields as the Postgres NOTIFY payload."""
+        event_type = str(event["event_type"])
+        return {
+            "tenant_id": str(event["tenant_id"]),
+            "agent_id": str(event["agent_id"]),
+            "episode_id": str(event["episode_id"]),
+            "event_type": event_type,
+            "last_event_id": str(event["event_id"]),
+            "last_event_ts": str(event["source_ts"]),
+            "updated_at": updated_at or self._utc_now_iso(),
+            "deleted": event_type == "episode.deleted",
+        }
+
+    async def _send_continuum_delta(self, client_id: str, delta: Dict[str, Any]) -> None:
+        envelope = Envelope(
+            id=generate_message_id(),
+            type="telemetry",
+            payload={"continuum_delta": delta},
+            sender="op-continuum",
+        )
+        await self.send_to_client(client_id, envelope)
+
+    async def _continuum_projector_subscribe(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        tenant_filter = str(args.get("tenant_id", "")).strip() or None
+        agent_filter = str(args.get("agent_id", "")).strip() or None
+        try:
+            await self._continuum_start_listen()
+        except Exception as exc:
+            logger.warning("Continuum LISTEN unavailable, using in-process change feed: %s", exc)
+        self._continuum_feed.subscribe(client_id, tenant_filter, agent_filter)
+        return {
+            "subscribed": True,
+            "tenant_id": tenant_filter,
+            "agent_id": agent_filter,
+            "window_ms": self._continuum_feed.window_ms,
+            "source": "postgres_notify" if self._continuum_unlisten is not None else "in_process",
+        }
+
+    async def _continuum_start_listen(self) -> None:
+        """LISTEN for Postgres projection changes unless already listening."""
+        backend = self._continuum_backend()
+        if backend is None or not hasattr(backend, "continuum_listen"):
+            return
+        async with self._ops_lock:
+            if self._continuum_unlisten is None:
+                self._continuum_unlisten = await backend.continuum_listen(
+                    self._continuum_feed.publish,
+                    on_lost=self._on_continuum_listen_lost,
+                )
+
+    def _on_continuum_listen_lost(self) -> None:
+        # Projected events are published in-process again until LISTEN is back.
+        self._continuum_unlisten = None
+        if self._continuum_relisten_task is None or self._continuum_relisten_task.done():
+            self._continuum_relisten_task = asyncio.create_task(self._continuum_relisten())
+
+    async def _continuum_relisten(self) -> None:
+        delay = _CONTINUUM_RELISTEN_BACKOFF
+        while self._continuum_unlisten is None and self._continuum_feed.subscriber_count:
+            await asyncio.sleep(delay)
+            try:
+                await self._continuum_start_listen()
+                logger.info("Continuum change feed LISTEN restored")
+            except Exception as exc:
+                delay = min(_CONTINUUM_RELISTEN_MAX_BACKOFF, delay * 2)
+                logger.warning("Continuum LISTEN retry failed, next attempt in %.1fs: %s", delay, exc)
+
+    async def _continuum_projector_unsubscribe(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        return {"unsubscribed": self._continuum_feed.unsubscribe(client_id)}
+
+    async def _close_continuum_feed(self) -> None:
+        relisten, self._continuum_relisten_task = self._continuum_relisten_task, None
+        if relisten is not None:
+            relisten.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await relisten
+        unlisten, self._continuum_unlisten = self._continuum_unlisten, None
+        if unlisten is not None:
+            try:
+                await unlisten()
+            except Exception as exc:
+                logger.warning("Continuum LISTEN cleanup failed during shutdown: %s", exc)
+        await self._continuum_feed.close()
+
     async def _continuum_projector_status(self) -> Dict[str, Any]:
         backend = self._continuum_backend()
         if backend is not None:
             status = await backend.continuum_projector_status()
+            status["change_feed"] = self._continuum_feed.snapshot()
             self._safe_record_gauge("continuum_projector_projection_count", float(status.get("projection_count", 0)))
             self._safe_record_gauge("continuum_projector_seen_event_count", float(status.get("seen_event_count", 0)))
             self._safe_record_gauge("continuum_projector_dlq_depth", float(status.get("dlq_count", 0)))
             return status
         async with self._ops_lock:
+            memory_bytes = {
+                "dedup": self._continuum_dedup.approx_bytes(),
+                "event_log": estimate_bytes(self._continuum_event_log, len(self._continuum_event_log)),
+                "projection": estimate_bytes(self._continuum_projection.values(), len(self._continuum_projection)),
+                "tag_index": self._continuum_tag_index.approx_bytes(),
+            }
             status = {
                 "projection_count": len(self._continuum_projection),
-                "seen_event_count": len(self._continuum_seen_events),
+                "seen_event_count": len(self._continuum_dedup),
                 "dlq_count": len(self._continuum_dlq),
                 "event_log_count": len(self._continuum_event_log),
+                "event_log_capacity": self._continuum_event_log.maxlen,
+                "dedup": self._continuum_dedup.snapshot(),
+                "tag_index": self._continuum_tag_index.snapshot(),
+                "change_feed": self._continuum_feed.snapshot(),
+                "memory_bytes": {**memory_bytes, "total": sum(memory_bytes.values())},
             }
         self._safe_record_gauge("continuum_projector_projection_count", float(status["projection_count"]))
         self._safe_record_gauge("continuum_projector_seen_event_count", float(status["seen_event_count"]))
         self._safe_record_gauge("continuum_projector_dlq_depth", float(status["dlq_count"]))
         self._safe_record_gauge("continuum_projector_event_log_count", float(status["event_log_count"]))
+        for component, value in memory_bytes.items():
+            self._safe_record_gauge("continuum_projector_memory_bytes", float(value), {"component": component})
         return status
 
     async def _continuum_project_event_command(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
-        await self._require_admin(client_id, "project Continuum events")
         event = args.get("event")
         if not isinstance(event, dict):
             raise ValueError("'event' is required and must be an object")
@@ -1187,7 +1598,6 @@ class WebSocketBus:
             }
 
     async def _continuum_projector_get(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
-        await self._require_admin(client_id, "read Continuum projector state")
         tenant_id = str(args.get("tenant_id", "")).strip()
         agent_id = str(args.get("agent_id", "")).strip()
         episode_id = str(args.get("episode_id", "")).strip()
@@ -1207,48 +1617,90 @@ class WebSocketBus:
         return {"found": True, "projection": projection.__dict__}
 
     async def _continuum_projector_list(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
-        await self._require_admin(client_id, "list Continuum projector state")
         tenant_filter = str(args.get("tenant_id", "")).strip() or None
         agent_filter = str(args.get("agent_id", "")).strip() or None
         limit = int(args.get("limit", 100))
         if limit < 1:
             raise ValueError("'limit' must be >= 1")
+        # Tag filters: every tag in tags_all (AND) and at least one in
+        # tags_any (OR); attributes must all equal the projection's metadata.
+        tags_all = self._coerce_str_list(args["tags_all"], "tags_all") if args.get("tags_all") else []
+        tags_any = self._coerce_str_list(args["tags_any"], "tags_any") if args.get("tags_any") else []
+        attributes = args.get("attributes") or {}
+        if not isinstance(attributes, dict) or any(
+            value is not None and not isinstance(value, (str, int, float, bool)) for value in attributes.values()
+        ):
+            raise ValueError("'attributes' must be an object of scalar values")
+        cursor = str(args.get("cursor") or "").strip()
+        # Keyset: (updated_at, tenant_id, agent_id, episode_id), newest first.
+        after = decode_cursor("projection", cursor, 4) if cursor else None
         backend = self._continuum_backend()
         if backend is not None:
             items = await backend.continuum_projector_list(
                 limit=limit,
                 tenant_id=tenant_filter,
                 agent_id=agent_filter,
+                after=after,
+                tags_all=tags_all,
+                tags_any=tags_any,
+                attributes=attributes,
             )
-            return {"count": len(items), "items": items, "limit": limit}
-        async with self._ops_lock:
-            rows = list(self._continuum_projection.values())
-        filtered = []
-        for row in rows:
-            if tenant_filter and row.tenant_id != tenant_filter:
-                continue
-            if agent_filter and row.agent_id != agent_filter:
-                continue
-            filtered.append(row.__dict__)
-        filtered.sort(key=lambda row: row["updated_at"], reverse=True)
-        filtered = filtered[:limit]
-        return {"count": len(filtered), "items": filtered, "limit": limit}
+        else:
+            def sort_key(row: _ContinuumProjection) -> tuple[str, str, str, str]:
+                return (row.updated_at, row.tenant_id, row.agent_id, row.episode_id)
+
+            async with self._ops_lock:
+                if tags_all or tags_any or attributes:
+                    matched = self._continuum_tag_index.match(
+                        all_of=[tag_token(tag) for tag in tags_all]
+                        + [attribute_token(str(key), value) for key, value in attributes.items()],
+                        any_of=[tag_token(tag) for tag in tags_any],
+                    )
+                    rows = [self._continuum_projection[key] for key in matched]
+                else:
+                    rows = self._continuum_projection.values()
+                candidates = (
+                    row
+                    for row in rows
+                    if (not tenant_filter or row.tenant_id == tenant_filter)
+                    and (not agent_filter or row.agent_id == agent_filter)
+                    and (after is None or sort_key(row) < after)
+                )
+                items = [row.__dict__ for row in heapq.nlargest(limit, candidates, key=sort_key)]
+        next_cursor = None
+        if len(items) >= limit:
+            last = items[-1]
+            next_cursor = encode_cursor(
+                "projection",
+                [str(last["updated_at"]), str(last["tenant_id"]), str(last["agent_id"]), str(last["episode_id"])],
+            )
+        return {"count": len(items), "items": items, "limit": limit, "next_cursor": next_cursor}
 
     async def _continuum_projector_dlq_list(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
-        await self._require_admin(client_id, "list Continuum DLQ")
         limit = int(args.get("limit", 100))
         if limit < 1:
             raise ValueError("'limit' must be >= 1")
+        cursor = str(args.get("cursor") or "").strip()
+        # Keyset: (queued_at, dlq_id), newest first.
+        after = decode_cursor("dlq", cursor, 2) if cursor else None
         backend = self._continuum_backend()
         if backend is not None:
-            items = await backend.continuum_projector_dlq_list(limit=limit)
-            return {"count": len(items), "items": items, "limit": limit}
-        async with self._ops_lock:
-            items = list(self._continuum_dlq)[-limit:]
-        return {"count": len(items), "items": items, "limit": limit}
+            items = await backend.continuum_projector_dlq_list(limit=limit, after=after)
+        else:
+            def sort_key(record: Dict[str, Any]) -> tuple[str, str]:
+                return (record["queued_at"], record["dlq_id"])
+
+            async with self._ops_lock:
+                candidates = (
+                    record for record in self._continuum_dlq if after is None or sort_key(record) < after
+                )
+                items = heapq.nlargest(limit, candidates, key=sort_key)
+        next_cursor = None
+        if len(items) >= limit:
+            next_cursor = encode_cursor("dlq", [str(items[-1]["queued_at"]), str(items[-1]["dlq_id"])])
+        return {"count": len(items), "items": items, "limit": limit, "next_cursor": next_cursor}
 
     async def _continuum_projector_dlq_replay(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
-        await self._require_admin(client_id, "replay Continuum DLQ items")
         dlq_id = str(args.get("dlq_id", "")).strip()
         if not dlq_id:
             raise ValueError("'dlq_id' is required")
@@ -1308,8 +1760,6 @@ class WebSocketBus:
         return {"replayed": False, "dlq_id": dlq_id, "result": result}
 
     async def _continuum_projector_backfill(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
-        await self._require_admin(client_id, "run Continuum projector backfill")
-        started_at = time.perf_counter()
         from_ts_raw = args.get("from_ts")
         to_ts_raw = args.get("to_ts")
         if from_ts_raw is None or to_ts_raw is None:
@@ -1321,155 +1771,274 @@ class WebSocketBus:
         tenant_filter = str(args.get("tenant_id", "")).strip() or None
         agent_filter = str(args.get("agent_id", "")).strip() or None
         dry_run = bool(args.get("dry_run", False))
+        background = self._coerce_bool(args.get("background", True), "background")
+        chunk_size = self._normalize_limit(
+            args.get("chunk_size"),
+            "chunk_size",
+            default=_CONTINUUM_BACKFILL_DEFAULT_CHUNK,
+            max_value=_CONTINUUM_BACKFILL_MAX_CHUNK,
+        )
+        parallelism = self._normalize_limit(
+            args.get("parallelism"),
+            "parallelism",
+            default=_CONTINUUM_BACKFILL_DEFAULT_PARALLELISM,
+            max_value=_CONTINUUM_BACKFILL_MAX_PARALLELISM,
+        )
         backend = self._continuum_backend()
+        backend_label = "postgres" if backend is not None else "memory"
 
-        if backend is not None:
-            selected_events = await backend.continuum_projector_events_between(
-                from_ts=from_ts,
-                to_ts=to_ts,
-                tenant_id=tenant_filter,
-                agent_id=agent_filter,
+        if dry_run:
+            selected_count = 0
+            async for page in self._continuum_backfill_pages(backend, from_ts, to_ts, tenant_filter, agent_filter):
+                selected_count += len(page)
+            self._safe_record_counter(
+                "continuum_projector_backfill_total",
+                labels={"dry_run": "true", "backend": backend_label},
             )
-            if dry_run:
-                self._safe_record_counter(
-                    "continuum_projector_backfill_total",
-                    labels={"dry_run": "true", "backend": "postgres"},
-                )
-                return {
-                    "dry_run": True,
-                    "selected_count": len(selected_events),
-                    "from_ts": from_ts_raw,
-                    "to_ts": to_ts_raw,
-                    "tenant_id": tenant_filter,
-                    "agent_id": agent_filter,
-                }
-            projected = 0
-            duplicates = 0
-            stale_rejected = 0
-            dlq_queued = 0
-            for event in selected_events:
-                try:
-                    result = await backend.continuum_project_event(event)
-                    status = result.get("status")
-                    if status == "projected":
-                        projected += 1
-                    elif status == "duplicate":
-                        duplicates += 1
-                    elif status == "stale_rejected":
-                        stale_rejected += 1
-                except Exception as exc:
-                    await backend.continuum_projector_dlq_push(f"backfill_failed:{exc}", event)
-                    dlq_queued += 1
-            result = {
-                "dry_run": False,
-                "selected_count": len(selected_events),
-                "projected": projected,
-                "duplicates": duplicates,
-                "stale_rejected": stale_rejected,
-                "dlq_queued": dlq_queued,
+            return {
+                "dry_run": True,
+                "selected_count": selected_count,
                 "from_ts": from_ts_raw,
                 "to_ts": to_ts_raw,
                 "tenant_id": tenant_filter,
                 "agent_id": agent_filter,
             }
+
+        job = _ContinuumBackfillJob(
+            job_id=f"backfill_{uuid.uuid4().hex[:12]}",
+            owner_client_id=client_id,
+            backend=backend_label,
+            from_ts=str(from_ts_raw),
+            to_ts=str(to_ts_raw),
+            tenant_id=tenant_filter,
+            agent_id=agent_filter,
+            chunk_size=chunk_size,
+            parallelism=parallelism,
+            created_at=self._utc_now_iso(),
+        )
+        async with self._ops_lock:
+            self._continuum_backfill_jobs[job.job_id] = job
+            finished = [
+                job_id
+                for job_id, item in self._continuum_backfill_jobs.items()
+                if item.status != "running"
+            ]
+            for job_id in finished[: max(0, len(finished) - _CONTINUUM_BACKFILL_JOB_HISTORY)]:
+                self._continuum_backfill_jobs.pop(job_id, None)
+
+        pages = self._continuum_backfill_pages(backend, from_ts, to_ts, tenant_filter, agent_filter)
+        run = self._run_continuum_backfill(job, backend, pages)
+        if not background:
+            await run
+            return self._continuum_backfill_snapshot(job)
+
+        task = asyncio.create_task(run)
+        async with self._ops_lock:
+            self._continuum_backfill_tasks[job.job_id] = task
+        task.add_done_callback(lambda _, job_id=job.job_id: self._continuum_backfill_tasks.pop(job_id, None))
+        return self._continuum_backfill_snapshot(job)
+
+    async def _continuum_backfill_pages(
+        self,
+        backend: Optional[Any],
+        from_ts: datetime,
+        to_ts: datetime,
+        tenant_id: Optional[str],
+        agent_id: Optional[str],
+    ) -> AsyncIterator[list[Dict[str, Any]]]:
+        """Yield the events to backfill in source order, a page at a time."""
+        if backend is None:
+            async with self._ops_lock:
+                source_items = list(self._continuum_event_log)
+
+            selected_events = []
+            for item in source_items:
+                event = item.get("event", {})
+                if not isinstance(event, dict):
+                    continue
+                event_ts = self._parse_iso8601(event.get("source_ts"), "source_ts")
+                if event_ts < from_ts or event_ts > to_ts:
+                    continue
+                if tenant_id and str(event.get("tenant_id")) != tenant_id:
+                    continue
+                if agent_id and str(event.get("agent_id")) != agent_id:
+                    continue
+                selected_events.append(event)
+            for start in range(0, len(selected_events), _CONTINUUM_BACKFILL_PAGE_SIZE):
+                yield selected_events[start : start + _CONTINUUM_BACKFILL_PAGE_SIZE]
+            return
+
+        after = None
+        while True:
+            page = await backend.continuum_projector_events_between(
+                from_ts=from_ts,
+                to_ts=to_ts,
+                tenant_id=tenant_id,
+                agent_id=agent_id,
+                limit=_CONTINUUM_BACKFILL_PAGE_SIZE,
+                after=after,
+            )
+            if page:
+                yield page
+            if len(page) < _CONTINUUM_BACKFILL_PAGE_SIZE:
+                return
+            last = page[-1]
+            after = (
+                self._parse_iso8601(last.get("source_ts"), "source_ts"),
+                str(last.get("tenant_id")),
+                str(last.get("agent_id")),
+                str(last.get("event_id")),
+            )
+
+    async def _run_continuum_backfill(
+        self,
+        job: _ContinuumBackfillJob,
+        backend: Optional[Any],
+        pages: AsyncIterator[list[Dict[str, Any]]],
+    ) -> None:
+        started_at = time.perf_counter()
+        agents: set[tuple[str, str]] = set()
+
+        async def drain_lanes(pending: list[list[Dict[str, Any]]]) -> None:
+            while pending:
+                lane = pending.pop()
+                for start in range(0, len(lane), job.chunk_size):
+                    await self._backfill_continuum_chunk(job, backend, lane[start : start + job.chunk_size])
+                    # Yield between chunks so a large backfill never holds the loop.
+                    await asyncio.sleep(0)
+
+        try:
+            async for page in pages:
+                job.selected_count += len(page)
+                # One lane per agent keeps each agent's events in source order
+                # while different agents are projected in parallel. Pages run
+                # one after another, so the order also holds across pages.
+                lanes: Dict[tuple[str, str], list[Dict[str, Any]]] = {}
+                for event in page:
+                    lanes.setdefault((str(event.get("tenant_id")), str(event.get("agent_id"))), []).append(event)
+                agents.update(lanes)
+                job.agent_lanes = len(agents)
+                pending = list(reversed(list(lanes.values())))
+                await asyncio.gather(*(drain_lanes(pending) for _ in range(min(job.parallelism, len(pending)))))
+            job.status = "completed"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            raise
+        except Exception as exc:
+            job.status = "failed"
+            job.error = str(exc)
+            logger.error("Continuum backfill %s failed: %s", job.job_id, exc)
+        finally:
+            job.finished_at = self._utc_now_iso()
             self._safe_record_counter(
                 "continuum_projector_backfill_total",
-                labels={"dry_run": "false", "backend": "postgres"},
+                labels={"dry_run": "false", "backend": job.backend},
             )
-            self._safe_record_counter("continuum_projector_backfill_events_total", projected, {"outcome": "projected"})
-            self._safe_record_counter("continuum_projector_backfill_events_total", duplicates, {"outcome": "duplicate"})
+            self._safe_record_counter("continuum_projector_backfill_events_total", job.projected, {"outcome": "projected"})
+            self._safe_record_counter("continuum_projector_backfill_events_total", job.duplicates, {"outcome": "duplicate"})
             self._safe_record_counter(
                 "continuum_projector_backfill_events_total",
-                stale_rejected,
+                job.stale_rejected,
                 {"outcome": "stale_rejected"},
             )
-            self._safe_record_counter("continuum_projector_backfill_events_total", dlq_queued, {"outcome": "dlq_queued"})
+            self._safe_record_counter("continuum_projector_backfill_events_total", job.dlq_queued, {"outcome": "dlq_queued"})
             self._safe_record_histogram(
                 "continuum_projector_backfill_duration_seconds",
                 time.perf_counter() - started_at,
-                labels={"backend": "postgres"},
-            )
-            return result
-
-        async with self._ops_lock:
-            source_items = list(self._continuum_event_log)
-
-        selected_events: list[Dict[str, Any]] = []
-        for item in source_items:
-            event = item.get("event", {})
-            if not isinstance(event, dict):
-                continue
-            event_ts = self._parse_iso8601(event.get("source_ts"), "source_ts")
-            if event_ts < from_ts or event_ts > to_ts:
-                continue
-            if tenant_filter and str(event.get("tenant_id")) != tenant_filter:
-                continue
-            if agent_filter and str(event.get("agent_id")) != agent_filter:
-                continue
-            selected_events.append(event)
-
-        if dry_run:
-            self._safe_record_counter(
-                "continuum_projector_backfill_total",
-                labels={"dry_run": "true", "backend": "memory"},
+                labels={"backend": job.backend},
             )
-            return {
-                "dry_run": True,
-                "selected_count": len(selected_events),
-                "from_ts": from_ts_raw,
-                "to_ts": to_ts_raw,
-                "tenant_id": tenant_filter,
-                "agent_id": agent_filter,
-            }
 
-        projected = 0
-        duplicates = 0
-        stale_rejected = 0
-        dlq_queued = 0
-        for event in selected_events:
+    async def _backfill_continuum_chunk(
+        self,
+        job: _ContinuumBackfillJob,
+        backend: Optional[Any],
+        events: list[Dict[str, Any]],
+    ) -> None:
+        results: Optional[list[Dict[str, Any]]] = None
+        if backend is not None and hasattr(backend, "continuum_project_events"):
             try:
-                result = await self._project_continuum_event(event)
-                status = result.get("status")
-                if status == "projected":
-                    projected += 1
-                elif status == "duplicate":
-                    duplicates += 1
-                elif status == "stale_rejected":
-                    stale_rejected += 1
-            except Exception as exc:
-                await self._continuum_dlq_push(f"backfill_failed:{exc}", event)
-                dlq_queued += 1
+                results = await backend.continuum_project_events(events)
+            except Exception:
+                # The batch runs in one transaction, so nothing was applied;
+                # retry per event to find the ones that belong in the DLQ.
+                logger.debug("Continuum backfill batch failed, retrying per event", exc_info=True)
+        if results is None:
+            results = []
+            for event in events:
+                try:
+                    if backend is not None:
+                        results.append(await backend.continuum_project_event(event))
+                    else:
+                        results.append(await self._project_continuum_event(event))
+                except Exception as exc:
+                    if backend is not None:
+                        await backend.continuum_projector_dlq_push(f"backfill_failed:{exc}", event)
+                    else:
+                        await self._continuum_dlq_push(f"backfill_failed:{exc}", event)
+                    results.append({"status": "dlq_queued"})
+
+        for result in results:
+            status = result.get("status")
+            if status == "projected":
+                job.projected += 1
+            elif status == "duplicate":
+                job.duplicates += 1
+            elif status == "stale_rejected":
+                job.stale_rejected += 1
+            elif status == "dlq_queued":
+                job.dlq_queued += 1
+        job.processed += len(events)
 
-        result = {
+    @staticmethod
+    def _continuum_backfill_snapshot(job: _ContinuumBackfillJob) -> Dict[str, Any]:
+        return {
+            "job_id": job.job_id,
+            "owner_client_id": job.owner_client_id,
+            "status": job.status,
             "dry_run": False,
-            "selected_count": len(selected_events),
-            "projected": projected,
-            "duplicates": duplicates,
-            "stale_rejected": stale_rejected,
-            "dlq_queued": dlq_queued,
-            "from_ts": from_ts_raw,
-            "to_ts": to_ts_raw,
-            "tenant_id": tenant_filter,
-            "agent_id": agent_filter,
+            "backend": job.backend,
+            "selected_count": job.selected_count,
+            "processed": job.processed,
+            "projected": job.projected,
+            "duplicates": job.duplicates,
+            "stale_rejected": job.stale_rejected,
+            "dlq_queued": job.dlq_queued,
+            "agent_lanes": job.agent_lanes,
+            "chunk_size": job.chunk_size,
+            "parallelism": job.parallelism,
+            "from_ts": job.from_ts,
+            "to_ts": job.to_ts,
+            "tenant_id": job.tenant_id,
+            "agent_id": job.agent_id,
+            "created_at": job.created_at,
+            "finished_at": job.finished_at,
+            "error": job.error,
         }
-        self._safe_record_counter(
-            "continuum_projector_backfill_total",
-            labels={"dry_run": "false", "backend": "memory"},
-        )
-        self._safe_record_counter("continuum_projector_backfill_events_total", projected, {"outcome": "projected"})
-        self._safe_record_counter("continuum_projector_backfill_events_total", duplicates, {"outcome": "duplicate"})
-        self._safe_record_counter(
-            "continuum_projector_backfill_events_total",
-            stale_rejected,
-            {"outcome": "stale_rejected"},
-        )
-        self._safe_record_counter("continuum_projector_backfill_events_total", dlq_queued, {"outcome": "dlq_queued"})
-        self._safe_record_histogram(
-            "continuum_projector_backfill_duration_seconds",
-            time.perf_counter() - started_at,
-            labels={"backend": "memory"},
-        )
-        return result
+
+    async def _continuum_projector_backfill_status(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        job_id = str(args.get("job_id", "")).strip()
+        async with self._ops_lock:
+            if job_id:
+                job = self._continuum_backfill_jobs.get(job_id)
+                if job is None:
+                    raise _NotFoundError(f"Continuum backfill job '{job_id}' not found", {"job_id": job_id})
+                return self._continuum_backfill_snapshot(job)
+            jobs = [self._continuum_backfill_snapshot(job) for job in self._continuum_backfill_jobs.values()]
+        return {"jobs": jobs, "count": len(jobs)}
+
+    async def _cancel_continuum_backfills(self) -> None:
+        async with self._ops_lock:
+            tasks = list(self._continuum_backfill_tasks.values())
+            self._continuum_backfill_tasks = {}
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                logger.debug("Continuum backfill cancelled during shutdown")
+            except Exception as exc:
+                logger.warning("Continuum backfill cleanup failed during shutdown: %s", exc)
 
     def _omega_snapshot(self) -> Dict[str, Any]:
         return {
@@ -1489,10 +2058,6 @@ class WebSocketBus:
             raise _FeatureDisabledError("Tier-Omega experimental lane is disabled")
 
     async def _omega_register_substrate(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
-        self._require_omega_enabled()
-        if not await self._client_is_admin(client_id):
-            raise PermissionError("Only admin clients can register Tier-Omega substrates")
-
         name = str(args.get("name", "")).strip()
         kind = str(args.get("kind", "")).strip()
         metadata = args.get("metadata") or {}
@@ -1540,10 +2105,6 @@ class WebSocketBus:
         }
 
     async def _omega_unregister_substrate(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
-        self._require_omega_enabled()
-        if not await self._client_is_admin(client_id):
-            raise PermissionError("Only admin clients can unregister Tier-Omega substrates")
-
         substrate_id = str(args.get("substrate_id", "")).strip()
         if not substrate_id:
             raise ValueError("'substrate_id' is required")
@@ -1582,18 +2143,12 @@ class WebSocketBus:
         )
 
     async def _omega_probe_firecracker(self) -> Dict[str, Any]:
-        self._require_omega_enabled()
         return self._omega_firecracker.snapshot()
 
     async def _omega_list_vms(self) -> Dict[str, Any]:
-        self._require_omega_enabled()
         return await self._omega_firecracker.list_vms()
 
     async def _omega_launch_vm(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
-        self._require_omega_enabled()
-        if not await self._client_is_admin(client_id):
-            raise PermissionError("Only admin clients can launch Tier-Omega VMs")
-
         substrate_id = str(args.get("substrate_id", "")).strip()
         if not substrate_id:
             raise ValueError("'substrate_id' is required")
@@ -1614,10 +2169,6 @@ class WebSocketBus:
         return vm_info
 
     async def _omega_stop_vm(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
-        self._require_omega_enabled()
-        if not await self._client_is_admin(client_id):
-            raise PermissionError("Only admin clients can stop Tier-Omega VMs")
-
         vm_id = str(args.get("vm_id", "")).strip()
         if not vm_id:
             raise ValueError("'vm_id' is required")
@@ -1625,7 +2176,6 @@ class WebSocketBus:
         return await self._omega_firecracker.stop_vm(vm_id)
 
     async def _omega_list_substrates(self) -> Dict[str, Any]:
-        self._require_omega_enabled()
         async with self._ops_lock:
             substrates = list(self._omega_substrates.values())
 
@@ -1644,10 +2194,6 @@ class WebSocketBus:
         return {"substrates": payload, "count": len(payload)}
 
     async def _omega_emit_event(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
-        self._require_omega_enabled()
-        if not await self._client_is_admin(client_id):
-            raise PermissionError("Only admin clients can emit Tier-Omega events")
-
         substrate_id = str(args.get("substrate_id", "")).strip()
         signal = str(args.get("signal", "")).strip()
         payload = args.get("payload") or {}
@@ -1691,7 +2237,6 @@ class WebSocketBus:
         return event
 
     async def _omega_list_events(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        self._require_omega_enabled()
         limit = int(args.get("limit", 50))
         if limit < 1:
             raise ValueError("'limit' must be >= 1")
@@ -1715,10 +2260,6 @@ class WebSocketBus:
         }
 
     async def _omega_clear_events(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
-        self._require_omega_enabled()
-        if not await self._client_is_admin(client_id):
-            raise PermissionError("Only admin clients can clear Tier-Omega events")
-
         substrate_id = str(args.get("substrate_id", "")).strip() or None
         signal = str(args.get("signal", "")).strip() or None
 
@@ -1742,33 +2283,175 @@ class WebSocketBus:
             "signal": signal,
         }
 
+    def _default_wire_format(self) -> str:
+        if self.config.infra_protocol == "protobuf" and not self.config.allow_json_infra:
+            return "protobuf"
+        return "json"
+
     def _wire_format_for_websocket(self, websocket: Any) -> str:
         wire_format = getattr(websocket, "_arqon_wire_format", None)
         if wire_format in ("json", "protobuf"):
             return wire_format
-        if self.config.infra_protocol == "protobuf" and not self.config.allow_json_infra:
-            return "protobuf"
-        return "json"
+        return self._default_wire_format()
 
     async def _send_envelope_wire(self, websocket: Any, envelope: Envelope, wire_format: str) -> None:
-        if wire_format == "protobuf":
-            await websocket.send(envelope.to_proto_bytes())
+        frame = envelope.frames.for_format(wire_format)
+        # Keep per-connection ordering: once a connection owns an outbound
+        # queue, every frame for it goes through that queue. Responses,
+        # errors and acks wait for room instead of being dropped or coalesced.
+        outbox = self.client_registry.outbox_for(websocket)
+        if isinstance(outbox, OutboundQueue):
+            await outbox.put_control(frame)
             return
-        await websocket.send(envelope.to_json())
+        await websocket.send(frame)
+
+    def _ack_state_for(self, websocket: Any) -> AckState:
+        ack_state = getattr(websocket, "_arqon_ack", None)
+        if ack_state is None:
+            ws_config = self.config.websocket
+            mode = getattr(websocket, "_arqon_ack_mode", None) or ws_config.ack_mode
+            ack_state = AckState(
+                mode=normalize_ack_mode(mode),
+                batch_size=ws_config.ack_batch_size,
+                flush_ms=ws_config.ack_flush_ms,
+            )
+            setattr(websocket, "_arqon_ack", ack_state)
+        return ack_state
 
-    async def _handle_connection(self, websocket: Any):
-        """Handle new WebSocket connection.
+    async def _acknowledge(
+        self,
+        websocket: Any,
+        envelope: Envelope,
+        wire_format: str,
+        slot: Optional[int] = None,
+    ) -> None:
+        """Acknowledge an accepted message or command per the connection's ack mode.
         
-        Args:
-            websocket: WebSocket connection object
-            path: Connection path (unused for now)
-        """
-        client_id = None
+        - legacy: ``message_response`` echoing the payload; ``command_response`` for commands
+        - id: ``message_response`` carrying only the message ID
+        - batch: cumulative ``message_response`` with ``ack_seq`` every ``batch_size``
+          messages or ``flush_ms``, whichever comes first
+        - none: nothing
         
-        try:
-            claims = getattr(websocket, "_arqon_auth_claims", None)
-            metadata = {}
-            if isinstance(claims, dict):
+        Outside legacy mode commands are acknowledged by their command response only.
+        ``slot`` is the ack slot the frame reserved on arrival (one is reserved
+        now if the frame was not pipelined).
+        """
+        ack_state = self._ack_state_for(websocket)
+        if envelope.type == "message":
+            if slot is None:
+                slot = ack_state.reserve()
+            ack_state.complete(slot, 1, envelope.id)
+            if ack_state.mode == ACK_LEGACY:
+                ack = Envelope(
+                    id=envelope.id,
+                    type="message_response",
+                    payload=envelope.payload,
+                    sender="arqonbus"
+                )
+            elif ack_state.mode == ACK_ID:
+                ack = Envelope(id=envelope.id, type="message_response", sender="arqonbus")
+            elif ack_state.mode == ACK_BATCH:
+                await self._schedule_cumulative_ack(websocket, ack_state, wire_format)
+                return
+            else:
+                ack_state.acked_seq = ack_state.seq
+                return
+            ack_state.acked_seq = ack_state.seq
+            await self._send_envelope_wire(websocket, ack, wire_format)
+        elif envelope.type == "command" and ack_state.mode == ACK_LEGACY:
+            ack = Envelope(
+                id=envelope.id,
+                type="command_response",
+                command=envelope.payload.get("command") if envelope.payload else envelope.command,
+                payload={"result": "ok"},
+                sender="arqonbus"
+            )
+            await self._send_envelope_wire(websocket, ack, wire_format)
+
+    async def _release_ack_slot(self, websocket: Any, slot: int) -> None:
+        """Complete an ack slot whose frame accepted no messages.
+        
+        No-op if the frame already completed its slot. Otherwise later
+        frames that finished first can now be covered by a cumulative ack.
+        """
+        ack_state = self._ack_state_for(websocket)
+        if not ack_state.complete(slot):
+            return
+        if ack_state.mode == ACK_BATCH:
+            await self._schedule_cumulative_ack(websocket, ack_state, self._wire_format_for_websocket(websocket))
+        else:
+            ack_state.acked_seq = ack_state.seq
+
+    async def _schedule_cumulative_ack(self, websocket: Any, ack_state: AckState, wire_format: str) -> None:
+        """Flush a cumulative ack once a batch is full, else arm the flush timer."""
+        if ack_state.pending >= ack_state.batch_size:
+            await self._flush_acks(websocket, wire_format)
+        elif ack_state.pending and ack_state.flush_handle is None:
+            ack_state.flush_handle = asyncio.get_running_loop().call_later(
+                ack_state.flush_ms / 1000.0,
+                lambda: asyncio.ensure_future(self._flush_acks(websocket, wire_format)),
+            )
+
+    async def _flush_acks(self, websocket: Any, wire_format: Optional[str] = None) -> None:
+        """Send one cumulative ack covering every message up to the current sequence."""
+        ack_state = self._ack_state_for(websocket)
+        ack_state.cancel_flush()
+        count = ack_state.pending
+        if count <= 0:
+            return
+        ack_state.acked_seq = ack_state.seq
+        ack = Envelope(
+            type="message_response",
+            request_id=ack_state.last_id,
+            payload={"ack_seq": ack_state.seq, "count": count},
+            sender="arqonbus",
+        )
+        try:
+            await self._send_envelope_wire(
+                websocket,
+                ack,
+                wire_format or self._wire_format_for_websocket(websocket),
+            )
+        except Exception as exc:
+            logger.debug("Failed to send cumulative ack: %s", exc)
+
+    async def _session_ack_mode(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        client_info = await self.client_registry.get_client(client_id)
+        websocket = getattr(client_info, "websocket", None)
+        if websocket is None:
+            raise ValueError(f"Unknown client: {client_id}")
+
+        ack_state = self._ack_state_for(websocket)
+        if "batch_size" in args:
+            batch_size = int(args["batch_size"])
+            if batch_size < 1:
+                raise ValueError("'batch_size' must be >= 1")
+            ack_state.batch_size = batch_size
+        if "flush_ms" in args:
+            ack_state.flush_ms = self._parse_positive_float(args["flush_ms"], "flush_ms")
+        if "mode" in args:
+            mode = normalize_ack_mode(args["mode"])
+            if ack_state.mode == ACK_BATCH and mode != ACK_BATCH:
+                await self._flush_acks(websocket)
+            ack_state.mode = mode
+            if mode != ACK_BATCH:
+                ack_state.acked_seq = ack_state.seq
+        return ack_state.snapshot()
+
+    async def _handle_connection(self, websocket: Any):
+        """Handle new WebSocket connection.
+        
+        Args:
+            websocket: WebSocket connection object
+            path: Connection path (unused for now)
+        """
+        client_id = None
+        
+        try:
+            claims = getattr(websocket, "_arqon_auth_claims", None)
+            metadata = {}
+            if isinstance(claims, dict):
                 role = claims.get("role")
                 tenant_id = claims.get("tenant_id")
                 subject = claims.get("sub")
@@ -1808,8 +2491,24 @@ class WebSocketBus:
             self._stats["events_emitted"] += 1
             
             # Handle incoming messages
-            async for message_data in websocket:
-                await self._handle_message_from_client(client_id, websocket, message_data)
+            max_in_flight = self.config.websocket.max_in_flight_per_connection
+            if max_in_flight > 1:
+                pipeline = ConnectionPipeline(max_in_flight, on_change=self._on_pipeline_change)
+                self._pipelines[client_id] = pipeline
+                ack_state = self._ack_state_for(websocket)
+                async for message_data in websocket:
+                    parsed = self._try_parse_frame(message_data)
+                    # Ack slots follow arrival order, not completion order.
+                    slot = ack_state.reserve() if self._carries_messages(parsed) else None
+                    await pipeline.submit(
+                        self._ordering_key(parsed),
+                        lambda data=message_data, parsed=parsed, slot=slot: self._handle_message_from_client(
+                            client_id, websocket, data, parsed, slot
+                        ),
+                    )
+            else:
+                async for message_data in websocket:
+                    await self._handle_message_from_client(client_id, websocket, message_data)
                 
         except ConnectionClosed:
             logger.info(f"Client {client_id} disconnected normally")
@@ -1817,22 +2516,88 @@ class WebSocketBus:
             logger.error(f"Error handling connection for client {client_id}: {e}")
             self._stats["errors"] += 1
         finally:
+            pipeline = self._pipelines.pop(client_id, None) if client_id else None
+            if pipeline is not None:
+                await pipeline.close(timeout=self.config.server.connection_timeout)
+            ack_state = getattr(websocket, "_arqon_ack", None)
+            if ack_state is not None:
+                ack_state.cancel_flush()
             # Cleanup on disconnect
             if client_id:
                 await self._disconnect_client(client_id)
     
-    async def _handle_message_from_client(self, client_id: str, websocket: Any, message_data: Any):
+    @staticmethod
+    def _try_parse_frame(message_data: Any) -> Optional[Tuple[List[Tuple[Optional[Envelope], List[str]]], str, bool]]:
+        try:
+            return EnvelopeValidator.validate_and_parse_wire_frame(message_data)
+        except Exception:
+            # Reported when the frame is processed.
+            return None
+
+    @staticmethod
+    def _carries_messages(parsed: Optional[Tuple[List[Tuple[Optional[Envelope], List[str]]], str, bool]]) -> bool:
+        if parsed is None:
+            return False
+        items, _, _ = parsed
+        return any(envelope is not None and envelope.type == "message" for envelope, _ in items)
+
+    @staticmethod
+    def _ordering_key(
+        parsed: Optional[Tuple[List[Tuple[Optional[Envelope], List[str]]], str, bool]]
+    ) -> Union[None, str, FrozenSet[str]]:
+        """Return the ordering lane(s) of a parsed frame.
+        
+        Messages (and routed telemetry) are ordered per room:channel; a batch
+        spanning several room:channels is ordered on every one of them.
+        Commands and other frames are unordered.
+        """
+        if parsed is None:
+            return None
+        items, _, is_batch = parsed
+        keys = {
+            f"{envelope.room}:{envelope.channel}"
+            for envelope, _ in items
+            if envelope is not None and envelope.type in ("message", "telemetry") and envelope.room
+        }
+        if not keys:
+            return None
+        if len(keys) > 1:
+            return frozenset(keys)
+        return keys.pop()
+
+    def _on_pipeline_change(self, delta: int) -> None:
+        self._stats["in_flight"] += delta
+        self._safe_record_gauge("pipeline_in_flight", float(self._stats["in_flight"]))
+
+    async def _handle_message_from_client(
+        self,
+        client_id: str,
+        websocket: Any,
+        message_data: Any,
+        parsed: Optional[Tuple[List[Tuple[Optional[Envelope], List[str]]], str, bool]] = None,
+        slot: Optional[int] = None,
+    ):
         """Handle incoming message from client.
         
         Args:
             client_id: Client who sent the message
             websocket: Client's WebSocket connection
             message_data: Raw message payload (JSON text or protobuf bytes)
+            parsed: Result of validate_and_parse_wire_frame if already parsed
+            slot: Ack slot reserved when the frame arrived, if pipelined
         """
         try:
-            # Parse and validate message
-            envelope, validation_errors, wire_format = EnvelopeValidator.validate_and_parse_wire(message_data)
-            setattr(websocket, "_arqon_wire_format", wire_format)
+            # Parse and validate message (or batch of messages)
+            if parsed is None:
+                parsed = EnvelopeValidator.validate_and_parse_wire_frame(message_data)
+            items, wire_format, is_batch = parsed
+            if getattr(websocket, "_arqon_wire_format", None) != wire_format:
+                setattr(websocket, "_arqon_wire_format", wire_format)
+                self.client_registry.refresh_recipients(websocket)
+            if is_batch:
+                await self._handle_batch_from_client(client_id, websocket, items, wire_format, slot)
+                return
+            envelope, validation_errors = items[0]
 
             if (
                 wire_format == "json"
@@ -1900,24 +2665,7 @@ class WebSocketBus:
             else:
                 logger.warning(f"Unknown message type: {envelope.type}")
 
-            # Minimal ack responses for legacy tests
-            if envelope.type == "message":
-                ack = Envelope(
-                    id=envelope.id,
-                    type="message_response",
-                    payload=envelope.payload,
-                    sender="arqonbus"
-                )
-                await self._send_envelope_wire(websocket, ack, wire_format)
-            elif envelope.type == "command":
-                ack = Envelope(
-                    id=envelope.id,
-                    type="command_response",
-                    command=envelope.payload.get("command") if envelope.payload else envelope.command,
-                    payload={"result": "ok"},
-                    sender="arqonbus"
-                )
-                await self._send_envelope_wire(websocket, ack, wire_format)
+            await self._acknowledge(websocket, envelope, wire_format, slot)
             
         except Exception as e:
             logger.error(f"Error processing message from client {client_id}: {e}")
@@ -1942,6 +2690,155 @@ class WebSocketBus:
                     client_id,
                     exc,
                 )
+        finally:
+            if slot is not None:
+                await self._release_ack_slot(websocket, slot)
+    
+    async def _handle_batch_from_client(
+        self,
+        client_id: str,
+        websocket: Any,
+        items: List[Tuple[Optional[Envelope], List[str]]],
+        wire_format: str,
+        slot: Optional[int] = None,
+    ) -> None:
+        """Handle a batch frame of message envelopes.
+        
+        Valid items are persisted with one bulk append and fanned out grouped
+        by room:channel. Rejected items are reported together in a single
+        ``message_response`` that also acknowledges the accepted ones.
+        
+        Args:
+            client_id: Client who sent the batch
+            websocket: Client's WebSocket connection
+            items: (envelope, validation_errors) pairs from the wire frame
+            wire_format: Wire format of the frame
+            slot: Ack slot reserved when the frame arrived, if pipelined
+        """
+        if (
+            wire_format == "json"
+            and self.config.infra_protocol == "protobuf"
+            and not self.config.allow_json_infra
+        ):
+            error_msg = Envelope(
+                type="error",
+                error="JSON wire format is forbidden for infrastructure traffic",
+                error_code="INFRA_PROTOCOL_ERROR",
+                payload={"required_protocol": "protobuf"},
+                sender="arqonbus",
+            )
+            await self._send_envelope_wire(websocket, error_msg, wire_format)
+            return
+
+        max_batch_size = self.config.websocket.max_batch_size
+        if not items or len(items) > max_batch_size:
+            error_msg = Envelope(
+                type="error",
+                error=f"Batch must contain between 1 and {max_batch_size} envelopes",
+                error_code="BATCH_SIZE_ERROR",
+                payload={"size": len(items), "max_batch_size": max_batch_size},
+                sender="arqonbus",
+            )
+            await self._send_envelope_wire(websocket, error_msg, wire_format)
+            return
+
+        accepted: List[Envelope] = []
+        rejected: List[Dict[str, Any]] = []
+        for index, (envelope, validation_errors) in enumerate(items):
+            envelope_id = envelope.id if envelope is not None else None
+            if envelope is None or validation_errors:
+                rejected.append({"index": index, "id": envelope_id, "errors": validation_errors})
+                continue
+            if envelope.type != "message":
+                rejected.append(
+                    {"index": index, "id": envelope_id, "errors": ["Only message envelopes can be batched"]}
+                )
+                continue
+            if not envelope.room or not envelope.channel:
+                rejected.append(
+                    {"index": index, "id": envelope_id, "errors": ["Batched messages require room and channel"]}
+                )
+                continue
+
+            envelope.sender = client_id
+            context = {"client_id": client_id, "room": envelope.room, "channel": envelope.channel}
+            casil_outcome = await self.casil.process(envelope, context)
+            if casil_outcome.decision == CASILDecision.BLOCK:
+                rejected.append(
+                    {
+                        "index": index,
+                        "id": envelope_id,
+                        "errors": ["CASIL blocked message"],
+                        "error_code": casil_outcome.reason_code,
+                    }
+                )
+                continue
+            accepted.append(envelope)
+
+        if accepted:
+            await self.client_registry.update_client_activity(client_id)
+            self._stats["last_activity"] = asyncio.get_event_loop().time()
+            self._stats["messages_processed"] += len(accepted)
+            await self._handle_message_batch(accepted, client_id)
+
+        self._safe_record_histogram("inbound_batch_size", float(len(items)))
+        if rejected:
+            self._safe_record_counter("inbound_batch_rejected_total", float(len(rejected)))
+
+        ack_state = self._ack_state_for(websocket)
+        if slot is None:
+            slot = ack_state.reserve()
+        ack_state.complete(slot, len(accepted), accepted[-1].id if accepted else None)
+        if ack_state.mode == ACK_BATCH and not rejected:
+            # Cumulative acks cover the batch on the usual schedule.
+            await self._schedule_cumulative_ack(websocket, ack_state, wire_format)
+            return
+        ack_state.cancel_flush()
+        ack_state.acked_seq = ack_state.seq
+        if ack_state.mode == ACK_NONE and not rejected:
+            return
+        response = Envelope(
+            type="message_response",
+            request_id=accepted[-1].id if accepted else None,
+            payload={
+                "accepted": len(accepted),
+                "rejected": len(rejected),
+                "ack_seq": ack_state.seq,
+                "errors": rejected,
+            },
+            sender="arqonbus",
+        )
+        await self._send_envelope_wire(websocket, response, wire_format)
+
+    async def _handle_message_batch(self, envelopes: List[Envelope], client_id: str):
+        """Persist and route a batch of validated messages.
+        
+        Args:
+            envelopes: Message envelopes with room and channel set
+            client_id: Client who sent the messages
+        """
+        if self.config.storage.enable_persistence and self.storage:
+            try:
+                results = await self.storage.store_messages(envelopes)
+                for envelope, result in zip(envelopes, results):
+                    if not result.success:
+                        logger.warning(
+                            "Failed to persist message %s from %s: %s",
+                            envelope.id,
+                            client_id,
+                            result.error_message,
+                        )
+            except Exception as e:
+                logger.error("Batch persistence error for %s messages: %s", len(envelopes), e)
+
+        groups: Dict[Tuple[str, str], List[Envelope]] = {}
+        for envelope in envelopes:
+            groups.setdefault((envelope.room, envelope.channel), []).append(envelope)
+        for (room, channel), group in groups.items():
+            await self.client_registry.broadcast_many(group, room, channel, exclude_client_id=client_id)
+
+        for envelope in envelopes:
+            await self._dispatch_webhooks_for_message(envelope, client_id)
     
     async def _handle_message(self, envelope: Envelope, client_id: str):
         """Handle regular message routing.
@@ -1978,440 +2875,305 @@ class WebSocketBus:
         
         logger.debug(f"Broadcasted message from {client_id} to {sent_count} clients in {envelope.room}:{envelope.channel}")
     
-    async def _handle_command(self, envelope: Envelope, client_id: str):
-        """Handle command messages.
-        
-        Args:
-            envelope: Command envelope
-            client_id: Client who sent the command
+    def _build_command_table(self) -> Dict[str, _CommandSpec]:
+        specs = [
+            # Session
+            _CommandSpec("op.session.ack_mode", self._session_ack_mode, "Ack mode updated"),
+            # Tier-Omega experimental lane
+            _CommandSpec("op.omega.status", lambda cid, args: self._omega_snapshot(), "Tier-Omega lane status"),
+            _CommandSpec(
+                "op.omega.register_substrate",
+                self._omega_register_substrate,
+                "Tier-Omega substrate registered",
+                admin_action="register Tier-Omega substrates",
+                feature="tier_omega",
+            ),
+            _CommandSpec(
+                "op.omega.list_substrates",
+                lambda cid, args: self._omega_list_substrates(),
+                "Tier-Omega substrates listed",
+                feature="tier_omega",
+            ),
+            _CommandSpec(
+                "op.omega.unregister_substrate",
+                self._cmd_omega_unregister_substrate,
+                "Tier-Omega substrate removed",
+                admin_action="unregister Tier-Omega substrates",
+                feature="tier_omega",
+            ),
+            _CommandSpec(
+                "op.omega.emit_event",
+                self._omega_emit_event,
+                "Tier-Omega event emitted",
+                admin_action="emit Tier-Omega events",
+                feature="tier_omega",
+            ),
+            _CommandSpec(
+                "op.omega.clear_events",
+                self._omega_clear_events,
+                "Tier-Omega events cleared",
+                admin_action="clear Tier-Omega events",
+                feature="tier_omega",
+            ),
+            _CommandSpec(
+                "op.omega.list_events",
+                lambda cid, args: self._omega_list_events(args),
+                "Tier-Omega events listed",
+                feature="tier_omega",
+            ),
+            _CommandSpec(
+                "op.omega.vm.probe",
+                lambda cid, args: self._omega_probe_firecracker(),
+                "Tier-Omega Firecracker runtime probe",
+                feature="tier_omega",
+            ),
+            _CommandSpec(
+                "op.omega.vm.list",
+                lambda cid, args: self._omega_list_vms(),
+                "Tier-Omega Firecracker VMs listed",
+                feature="tier_omega",
+            ),
+            _CommandSpec(
+                "op.omega.vm.launch",
+                self._omega_launch_vm,
+                "Tier-Omega Firecracker VM launched",
+                admin_action="launch Tier-Omega VMs",
+                feature="tier_omega",
+            ),
+            _CommandSpec(
+                "op.omega.vm.stop",
+                self._omega_stop_vm,
+                "Tier-Omega Firecracker VM stop requested",
+                admin_action="stop Tier-Omega VMs",
+                feature="tier_omega",
+            ),
+            # CASIL
+            _CommandSpec(
+                "op.casil.get",
+                lambda cid, args: self._casil_snapshot(self.config.casil),
+                "CASIL policy snapshot",
+            ),
+            _CommandSpec(
+                "op.casil.reload",
+                self._reload_casil_policy,
+                "CASIL policy reloaded",
+                admin_action="reload CASIL policy",
+            ),
+            # Standard operators: webhook, cron, store
+            _CommandSpec("op.webhook.register", self._register_webhook_rule, "Webhook rule registered"),
+            _CommandSpec("op.webhook.unregister", self._cmd_webhook_unregister, "Webhook rule removed"),
+            _CommandSpec(
+                "op.webhook.list",
+                lambda cid, args: self._list_webhook_rules(cid),
+                "Webhook rules retrieved",
+            ),
+            _CommandSpec("op.cron.schedule", self._schedule_cron_job, "Cron job scheduled"),
+            _CommandSpec("op.cron.cancel", self._cmd_cron_cancel, "Cron job cancelled"),
+            _CommandSpec("op.cron.list", lambda cid, args: self._list_cron_jobs(cid), "Cron jobs retrieved"),
+            _CommandSpec("op.store.set", self._store_set, "Store value written"),
+            _CommandSpec("op.store.get", self._store_get, "Store value retrieved"),
+            _CommandSpec("op.store.delete", self._store_delete, "Store value deleted"),
+            _CommandSpec("op.store.list", self._store_list, "Store keys listed"),
+            # History
+            _CommandSpec("op.history.get", self._history_get, "History window retrieved", streaming=True),
+            _CommandSpec(
+                "op.history.replay",
+                self._history_replay,
+                "History replay window retrieved",
+                streaming=True,
+            ),
+            # Continuum projector
+            _CommandSpec(
+                "op.continuum.projector.status",
+                lambda cid, args: self._continuum_projector_status(),
+                "Continuum projector status",
+                admin_action="read Continuum projector status",
+            ),
+            _CommandSpec(
+                "op.continuum.projector.project_event",
+                self._continuum_project_event_command,
+                "Continuum event projection processed",
+                admin_action="project Continuum events",
+            ),
+            _CommandSpec(
+                "op.continuum.projector.get",
+                self._continuum_projector_get,
+                "Continuum projector get result",
+                admin_action="read Continuum projector state",
+            ),
+            _CommandSpec(
+                "op.continuum.projector.list",
+                self._continuum_projector_list,
+                "Continuum projector list result",
+                admin_action="list Continuum projector state",
+            ),
+            _CommandSpec(
+                "op.continuum.projector.dlq.list",
+                self._continuum_projector_dlq_list,
+                "Continuum projector DLQ list result",
+                admin_action="list Continuum DLQ",
+            ),
+            _CommandSpec(
+                "op.continuum.projector.dlq.replay",
+                self._continuum_projector_dlq_replay,
+                "Continuum projector DLQ replay result",
+                admin_action="replay Continuum DLQ items",
+            ),
+            _CommandSpec(
+                "op.continuum.projector.backfill",
+                self._continuum_projector_backfill,
+                "Continuum projector backfill result",
+                admin_action="run Continuum projector backfill",
+            ),
+            _CommandSpec(
+                "op.continuum.projector.subscribe",
+                self._continuum_projector_subscribe,
+                "Subscribed to Continuum projection changes",
+                admin_action="subscribe to Continuum projection changes",
+            ),
+            _CommandSpec(
+                "op.continuum.projector.unsubscribe",
+                self._continuum_projector_unsubscribe,
+                "Unsubscribed from Continuum projection changes",
+                admin_action="subscribe to Continuum projection changes",
+            ),
+            _CommandSpec(
+                "op.continuum.projector.backfill.status",
+                self._continuum_projector_backfill_status,
+                "Continuum projector backfill status",
+                admin_action="read Continuum projector backfill status",
+            ),
+        ]
+        table = {spec.name: spec for spec in specs}
+        # Legacy un-prefixed history aliases.
+        table["history.get"] = table["op.history.get"]
+        table["history.replay"] = table["op.history.replay"]
+        return table
+
+    def _require_feature(self, feature: str) -> None:
+        if feature == "tier_omega":
+            self._require_omega_enabled()
+            return
+        raise _FeatureDisabledError(f"Unknown feature flag: {feature}")
+
+    async def _cmd_omega_unregister_substrate(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        data = await self._omega_unregister_substrate(client_id, args)
+        if not data.get("removed"):
+            raise _NotFoundError(
+                f"Tier-Omega substrate '{data['substrate_id']}' not found",
+                {"substrate_id": data["substrate_id"]},
+            )
+        return data
+
+    async def _cmd_webhook_unregister(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        rule_id = str(args.get("rule_id", "")).strip()
+        if not rule_id:
+            raise ValueError("'rule_id' is required")
+        if not await self._unregister_webhook_rule(client_id, rule_id):
+            raise _NotFoundError(f"Webhook rule '{rule_id}' not found", {"rule_id": rule_id})
+        return {"rule_id": rule_id}
+
+    async def _cmd_cron_cancel(self, client_id: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        job_id = str(args.get("job_id", "")).strip()
+        if not job_id:
+            raise ValueError("'job_id' is required")
+        if not await self._cancel_cron_job(client_id, job_id):
+            raise _NotFoundError(f"Cron job '{job_id}' not found", {"job_id": job_id})
+        return {"job_id": job_id}
+
+    async def _dispatch_command(self, spec: _CommandSpec, envelope: Envelope, client_id: str) -> None:
+        """Run a registered operator command and send its response.
+
+        Records a per-command latency histogram and error counter.
         """
-        args = envelope.args or {}
-
+        started = time.perf_counter()
+        error_code: Optional[str] = None
         try:
-            if envelope.command == "op.omega.status":
-                data = self._omega_snapshot()
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Tier-Omega lane status",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.omega.register_substrate":
-                data = await self._omega_register_substrate(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Tier-Omega substrate registered",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.omega.list_substrates":
-                data = await self._omega_list_substrates()
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Tier-Omega substrates listed",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.omega.unregister_substrate":
-                data = await self._omega_unregister_substrate(client_id, args)
-                if not data.get("removed"):
-                    await self._send_command_response(
-                        client_id,
-                        envelope.id,
-                        success=False,
-                        message=f"Tier-Omega substrate '{data['substrate_id']}' not found",
-                        data={"substrate_id": data["substrate_id"]},
-                        error_code="NOT_FOUND",
-                    )
-                    return
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Tier-Omega substrate removed",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.omega.emit_event":
-                data = await self._omega_emit_event(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Tier-Omega event emitted",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.omega.clear_events":
-                data = await self._omega_clear_events(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Tier-Omega events cleared",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.omega.list_events":
-                data = await self._omega_list_events(args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Tier-Omega events listed",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.omega.vm.probe":
-                data = await self._omega_probe_firecracker()
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Tier-Omega Firecracker runtime probe",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.omega.vm.list":
-                data = await self._omega_list_vms()
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Tier-Omega Firecracker VMs listed",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.omega.vm.launch":
-                data = await self._omega_launch_vm(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Tier-Omega Firecracker VM launched",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.omega.vm.stop":
-                data = await self._omega_stop_vm(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Tier-Omega Firecracker VM stop requested",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.casil.get":
-                data = self._casil_snapshot(self.config.casil)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="CASIL policy snapshot",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.casil.reload":
-                data = await self._reload_casil_policy(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="CASIL policy reloaded",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.webhook.register":
-                data = await self._register_webhook_rule(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Webhook rule registered",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.webhook.unregister":
-                rule_id = str(args.get("rule_id", "")).strip()
-                if not rule_id:
-                    raise ValueError("'rule_id' is required")
-                removed = await self._unregister_webhook_rule(client_id, rule_id)
-                if not removed:
-                    await self._send_command_response(
-                        client_id,
-                        envelope.id,
-                        success=False,
-                        message=f"Webhook rule '{rule_id}' not found",
-                        data={"rule_id": rule_id},
-                        error_code="NOT_FOUND",
-                    )
-                    return
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Webhook rule removed",
-                    data={"rule_id": rule_id},
-                )
-                return
-
-            if envelope.command == "op.webhook.list":
-                data = await self._list_webhook_rules(client_id)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Webhook rules retrieved",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.cron.schedule":
-                data = await self._schedule_cron_job(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Cron job scheduled",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.cron.cancel":
-                job_id = str(args.get("job_id", "")).strip()
-                if not job_id:
-                    raise ValueError("'job_id' is required")
-                cancelled = await self._cancel_cron_job(client_id, job_id)
-                if not cancelled:
-                    await self._send_command_response(
-                        client_id,
-                        envelope.id,
-                        success=False,
-                        message=f"Cron job '{job_id}' not found",
-                        data={"job_id": job_id},
-                        error_code="NOT_FOUND",
-                    )
-                    return
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Cron job cancelled",
-                    data={"job_id": job_id},
-                )
-                return
-
-            if envelope.command == "op.cron.list":
-                data = await self._list_cron_jobs(client_id)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Cron jobs retrieved",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.store.set":
-                data = await self._store_set(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Store value written",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.store.get":
-                data = await self._store_get(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Store value retrieved",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.store.delete":
-                data = await self._store_delete(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Store value deleted",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.store.list":
-                data = await self._store_list(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Store keys listed",
-                    data=data,
-                )
-                return
-
-            if envelope.command in {"history.get", "op.history.get"}:
-                data = await self._history_get(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="History window retrieved",
-                    data=data,
-                )
-                return
-
-            if envelope.command in {"history.replay", "op.history.replay"}:
-                data = await self._history_replay(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="History replay window retrieved",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.continuum.projector.status":
-                await self._require_admin(client_id, "read Continuum projector status")
-                data = await self._continuum_projector_status()
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Continuum projector status",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.continuum.projector.project_event":
-                data = await self._continuum_project_event_command(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Continuum event projection processed",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.continuum.projector.get":
-                data = await self._continuum_projector_get(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Continuum projector get result",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.continuum.projector.list":
-                data = await self._continuum_projector_list(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Continuum projector list result",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.continuum.projector.dlq.list":
-                data = await self._continuum_projector_dlq_list(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Continuum projector DLQ list result",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.continuum.projector.dlq.replay":
-                data = await self._continuum_projector_dlq_replay(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Continuum projector DLQ replay result",
-                    data=data,
-                )
-                return
-
-            if envelope.command == "op.continuum.projector.backfill":
-                data = await self._continuum_projector_backfill(client_id, args)
-                await self._send_command_response(
-                    client_id,
-                    envelope.id,
-                    success=True,
-                    message="Continuum projector backfill result",
-                    data=data,
-                )
-                return
+            if spec.feature is not None:
+                self._require_feature(spec.feature)
+            if spec.admin_action is not None:
+                await self._require_admin(client_id, spec.admin_action)
+            if spec.streaming:
+                data = spec.handler(client_id, envelope.args or {}, envelope.id)
+            else:
+                data = spec.handler(client_id, envelope.args or {})
+            if inspect.isawaitable(data):
+                data = await data
+        except _NotFoundError as exc:
+            error_code = "NOT_FOUND"
+            await self._send_command_response(
+                client_id,
+                envelope.id,
+                success=False,
+                message=str(exc),
+                data=exc.data,
+                error_code=error_code,
+            )
         except PermissionError as exc:
+            error_code = "AUTHORIZATION_ERROR"
             await self._send_command_response(
                 client_id,
                 envelope.id,
                 success=False,
                 message=str(exc),
-                error_code="AUTHORIZATION_ERROR",
+                error_code=error_code,
             )
-            return
         except _FeatureDisabledError as exc:
+            error_code = "FEATURE_DISABLED"
             await self._send_command_response(
                 client_id,
                 envelope.id,
                 success=False,
                 message=str(exc),
-                error_code="FEATURE_DISABLED",
+                error_code=error_code,
             )
-            return
         except (TypeError, ValueError) as exc:
+            error_code = "VALIDATION_ERROR"
             await self._send_command_response(
                 client_id,
                 envelope.id,
                 success=False,
                 message=f"Validation error: {exc}",
-                error_code="VALIDATION_ERROR",
+                error_code=error_code,
             )
-            return
         except Exception as exc:
-            logger.error("Operator command failed (%s): %s", envelope.command, exc)
+            error_code = "EXECUTION_ERROR"
+            logger.error("Operator command failed (%s): %s", spec.name, exc)
             await self._send_command_response(
                 client_id,
                 envelope.id,
                 success=False,
                 message=f"Execution error: {exc}",
-                error_code="EXECUTION_ERROR",
+                error_code=error_code,
+            )
+        else:
+            await self._send_command_response(
+                client_id,
+                envelope.id,
+                success=True,
+                message=spec.message,
+                data=data,
             )
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            self._safe_record_histogram("operator_command_latency_ms", elapsed_ms, {"command": spec.name})
+            if error_code is not None:
+                self._safe_record_counter(
+                    "operator_command_errors_total",
+                    1,
+                    {"command": spec.name, "error_code": error_code},
+                )
+
+    async def _handle_command(self, envelope: Envelope, client_id: str):
+        """Handle command messages.
+        
+        Args:
+            envelope: Command envelope
+            client_id: Client who sent the command
+        """
+        spec = self._command_table.get(envelope.command)
+        if spec is not None:
+            await self._dispatch_command(spec, envelope, client_id)
             return
 
         if envelope.command == "truth.verify":
@@ -2603,6 +3365,7 @@ class WebSocketBus:
 
             await self._cancel_cron_jobs_for_client(client_id)
             await self._remove_webhook_rules_for_client(client_id)
+            self._continuum_feed.unsubscribe(client_id)
             await self.client_registry.unregister_client(client_id)
             self._stats["active_connections"] = max(0, self._stats["active_connections"] - 1)
             logger.info(f"Disconnected client {client_id}")
@@ -2665,6 +3428,11 @@ class WebSocketBus:
                 "max_connections": self.config.server.max_connections,
                 "ping_interval": self.config.server.ping_interval
             },
+            "workers": self.worker_mesh.snapshot() if self.worker_mesh is not None else None,
+            "pipelines": {
+                "connections": len(self._pipelines),
+                "in_flight": sum(pipeline.in_flight for pipeline in self._pipelines.values()),
+            },
             "timestamp": asyncio.get_event_loop().time()
         }
     
@@ -2725,8 +3493,22 @@ class WebSocketBus:
         }
 
 
-async def run_server():
-    """Run the ArqonBus WebSocket server."""
+async def run_server(
+    worker_id: Optional[int] = None,
+    worker_count: int = 1,
+    socket_dir: str = "",
+):
+    """Run the ArqonBus WebSocket server.
+    
+    With ``server.workers > 1`` this process becomes a supervisor that runs
+    that many worker processes sharing the port; each worker calls back in
+    here with its ``worker_id`` and joins the cross-worker fan-out mesh.
+    
+    Args:
+        worker_id: Worker index when running as a supervised worker
+        worker_count: Total number of workers
+        socket_dir: Directory for cross-worker Unix sockets
+    """
     # Setup logging
     logging.basicConfig(
         level=logging.INFO,
@@ -2742,12 +3524,25 @@ async def run_server():
             "Startup preflight failed: " + "; ".join(preflight_errors)
         )
 
-    client_registry = ClientRegistry()
+    if worker_id is None and config.server.workers > 1:
+        from .cluster import WorkerSupervisor
+        supervisor = WorkerSupervisor(config.server.workers, config.server.worker_socket_dir)
+        logger.info(f"Starting {config.server.workers} ArqonBus workers")
+        await supervisor.run()
+        return
+
+    client_registry = ClientRegistry.from_config(config)
     ws_bus = WebSocketBus(client_registry, config=config)
+    if worker_id is not None and worker_count > 1:
+        from .cluster import WorkerMesh
+        ws_bus.worker_mesh = WorkerMesh(worker_id, worker_count, socket_dir)
+        ws_bus.worker_mesh.attach(client_registry)
+        await ws_bus.worker_mesh.start()
     
     try:
         # Start server
         await ws_bus.start_server()
+        await ws_bus.server.wait_closed()
     except KeyboardInterrupt:
         logger.info("Received shutdown signal")
     except Exception as e:
@@ -2755,6 +3550,8 @@ async def run_server():
         raise
     finally:
         await ws_bus.stop_server()
+        if ws_bus.worker_mesh is not None:
+            await ws_bus.worker_mesh.stop()
 
 
 if __name__ == "__main__":
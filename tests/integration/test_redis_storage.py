@@ -2,7 +2,7 @@
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 import json
 
@@ -11,6 +11,14 @@ from arqonbus.protocol.envelope import Envelope
 from arqonbus.protocol.ids import generate_message_id
 
 
+def _attach_pipeline(mock_redis_client):
+    """Give an AsyncMock Redis client a synchronous pipeline() like redis-py."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    mock_redis_client.pipeline = MagicMock(return_value=pipe)
+    return pipe
+
+
 class TestRedisStreamsStorage:
     """Test Redis Streams storage backend integration."""
     
@@ -59,18 +67,24 @@ class TestRedisStreamsStorage:
             mock_redis_client = AsyncMock()
             mock_redis.return_value = mock_redis_client
             
+            pipe = _attach_pipeline(mock_redis_client)
+            
             storage = await RedisStreamsStorage.create(redis_config)
             result = await storage.append(test_envelope)
 
-            # Verify Redis XADD was called for all 4 streams (main, sender, room, channel)
-            assert mock_redis_client.xadd.call_count == 4
+            # Verify Redis XADD was queued for all 5 streams (main, sender, room, channel,
+            # room+channel) and sent in a single round trip
+            assert pipe.xadd.call_count == 5
+            pipe.execute.assert_awaited_once()
+            mock_redis_client.xadd.assert_not_called()
             # Check that all expected streams were written to
-            calls = mock_redis_client.xadd.call_args_list
+            calls = pipe.xadd.call_args_list
             stream_names = [call[0][0] for call in calls]
             assert 'arqonbus:messages' in stream_names
             assert 'arqonbus:sender_arq_client_123' in stream_names
             assert 'arqonbus:room_test_room' in stream_names
             assert 'arqonbus:channel_test_channel' in stream_names
+            assert 'arqonbus:roomchannel:9:test_room:test_channel' in stream_names
             
             # Verify result
             assert result.success is True
@@ -82,7 +96,7 @@ class TestRedisStreamsStorage:
             mock_redis_client = AsyncMock()
             mock_redis.return_value = mock_redis_client
             
-            # Mock Redis XRANGE response - fix format to match Redis Streams API
+            # Mock Redis XREVRANGE response - fix format to match Redis Streams API
             mock_messages = [
                 (
                     "1234567890-0",  # Stream ID
@@ -97,17 +111,17 @@ class TestRedisStreamsStorage:
                     }
                 )
             ]
-            mock_redis_client.xrange.return_value = mock_messages
+            mock_redis_client.xrevrange.return_value = mock_messages
             
             storage = await RedisStreamsStorage.create(redis_config)
             history = await storage.get_history(room="test_room", channel="test_channel", limit=50)
             
-            # Verify Redis XRANGE was called
-            mock_redis_client.xrange.assert_called_once()
-            call_args = mock_redis_client.xrange.call_args
+            # Verify Redis XREVRANGE was called
+            mock_redis_client.xrevrange.assert_called_once()
+            call_args = mock_redis_client.xrevrange.call_args
             
             # Check stream name and parameters
-            expected_stream = f"{redis_config['stream_prefix']}:room_test_room_channel_test_channel"
+            expected_stream = f"{redis_config['stream_prefix']}:roomchannel:9:test_room:test_channel"
             assert call_args[0][0] == expected_stream
             assert call_args[1]["count"] == 50
             
@@ -172,6 +186,7 @@ class TestRedisStreamsStorage:
         with patch('redis.asyncio.from_url') as mock_redis:
             mock_redis_client = AsyncMock()
             mock_redis.return_value = mock_redis_client
+            pipe = _attach_pipeline(mock_redis_client)
             
             storage = await RedisStreamsStorage.create(redis_config)
             
@@ -198,7 +213,8 @@ class TestRedisStreamsStorage:
             assert all(result.success is True for result in results)
             
             # Verify Redis was called for each message (each message writes to 4 streams)
-            assert mock_redis_client.xadd.call_count == 20  # 5 messages × 4 streams each
+            assert pipe.xadd.call_count == 25  # 5 messages × 5 streams each
+            assert pipe.execute.await_count == 5
     
     @pytest.mark.asyncio
     async def test_redis_connection_pool_management(self, redis_config):
@@ -206,6 +222,7 @@ class TestRedisStreamsStorage:
         with patch('redis.asyncio.from_url') as mock_redis:
             mock_redis_client = AsyncMock()
             mock_redis.return_value = mock_redis_client
+            pipe = _attach_pipeline(mock_redis_client)
             
             storage = await RedisStreamsStorage.create(redis_config)
             
@@ -224,8 +241,8 @@ class TestRedisStreamsStorage:
             await storage.get_history(room="test_room", channel="test_channel")
             
             # Verify Redis client methods were called
-            assert mock_redis_client.xadd.called
-            assert mock_redis_client.xrange.called
+            assert pipe.xadd.called
+            assert mock_redis_client.xrevrange.called
 
     @pytest.mark.asyncio
     async def test_strict_mode_raises_when_redis_unavailable(self, redis_config):
@@ -250,7 +267,8 @@ class TestRedisStreamsStorage:
         with patch("redis.asyncio.from_url") as mock_redis:
             mock_redis_client = AsyncMock()
             mock_redis.return_value = mock_redis_client
-            mock_redis_client.xadd.side_effect = Exception("Redis write failure")
+            pipe = _attach_pipeline(mock_redis_client)
+            pipe.execute.side_effect = Exception("Redis write failure")
 
             storage = await RedisStreamsStorage.create(strict_config)
 
@@ -0,0 +1,166 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from arqonbus.config.config import ArqonBusConfig
+from arqonbus.protocol.envelope import Envelope
+from arqonbus.routing.client_registry import ClientRegistry
+from arqonbus.transport.websocket_bus import WebSocketBus
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.open = True
+        self.sent = []
+
+    async def send(self, data):
+        self.sent.append(json.loads(data))
+
+
+def _make_bus(ack_mode: str = "legacy", batch_size: int = 64, flush_ms: float = 50.0) -> WebSocketBus:
+    config = ArqonBusConfig()
+    config.casil.enabled = False
+    config.storage.enable_persistence = False
+    config.websocket.ack_mode = ack_mode
+    config.websocket.ack_batch_size = batch_size
+    config.websocket.ack_flush_ms = flush_ms
+    return WebSocketBus(client_registry=ClientRegistry(), config=config)
+
+
+def _message(n: int) -> str:
+    return Envelope(
+        id=f"arq_1700000000000000000_{n}_abcdef",
+        type="message",
+        room="science",
+        channel="general",
+        payload={"content": "x" * 64},
+    ).to_json()
+
+
+async def _connect(bus: WebSocketBus, ack_mode=None):
+    ws = _FakeWebSocket()
+    if ack_mode is not None:
+        ws._arqon_ack_mode = ack_mode
+    client_id = await bus.client_registry.register_client(ws)
+    return client_id, ws
+
+
+@pytest.mark.asyncio
+async def test_legacy_mode_echoes_payload_by_default():
+    bus = _make_bus()
+    client_id, ws = await _connect(bus)
+    await bus._handle_message_from_client(client_id, ws, _message(1))
+
+    assert ws.sent[-1]["type"] == "message_response"
+    assert ws.sent[-1]["payload"] == {"content": "x" * 64}
+
+
+@pytest.mark.asyncio
+async def test_id_mode_acks_without_payload_and_none_mode_is_silent():
+    bus = _make_bus()
+    client_id, ws = await _connect(bus, ack_mode="id")
+    await bus._handle_message_from_client(client_id, ws, _message(1))
+    assert ws.sent[-1]["type"] == "message_response"
+    assert ws.sent[-1]["id"] == "arq_1700000000000000000_1_abcdef"
+    assert ws.sent[-1]["payload"] == {}
+
+    client_id, ws = await _connect(bus, ack_mode="none")
+    await bus._handle_message_from_client(client_id, ws, _message(2))
+    assert ws.sent == []
+
+
+@pytest.mark.asyncio
+async def test_batch_mode_sends_cumulative_acks():
+    bus = _make_bus(batch_size=3, flush_ms=20)
+    client_id, ws = await _connect(bus, ack_mode="batch")
+    for n in range(4):
+        await bus._handle_message_from_client(client_id, ws, _message(n))
+
+    assert len(ws.sent) == 1
+    assert ws.sent[0]["payload"] == {"ack_seq": 3, "count": 3}
+
+    await asyncio.sleep(0.05)
+    assert len(ws.sent) == 2
+    assert ws.sent[1]["payload"] == {"ack_seq": 4, "count": 1}
+
+
+@pytest.mark.asyncio
+async def test_cumulative_ack_waits_for_earlier_frames_in_flight():
+    bus = _make_bus(batch_size=1)
+    client_id, ws = await _connect(bus, ack_mode="batch")
+    ack_state = bus._ack_state_for(ws)
+    first, second = ack_state.reserve(), ack_state.reserve()
+
+    # The second frame finishes first; acking it would also cover the first.
+    await bus._handle_message_from_client(client_id, ws, _message(2), slot=second)
+    assert ws.sent == []
+    assert ack_state.snapshot()["in_flight"] == 1
+
+    await bus._handle_message_from_client(client_id, ws, _message(1), slot=first)
+    assert ws.sent[-1]["payload"] == {"ack_seq": 2, "count": 2}
+    assert ws.sent[-1]["request_id"] == "arq_1700000000000000000_2_abcdef"
+
+
+@pytest.mark.asyncio
+async def test_failed_frame_releases_its_slot_without_being_acked():
+    bus = _make_bus(batch_size=1)
+    client_id, ws = await _connect(bus, ack_mode="batch")
+    ack_state = bus._ack_state_for(ws)
+    first, second = ack_state.reserve(), ack_state.reserve()
+
+    await bus._handle_message_from_client(client_id, ws, _message(2), slot=second)
+    await bus._handle_message_from_client(client_id, ws, "{not json", slot=first)
+
+    assert ws.sent[0]["type"] == "error"
+    assert ws.sent[-1]["payload"] == {"ack_seq": 1, "count": 1}
+    assert ws.sent[-1]["request_id"] == "arq_1700000000000000000_2_abcdef"
+
+
+@pytest.mark.asyncio
+async def test_ack_mode_command_switches_mode_and_drops_command_ack():
+    bus = _make_bus()
+    client_id, ws = await _connect(bus)
+    command = Envelope(
+        id="arq_1700000000000000000_9_abcdef",
+        type="command",
+        command="op.session.ack_mode",
+        args={"mode": "id-only"},
+    )
+    await bus._handle_message_from_client(client_id, ws, command.to_json())
+
+    assert [frame["type"] for frame in ws.sent] == ["response"]
+    assert ws.sent[0]["payload"]["data"]["mode"] == "id"
+    assert ws._arqon_ack.mode == "id"
+
+
+def test_handshake_rejects_unknown_ack_mode():
+    bus = _make_bus()
+    connection = SimpleNamespace()
+    request = SimpleNamespace(headers={}, path="/?ack=sometimes")
+    response = asyncio.run(bus._process_request(connection, request))
+    assert response.status_code == 400
+
+    request = SimpleNamespace(headers={"X-Arqon-Ack-Mode": "batched"}, path="/")
+    assert asyncio.run(bus._process_request(connection, request)) is None
+    assert connection._arqon_ack_mode == "batch"
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [("id_only", "id"), ("id-only", "id"), ("Batched", "batch"), ("cumulative", "batch"), ("off", "none")],
+)
+def test_ack_mode_env_accepts_aliases(monkeypatch, raw, expected):
+    monkeypatch.setenv("ARQONBUS_ACK_MODE", raw)
+    config = ArqonBusConfig.from_environment()
+
+    assert config.websocket.ack_mode == expected
+    assert not any("ack mode" in error for error in config.validate())
+
+
+def test_ack_mode_env_rejects_unknown_mode(monkeypatch):
+    monkeypatch.setenv("ARQONBUS_ACK_MODE", "sometimes")
+    config = ArqonBusConfig.from_environment()
+
+    assert "Invalid ack mode: sometimes" in config.validate()
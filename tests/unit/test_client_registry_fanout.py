@@ -0,0 +1,162 @@
+import asyncio
+import time
+
+import pytest
+
+from arqonbus.protocol.envelope import Envelope
+from arqonbus.routing.client_registry import ClientRegistry
+
+
+class _FakeWebSocket:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.open = True
+        self.delay = delay
+        self.fail = fail
+        self.sent = []
+
+    async def send(self, data):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("socket broken")
+        self.sent.append(data)
+
+
+async def _register(registry: ClientRegistry, websocket) -> str:
+    return await registry.register_client(websocket, room="science", channel="general")
+
+
+def _message() -> Envelope:
+    return Envelope(type="message", room="science", channel="general", payload={"content": "hi"})
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_delay_other_recipients():
+    registry = ClientRegistry(send_timeout=0.2)
+    slow = _FakeWebSocket(delay=5.0)
+    fast = [_FakeWebSocket() for _ in range(5)]
+    await _register(registry, slow)
+    for ws in fast:
+        await _register(registry, ws)
+
+    started = time.perf_counter()
+    report = await registry.broadcast_with_report(_message(), "science", "general")
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.0
+    assert report.recipients == 6
+    assert report.delivered == 5
+    assert report.timed_out == 1
+    assert report.failed == 0
+    assert all(len(ws.sent) == 1 for ws in fast)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_counts_failures_and_excludes_sender():
+    registry = ClientRegistry()
+    sender_ws = _FakeWebSocket()
+    broken_ws = _FakeWebSocket(fail=True)
+    ok_ws = _FakeWebSocket()
+    sender_id = await _register(registry, sender_ws)
+    await _register(registry, broken_ws)
+    await _register(registry, ok_ws)
+
+    sent = await registry.broadcast_to_room_channel(
+        _message(), "science", "general", exclude_client_id=sender_id
+    )
+
+    assert sent == 1
+    assert sender_ws.sent == []
+    assert registry.last_broadcast.failed == 1
+    stats = await registry.get_stats()
+    assert stats["broadcast_deliveries"] == 1
+    assert stats["broadcast_failures"] == 1
+    assert stats["last_broadcast"]["recipients"] == 2
+
+
+@pytest.mark.asyncio
+async def test_broadcast_uses_each_recipient_wire_format():
+    registry = ClientRegistry()
+    json_ws = _FakeWebSocket()
+    proto_ws = _FakeWebSocket()
+    proto_ws._arqon_wire_format = "protobuf"
+    await _register(registry, json_ws)
+    await _register(registry, proto_ws)
+
+    message = _message()
+    await registry.broadcast_to_room_channel(message, "science", "general")
+
+    assert json_ws.sent == [message.to_json()]
+    assert proto_ws.sent == [message.to_proto_bytes()]
+    assert Envelope.from_proto_bytes(proto_ws.sent[0]).payload == {"content": "hi"}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_many_delivers_group_in_order():
+    registry = ClientRegistry()
+    recipients = [_FakeWebSocket() for _ in range(3)]
+    for ws in recipients:
+        await _register(registry, ws)
+
+    messages = [
+        Envelope(type="message", room="science", channel="general", payload={"n": n})
+        for n in range(4)
+    ]
+    report = await registry.broadcast_many(messages, "science", "general")
+
+    assert report.recipients == 3
+    assert report.delivered == 12
+    for ws in recipients:
+        assert [Envelope.from_json(frame).payload["n"] for frame in ws.sent] == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_recipient_snapshot_reused_until_membership_changes():
+    registry = ClientRegistry()
+    first = _FakeWebSocket()
+    first_id = await _register(registry, first)
+
+    snapshot = registry.recipients_for("science", "general")
+    assert isinstance(snapshot, tuple)
+    assert [r.client_id for r in snapshot] == [first_id]
+    await registry.broadcast_to_room_channel(_message(), "science", "general")
+    assert registry.recipients_for("science", "general") is snapshot
+
+    second = _FakeWebSocket()
+    second_id = await _register(registry, second)
+    rebuilt = registry.recipients_for("science", "general")
+    assert rebuilt is not snapshot
+    assert {r.client_id for r in rebuilt} == {first_id, second_id}
+
+    await registry.unregister_client(first_id)
+    assert [r.client_id for r in registry.recipients_for("science", "general")] == [second_id]
+
+
+@pytest.mark.asyncio
+async def test_publishing_to_unknown_rooms_leaves_snapshot_cache_empty():
+    registry = ClientRegistry()
+    for n in range(100):
+        message = Envelope(type="message", room=f"room-{n}", channel=f"chan-{n}", payload={})
+        await registry.broadcast_to_room_channel(message, f"room-{n}", f"chan-{n}")
+    assert registry._recipients == {}
+
+    client_id = await _register(registry, _FakeWebSocket())
+    await registry.broadcast_to_room_channel(_message(), "science", "general")
+    assert list(registry._recipients) == ["science:general"]
+    await registry.unregister_client(client_id)
+    assert registry._recipients == {}
+
+
+@pytest.mark.asyncio
+async def test_recipient_snapshot_follows_wire_format_change():
+    registry = ClientRegistry()
+    ws = _FakeWebSocket()
+    await _register(registry, ws)
+    assert registry.recipients_for("science", "general")[0].wire_format == "json"
+
+    ws._arqon_wire_format = "protobuf"
+    registry.refresh_recipients(ws)
+    assert registry.recipients_for("science", "general")[0].wire_format == "protobuf"
+
+    await registry.broadcast_to_room_channel(_message(), "science", "general")
+    assert isinstance(ws.sent[-1], bytes)
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from arqonbus.routing.client_registry import ClientRegistry
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.open = True
+
+    async def send(self, data):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_reads_and_activity_updates_do_not_wait_on_write_locks():
+    registry = ClientRegistry()
+    client_id = await registry.register_client(_FakeWebSocket(), room="science", channel="general")
+    client = await registry.get_client(client_id)
+    client.last_activity_ts = 0.0
+
+    async with registry._lock_for(client_id):
+        await asyncio.wait_for(registry.update_client_activity(client_id), timeout=0.1)
+        assert await asyncio.wait_for(registry.get_client(client_id), timeout=0.1) is client
+        members = await asyncio.wait_for(
+            registry.get_clients_in_room_channel("science", "general"), timeout=0.1
+        )
+        assert members == [client]
+
+    assert client.last_activity_ts > 0.0
+    assert client.last_activity.year >= 2024
+
+
+@pytest.mark.asyncio
+async def test_membership_snapshots_are_copy_on_write():
+    registry = ClientRegistry()
+    first = await registry.register_client(_FakeWebSocket(), room="science", channel="general")
+    snapshot = registry._room_membership["science"]["general"]
+
+    second = await registry.register_client(_FakeWebSocket(), room="science", channel="general")
+    await registry.leave_room_channel(first, "science", "general")
+
+    assert snapshot == frozenset({first})
+    assert registry._room_membership["science"]["general"] == frozenset({second})
+
+    await registry.unregister_client(second)
+    assert "science" not in registry._room_membership
+
+
+@pytest.mark.asyncio
+async def test_cleanup_disconnected_clients_unregisters_closed_sockets():
+    registry = ClientRegistry()
+    closed = _FakeWebSocket()
+    await registry.register_client(closed, room="science", channel="general")
+    await registry.register_client(_FakeWebSocket(), room="science", channel="general")
+    closed.open = False
+
+    removed = await asyncio.wait_for(registry.cleanup_disconnected_clients(), timeout=1.0)
+
+    assert removed == 1
+    assert len(await registry.get_clients_in_room_channel("science", "general")) == 1
@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from arqonbus.config.config import ArqonBusConfig
+from arqonbus.protocol.envelope import Envelope
+from arqonbus.protocol.ids import generate_message_id
+from arqonbus.transport.websocket_bus import WebSocketBus
+
+
+def _command(command: str, args: dict) -> Envelope:
+    return Envelope(
+        id=generate_message_id(),
+        type="command",
+        command=command,
+        args=args,
+        payload={},
+    )
+
+
+def _make_bus(*, role: str = "user", omega_enabled: bool = False) -> WebSocketBus:
+    config = ArqonBusConfig()
+    config.tier_omega.enabled = omega_enabled
+    registry = MagicMock()
+    registry.get_client = AsyncMock(return_value=SimpleNamespace(metadata={"role": role}))
+    bus = WebSocketBus(client_registry=registry, config=config)
+    bus.send_to_client = AsyncMock(return_value=True)
+    return bus
+
+
+def _response(bus: WebSocketBus) -> Envelope:
+    return bus.send_to_client.call_args.args[1]
+
+
+def test_command_table_declares_requirements():
+    bus = _make_bus()
+    table = bus._command_table
+
+    assert table["history.get"] is table["op.history.get"]
+    assert table["op.omega.vm.launch"].feature == "tier_omega"
+    assert table["op.omega.vm.launch"].admin_action == "launch Tier-Omega VMs"
+    assert table["op.omega.status"].feature is None
+    assert table["op.continuum.projector.backfill"].admin_action is not None
+    assert table["op.store.get"].admin_action is None
+
+
+@pytest.mark.asyncio
+async def test_feature_flag_is_checked_before_admin_role():
+    bus = _make_bus(role="user", omega_enabled=False)
+    await bus._handle_command(_command("op.omega.emit_event", {}), "client-1")
+    response = _response(bus)
+    assert response.status == "error"
+    assert response.error_code == "FEATURE_DISABLED"
+
+    bus = _make_bus(role="user", omega_enabled=True)
+    await bus._handle_command(_command("op.omega.emit_event", {}), "client-1")
+    response = _response(bus)
+    assert response.error_code == "AUTHORIZATION_ERROR"
+    assert "emit Tier-Omega events" in response.payload["message"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_records_latency_and_error_metrics():
+    bus = _make_bus()
+    with patch.object(bus, "_safe_record_histogram") as histogram, patch.object(
+        bus, "_safe_record_counter"
+    ) as counter:
+        await bus._handle_command(_command("op.store.set", {"key": "k", "value": 1}), "client-1")
+        assert _response(bus).status == "success"
+        histogram.assert_called_with(
+            "operator_command_latency_ms", histogram.call_args.args[1], {"command": "op.store.set"}
+        )
+        counter.assert_not_called()
+
+        await bus._handle_command(_command("op.cron.cancel", {"job_id": "missing"}), "client-1")
+        response = _response(bus)
+        assert response.error_code == "NOT_FOUND"
+        assert response.payload["data"] == {"job_id": "missing"}
+        counter.assert_called_with(
+            "operator_command_errors_total",
+            1,
+            {"command": "op.cron.cancel", "error_code": "NOT_FOUND"},
+        )
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from arqonbus.protocol.envelope import Envelope
+from arqonbus.transport.pipeline import ConnectionPipeline
+from arqonbus.transport.websocket_bus import WebSocketBus
+
+
+def _work(log, name, delay=0.0, started=None):
+    async def run():
+        if started is not None:
+            started.append(name)
+        await asyncio.sleep(delay)
+        log.append(name)
+
+    return run
+
+
+@pytest.mark.asyncio
+async def test_same_key_runs_in_order_while_other_keys_overtake():
+    pipeline = ConnectionPipeline(max_in_flight=8)
+    log = []
+    await pipeline.submit("science:general", _work(log, "a1", delay=0.05))
+    await pipeline.submit("science:general", _work(log, "a2"))
+    await pipeline.submit("ops:alerts", _work(log, "b1"))
+    await pipeline.submit(None, _work(log, "cmd"))
+    await pipeline.close()
+
+    assert log.index("a1") < log.index("a2")
+    assert log.index("b1") < log.index("a1")
+    assert log.index("cmd") < log.index("a1")
+    assert pipeline.snapshot()["completed"] == 4
+
+
+@pytest.mark.asyncio
+async def test_submit_waits_for_a_free_slot():
+    changes = []
+    pipeline = ConnectionPipeline(max_in_flight=2, on_change=changes.append)
+    log, started = [], []
+    await pipeline.submit(None, _work(log, "slow1", delay=0.05, started=started))
+    await pipeline.submit(None, _work(log, "slow2", delay=0.05, started=started))
+    assert pipeline.in_flight == 2
+
+    third = asyncio.create_task(pipeline.submit(None, _work(log, "third", started=started)))
+    await asyncio.sleep(0.01)
+    assert not third.done()
+
+    await third
+    await pipeline.close()
+    assert log[-1] == "third"
+    assert pipeline.in_flight == 0
+    assert sum(changes) == 0
+    assert pipeline.stats["max_in_flight_seen"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_frame_does_not_block_its_lane():
+    pipeline = ConnectionPipeline(max_in_flight=4)
+    log = []
+
+    async def boom():
+        raise RuntimeError("boom")
+
+    await pipeline.submit("k", boom)
+    await pipeline.submit("k", _work(log, "after"))
+    await pipeline.close()
+    assert log == ["after"]
+    assert pipeline.stats["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_multi_channel_batch_orders_against_each_of_its_lanes():
+    def frame(*lanes, batch=False):
+        envelopes = [Envelope(type="message", room=room, channel=channel) for room, channel in lanes]
+        return WebSocketBus._ordering_key(([(e, []) for e in envelopes], "json", batch))
+
+    pipeline = ConnectionPipeline(max_in_flight=8)
+    log = []
+    await pipeline.submit(frame(("B", "y")), _work(log, "by1", delay=0.03))
+    await pipeline.submit(frame(("A", "x"), ("B", "y"), batch=True), _work(log, "batch", delay=0.03))
+    await pipeline.submit(frame(("A", "x")), _work(log, "ax2"))
+    await pipeline.submit("C:z", _work(log, "cz"))
+    await pipeline.close()
+
+    assert log.index("by1") < log.index("batch") < log.index("ax2")
+    assert log.index("cz") < log.index("by1")
+    assert pipeline.snapshot()["active_lanes"] == 0
+
+
+def test_ordering_key_by_room_channel():
+    def parsed(*envelopes, batch=False):
+        return [(e, []) for e in envelopes], "json", batch
+
+    message = Envelope(type="message", room="science", channel="general")
+    other = Envelope(type="message", room="ops", channel="alerts")
+    command = Envelope(type="command", command="op.history.replay")
+
+    assert WebSocketBus._ordering_key(parsed(message)) == "science:general"
+    assert WebSocketBus._ordering_key(parsed(command)) is None
+    assert WebSocketBus._ordering_key(parsed(message, message, batch=True)) == "science:general"
+    assert WebSocketBus._ordering_key(parsed(message, other, batch=True)) == {"science:general", "ops:alerts"}
+    assert WebSocketBus._ordering_key(None) is None
@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta, timezone
+
+from arqonbus.transport.continuum import ContinuumDedup, estimate_bytes
+
+T0 = datetime(2026, 2, 20, tzinfo=timezone.utc)
+
+
+def _ts(seconds: int) -> datetime:
+    return T0 + timedelta(seconds=seconds)
+
+
+def test_dedup_window_is_bounded_and_evictions_raise_episode_watermark():
+    dedup = ContinuumDedup(window_size=2)
+    dedup.add("t", "a1", "ep1", "e1", _ts(1))
+    dedup.add("t", "a1", "ep1", "e2", _ts(2))
+    dedup.add("t", "a2", "ep2", "e3", _ts(3))
+
+    assert len(dedup) == 2
+    assert dedup.snapshot()["evicted"] == 1
+    # e1 left the window; its timestamp is now episode ep1's watermark.
+    assert dedup.seen("t", "a1", "ep1", "e1", _ts(1)) is True
+    assert dedup.seen("t", "a1", "ep1", "e-late", _ts(1)) is True
+    assert dedup.seen("t", "a1", "ep1", "e-new", _ts(5)) is False
+    # The watermark is per episode: late events of other episodes still project.
+    assert dedup.seen("t", "a1", "ep-other", "e-late", _ts(0)) is False
+    assert dedup.seen("t", "a2", "ep2", "e-other", _ts(1)) is False
+    assert dedup.approx_bytes() > 0
+
+
+def test_dedup_lookup_refreshes_recency():
+    dedup = ContinuumDedup(window_size=2)
+    dedup.add("t", "a1", "ep1", "e1", _ts(1))
+    dedup.add("t", "a2", "ep2", "e2", _ts(2))
+    assert dedup.seen("t", "a1", "ep1", "e1", _ts(1)) is True
+    dedup.add("t", "a3", "ep3", "e3", _ts(3))
+
+    assert dedup.snapshot()["watermark_episodes"] == 1
+    assert dedup.seen("t", "a2", "ep2", "e2-replay", _ts(2)) is True
+    assert dedup.seen("t", "a1", "ep1", "e1-other", _ts(1)) is False
+
+
+def test_dedup_compares_naive_and_aware_timestamps_as_utc():
+    dedup = ContinuumDedup(window_size=1)
+    dedup.add("t", "a1", "ep1", "e1", _ts(5).replace(tzinfo=None))
+    dedup.add("t", "a1", "ep1", "e2", _ts(6))
+
+    assert dedup.seen("t", "a1", "ep1", "e-late", _ts(4)) is True
+    assert dedup.seen("t", "a1", "ep1", "e-late", _ts(4).replace(tzinfo=None)) is True
+    plus_two = timezone(timedelta(hours=2))
+    assert dedup.seen("t", "a1", "ep1", "e-new", _ts(6).astimezone(plus_two)) is False
+
+
+def test_estimate_bytes_scales_sample_to_count():
+    items = [{"event": {"n": i}} for i in range(4)]
+    assert estimate_bytes(items, 0) == 0
+    assert estimate_bytes(items, 40, sample=4) == 10 * estimate_bytes(items, 4, sample=4)
@@ -1,3 +1,4 @@
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
@@ -34,7 +35,9 @@ class _FakeContinuumBackend:
             "last_event_id": "evt-from-backend",
         }
 
-    async def continuum_projector_list(self, *, limit: int = 100, tenant_id=None, agent_id=None):
+    async def continuum_projector_list(
+        self, *, limit: int = 100, tenant_id=None, agent_id=None, after=None, **tag_filters
+    ):
         return [{"tenant_id": tenant_id or "tenant-a", "agent_id": agent_id or "agent-1", "episode_id": "ep-x"}]
 
     async def continuum_projector_dlq_push(self, reason: str, event: dict):
@@ -42,7 +45,7 @@ class _FakeContinuumBackend:
         self.dlq.append(record)
         return record
 
-    async def continuum_projector_dlq_list(self, *, limit: int = 100):
+    async def continuum_projector_dlq_list(self, *, limit: int = 100, after=None):
         return list(self.dlq)[:limit]
 
     async def continuum_projector_dlq_get(self, dlq_id: str):
@@ -51,7 +54,9 @@ class _FakeContinuumBackend:
     async def continuum_projector_dlq_remove(self, dlq_id: str):
         return True
 
-    async def continuum_projector_events_between(self, *, from_ts, to_ts, tenant_id=None, agent_id=None):
+    async def continuum_projector_events_between(
+        self, *, from_ts, to_ts, tenant_id=None, agent_id=None, limit=None, after=None
+    ):
         return [_event(event_id="evt-bf-db-1"), _event(event_id="evt-bf-db-2")]
 
 
@@ -238,6 +243,7 @@ async def test_backfill_dry_run_and_apply():
                 "from_ts": "2026-02-20T00:00:00+00:00",
                 "to_ts": "2026-02-20T00:00:03+00:00",
                 "dry_run": False,
+                "background": False,
             },
         ),
         "client-1",
@@ -279,6 +285,7 @@ async def test_backfill_uses_backend_event_source_when_available():
                 "from_ts": "2026-02-20T00:00:00+00:00",
                 "to_ts": "2026-02-20T00:00:03+00:00",
                 "dry_run": False,
+                "background": False,
             },
         ),
         "client-1",
@@ -319,3 +326,319 @@ async def test_projector_records_metrics_for_projection_and_dlq_paths():
     assert "continuum_projector_dlq_events_total" in metric_names
     assert any(name == "continuum_projector_dlq_depth" for name, _, _ in gauge_calls)
     assert any(name == "continuum_projector_event_lag_seconds" for name, _, _ in histogram_calls)
+
+
+class _BatchingContinuumBackend(_FakeContinuumBackend):
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+        self.batches = []
+        self.release = asyncio.Event()
+
+    async def continuum_project_events(self, events):
+        await self.release.wait()
+        self.batches.append([event["event_id"] for event in events])
+        return [await self.continuum_project_event(event) for event in events]
+
+    async def continuum_projector_events_between(
+        self, *, from_ts, to_ts, tenant_id=None, agent_id=None, limit=None, after=None
+    ):
+        return list(self.events)
+
+
+@pytest.mark.asyncio
+async def test_backfill_runs_in_background_in_agent_ordered_chunks():
+    bus = _make_bus(role="admin")
+    events = [
+        _event(event_id=f"evt-{agent}-{n}", agent_id=agent, episode_id=f"ep-{agent}")
+        for n in range(3)
+        for agent in ("agent-1", "agent-2")
+    ]
+    fake_backend = _BatchingContinuumBackend(events)
+    bus.storage = SimpleNamespace(backend=fake_backend)
+
+    await bus._handle_command(
+        _command(
+            "op.continuum.projector.backfill",
+            {
+                "from_ts": "2026-02-20T00:00:00+00:00",
+                "to_ts": "2026-02-20T00:00:03+00:00",
+                "chunk_size": 2,
+                "parallelism": 2,
+            },
+        ),
+        "client-1",
+    )
+    started = _response_data(bus)
+    assert started["status"] == "running"
+
+    fake_backend.release.set()
+    await asyncio.wait_for(asyncio.gather(*bus._continuum_backfill_tasks.values()), timeout=1.0)
+
+    await bus._handle_command(
+        _command("op.continuum.projector.backfill.status", {"job_id": started["job_id"]}),
+        "client-1",
+    )
+    status = _response_data(bus)
+    assert status["status"] == "completed"
+    assert status["processed"] == 6
+    assert status["projected"] == 6
+    assert status["agent_lanes"] == 2
+    assert sorted(fake_backend.batches) == [
+        ["evt-agent-1-0", "evt-agent-1-1"],
+        ["evt-agent-1-2"],
+        ["evt-agent-2-0", "evt-agent-2-1"],
+        ["evt-agent-2-2"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_backfill_status_unknown_job_is_not_found():
+    bus = _make_bus(role="admin")
+    await bus._handle_command(
+        _command("op.continuum.projector.backfill.status", {"job_id": "backfill_missing"}),
+        "client-1",
+    )
+    response = bus.send_to_client.call_args.args[1]
+    assert response.status == "error"
+    assert response.error_code == "NOT_FOUND"
+
+
+@pytest.mark.asyncio
+async def test_memory_projector_bounds_dedup_and_event_log():
+    cfg = ArqonBusConfig()
+    cfg.continuum.dedup_window_size = 2
+    cfg.continuum.event_log_size = 3
+    registry = MagicMock()
+    registry.get_client = AsyncMock(return_value=SimpleNamespace(metadata={"role": "admin"}))
+    bus = WebSocketBus(client_registry=registry, config=cfg)
+    bus.send_to_client = AsyncMock(return_value=True)
+
+    for n in range(5):
+        event = _event(event_id=f"evt-{n}", episode_id=f"ep-{n}", source_ts=f"2026-02-20T00:00:0{n}+00:00")
+        await bus._handle_command(_command("op.continuum.projector.project_event", {"event": event}), "client-1")
+        assert _response_data(bus)["status"] == "projected"
+
+    # evt-0 fell out of the ID window but is still below ep-0's watermark.
+    replay = _event(event_id="evt-0", episode_id="ep-0", source_ts="2026-02-20T00:00:00+00:00")
+    await bus._handle_command(_command("op.continuum.projector.project_event", {"event": replay}), "client-1")
+    assert _response_data(bus)["status"] == "duplicate"
+
+    await bus._handle_command(_command("op.continuum.projector.status", {}), "client-1")
+    status = _response_data(bus)
+    assert status["seen_event_count"] == 2
+    assert status["event_log_count"] == 3
+    assert status["event_log_capacity"] == 3
+    assert status["dedup"]["evicted"] == 3
+    components = {key: value for key, value in status["memory_bytes"].items() if key != "total"}
+    assert set(components) == {"dedup", "event_log", "projection", "tag_index"}
+    assert status["memory_bytes"]["total"] == sum(components.values())
+    assert status["memory_bytes"]["event_log"] > 0
+
+
+def test_continuum_config_loads_from_environment_and_validates(monkeypatch):
+    monkeypatch.setenv("ARQONBUS_CONTINUUM_DEDUP_WINDOW_SIZE", "500")
+    monkeypatch.setenv("ARQONBUS_CONTINUUM_EVENT_LOG_SIZE", "50")
+
+    cfg = ArqonBusConfig.from_environment()
+
+    assert cfg.continuum.dedup_window_size == 500
+    assert cfg.continuum.event_log_size == 50
+    assert cfg.to_dict()["continuum"] == {
+        "dedup_window_size": 500,
+        "event_log_size": 50,
+        "change_feed_window_ms": 100.0,
+    }
+
+    cfg.continuum.event_log_size = 0
+    assert "Continuum event_log_size must be >= 1" in cfg.validate()
+
+
+@pytest.mark.asyncio
+async def test_memory_list_and_dlq_paginate_with_cursors():
+    bus = _make_bus(role="admin")
+    for n in range(5):
+        event = _event(event_id=f"evt-page-{n}", episode_id=f"ep-page-{n}")
+        await bus._handle_command(_command("op.continuum.projector.project_event", {"event": event}), "client-1")
+        bad = _event(event_id=f"evt-page-bad-{n}")
+        bad["payload"].pop("content_ref")
+        await bus._handle_command(_command("op.continuum.projector.project_event", {"event": bad}), "client-1")
+
+    for command, id_field in (
+        ("op.continuum.projector.list", "episode_id"),
+        ("op.continuum.projector.dlq.list", "dlq_id"),
+    ):
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            args = {"limit": 2}
+            if cursor:
+                args["cursor"] = cursor
+            await bus._handle_command(_command(command, args), "client-1")
+            page = _response_data(bus)
+            seen.extend(item[id_field] for item in page["items"])
+            pages += 1
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        assert len(seen) == len(set(seen)) == 5
+        assert pages == 3
+        if command.endswith("dlq.list"):
+            # Newest first, in both memory and Postgres modes.
+            queued = sorted(bus._continuum_dlq, key=lambda r: (r["queued_at"], r["dlq_id"]), reverse=True)
+            assert seen == [record["dlq_id"] for record in queued]
+
+    await bus._handle_command(
+        _command("op.continuum.projector.list", {"cursor": "not-a-cursor"}),
+        "client-1",
+    )
+    response = bus.send_to_client.call_args.args[1]
+    assert response.status == "error"
+    assert response.error_code == "VALIDATION_ERROR"
+
+
+@pytest.mark.asyncio
+async def test_memory_list_filters_by_tags_and_attributes_through_index():
+    bus = _make_bus(role="admin")
+    specs = [
+        ("ep-1", ["red", "big"], {"tier": "gold"}),
+        ("ep-2", ["red"], {"tier": "silver"}),
+        ("ep-3", ["blue", "big"], {"tier": "gold"}),
+    ]
+    for n, (episode_id, tags, metadata) in enumerate(specs):
+        event = _event(event_id=f"evt-tag-{n}", episode_id=episode_id)
+        event["payload"]["tags"] = tags
+        event["payload"]["metadata"] = metadata
+        await bus._handle_command(_command("op.continuum.projector.project_event", {"event": event}), "client-1")
+
+    # Re-projecting ep-2 moves it out of "red" and into "blue".
+    update = _event(event_id="evt-tag-3", episode_id="ep-2", source_ts="2026-02-20T00:00:09+00:00")
+    update["payload"]["tags"] = ["blue"]
+    update["payload"]["metadata"] = {"tier": "silver"}
+    await bus._handle_command(_command("op.continuum.projector.project_event", {"event": update}), "client-1")
+
+    async def episodes(args):
+        await bus._handle_command(_command("op.continuum.projector.list", args), "client-1")
+        return sorted(item["episode_id"] for item in _response_data(bus)["items"])
+
+    assert await episodes({"tags_all": ["red", "big"]}) == ["ep-1"]
+    assert await episodes({"tags_any": ["red", "blue"]}) == ["ep-1", "ep-2", "ep-3"]
+    assert await episodes({"tags_all": ["big"], "tags_any": ["blue"]}) == ["ep-3"]
+    assert await episodes({"tags_all": "red"}) == ["ep-1"]
+    assert await episodes({"attributes": {"tier": "gold"}, "tags_any": ["blue"]}) == ["ep-3"]
+    assert await episodes({"tags_all": ["missing"]}) == []
+
+    await bus._handle_command(_command("op.continuum.projector.status", {}), "client-1")
+    assert _response_data(bus)["tag_index"]["indexed_projections"] == 3
+
+
+def _deltas(bus: WebSocketBus) -> list:
+    return [
+        call.args[1].payload["continuum_delta"]
+        for call in bus.send_to_client.call_args_list
+        if "continuum_delta" in (call.args[1].payload or {})
+    ]
+
+
+@pytest.mark.asyncio
+async def test_change_feed_pushes_coalesced_deltas_per_agent():
+    bus = _make_bus(role="admin")
+    bus._continuum_feed.window_ms = 20.0
+    await bus._handle_command(
+        _command("op.continuum.projector.subscribe", {"agent_id": "agent-1"}),
+        "client-1",
+    )
+    assert _response_data(bus)["source"] == "in_process"
+
+    for event in (
+        _event(event_id="evt-f1", episode_id="ep-a", source_ts="2026-02-20T00:00:01+00:00"),
+        _event(event_id="evt-f2", episode_id="ep-a", source_ts="2026-02-20T00:00:02+00:00"),
+        _event(event_id="evt-f3", episode_id="ep-b"),
+        _event(event_id="evt-f4", agent_id="agent-2"),
+    ):
+        await bus._handle_command(_command("op.continuum.projector.project_event", {"event": event}), "client-1")
+    assert _deltas(bus) == []
+
+    await asyncio.sleep(0.05)
+    deltas = _deltas(bus)
+    assert len(deltas) == 1
+    assert deltas[0]["agent_id"] == "agent-1"
+    assert sorted((c["episode_id"], c["last_event_id"]) for c in deltas[0]["changes"]) == [
+        ("ep-a", "evt-f2"),
+        ("ep-b", "evt-f3"),
+    ]
+    assert bus._continuum_feed.snapshot()["coalesced"] == 1
+
+    await bus._handle_command(_command("op.continuum.projector.unsubscribe", {}), "client-1")
+    assert _response_data(bus)["unsubscribed"] is True
+
+
+class _ListeningContinuumBackend(_FakeContinuumBackend):
+    def __init__(self):
+        super().__init__()
+        self.listener = None
+        self.on_lost = None
+        self.listens = 0
+        self.stopped = False
+
+    async def continuum_listen(self, callback, on_lost=None):
+        self.listener = callback
+        self.on_lost = on_lost
+        self.listens += 1
+
+        async def stop():
+            self.stopped = True
+
+        return stop
+
+
+@pytest.mark.asyncio
+async def test_change_feed_uses_backend_notifications_when_available():
+    bus = _make_bus(role="admin")
+    bus._continuum_feed.window_ms = 0.0
+    fake_backend = _ListeningContinuumBackend()
+    bus.storage = SimpleNamespace(backend=fake_backend)
+
+    await bus._handle_command(_command("op.continuum.projector.subscribe", {}), "client-1")
+    assert _response_data(bus)["source"] == "postgres_notify"
+
+    # Projections written by this bus arrive through the backend like any other.
+    await bus._handle_command(
+        _command("op.continuum.projector.project_event", {"event": _event(event_id="evt-n1")}),
+        "client-1",
+    )
+    await asyncio.sleep(0.01)
+    assert _deltas(bus) == []
+
+    fake_backend.listener({"tenant_id": "tenant-a", "agent_id": "agent-9", "episode_id": "ep-n"})
+    await asyncio.sleep(0.01)
+    assert [d["agent_id"] for d in _deltas(bus)] == ["agent-9"]
+
+    await bus._close_continuum_feed()
+    assert fake_backend.stopped is True
+
+
+@pytest.mark.asyncio
+async def test_change_feed_falls_back_in_process_and_relistens_after_connection_loss(monkeypatch):
+    monkeypatch.setattr("arqonbus.transport.websocket_bus._CONTINUUM_RELISTEN_BACKOFF", 0.02)
+    bus = _make_bus(role="admin")
+    bus._continuum_feed.window_ms = 0.0
+    fake_backend = _ListeningContinuumBackend()
+    bus.storage = SimpleNamespace(backend=fake_backend)
+    await bus._handle_command(_command("op.continuum.projector.subscribe", {}), "client-1")
+
+    fake_backend.on_lost()
+    assert bus._continuum_unlisten is None
+    await bus._handle_command(
+        _command("op.continuum.projector.project_event", {"event": _event(event_id="evt-l1")}),
+        "client-1",
+    )
+    await asyncio.sleep(0.01)
+    assert [d["agent_id"] for d in _deltas(bus)] == ["agent-1"]
+
+    await asyncio.sleep(0.05)
+    assert fake_backend.listens == 2
+    assert bus._continuum_unlisten is not None
+
+    await bus._close_continuum_feed()
@@ -111,3 +111,117 @@ async def test_history_replay_returns_chronological_entries():
     assert response.status == "success"
     data = response.payload["data"]
     assert [entry["envelope"]["payload"]["idx"] for entry in data["entries"]] == [1, 2, 3]
+
+
+async def _store_sequence(bus: WebSocketBus, now: datetime, sequences: list[int]) -> None:
+    for idx, sequence in enumerate(sequences, start=1):
+        await bus.storage.store_message(
+            Envelope(
+                id=f"arq_1700000000000000000_{idx}_s{idx:05d}",
+                type="message",
+                timestamp=now + timedelta(seconds=idx),
+                room="ops",
+                channel="events",
+                payload={"idx": idx},
+                metadata={"sequence": sequence},
+            )
+        )
+
+
+def _sent(bus: WebSocketBus) -> list[Envelope]:
+    return [call.args[1] for call in bus.send_to_client.call_args_list]
+
+
+def _replay_args(now: datetime, **extra) -> dict:
+    return {
+        "room": "ops",
+        "channel": "events",
+        "from_ts": (now - timedelta(seconds=1)).isoformat(),
+        "to_ts": (now + timedelta(minutes=1)).isoformat(),
+        "stream": True,
+        **extra,
+    }
+
+
+@pytest.mark.asyncio
+async def test_history_replay_streams_chunks_then_summary():
+    bus = _make_bus(role="admin")
+    now = datetime.now(timezone.utc)
+    await _store_sequence(bus, now, [1, 2, 3, 4, 5])
+
+    command = _command("op.history.replay", _replay_args(now, chunk_size=2))
+    await bus._handle_command(command, "client-1")
+
+    *chunks, summary = _sent(bus)
+    assert [frame.status for frame in chunks] == ["pending"] * 3
+    assert all(frame.request_id == command.id for frame in chunks)
+    assert [frame.payload["data"]["chunk"] for frame in chunks] == [1, 2, 3]
+    replayed = [entry["envelope"]["payload"]["idx"] for frame in chunks for entry in frame.payload["data"]["entries"]]
+    assert replayed == [1, 2, 3, 4, 5]
+    assert chunks[-1].payload["data"]["cursor"] is None
+
+    assert summary.status == "success"
+    data = summary.payload["data"]
+    assert data["stream"] is True
+    assert (data["chunks"], data["count"], data["complete"], data["next_cursor"]) == (3, 5, True, None)
+    assert "entries" not in data
+
+
+@pytest.mark.asyncio
+async def test_history_replay_stream_pauses_at_max_chunks_and_resumes_from_cursor():
+    bus = _make_bus(role="admin")
+    now = datetime.now(timezone.utc)
+    await _store_sequence(bus, now, [1, 2, 3, 4, 5])
+
+    await bus._handle_command(_command("op.history.replay", _replay_args(now, chunk_size=2, max_chunks=1)), "client-1")
+    *chunks, summary = _sent(bus)
+    assert len(chunks) == 1
+    assert summary.payload["data"]["complete"] is False
+    cursor = summary.payload["data"]["next_cursor"]
+    assert cursor == chunks[0].payload["data"]["cursor"]
+
+    bus.send_to_client.reset_mock()
+    await bus._handle_command(_command("op.history.replay", _replay_args(now, chunk_size=2, cursor=cursor)), "client-1")
+    *chunks, summary = _sent(bus)
+    replayed = [entry["envelope"]["payload"]["idx"] for frame in chunks for entry in frame.payload["data"]["entries"]]
+    assert replayed == [3, 4, 5]
+    assert summary.payload["data"]["complete"] is True
+
+
+@pytest.mark.asyncio
+async def test_history_replay_stream_checks_sequence_across_chunks_and_cursors():
+    bus = _make_bus(role="admin")
+    now = datetime.now(timezone.utc)
+    await _store_sequence(bus, now, [1, 5, 2])
+
+    await bus._handle_command(_command("op.history.replay", _replay_args(now, chunk_size=2, max_chunks=1)), "client-1")
+    cursor = _response(bus).payload["data"]["next_cursor"]
+
+    bus.send_to_client.reset_mock()
+    await bus._handle_command(_command("op.history.replay", _replay_args(now, chunk_size=2, cursor=cursor)), "client-1")
+    response = _response(bus)
+    assert response.status == "error"
+    assert response.error_code == "VALIDATION_ERROR"
+    assert "Sequence regression" in response.payload["message"]
+
+
+@pytest.mark.asyncio
+async def test_history_get_stream_is_newest_first_and_rejects_foreign_cursor():
+    bus = _make_bus(role="admin")
+    now = datetime.now(timezone.utc)
+    await _store_sequence(bus, now, [1, 2, 3])
+
+    args = {"room": "ops", "channel": "events", "stream": True, "chunk_size": 2}
+    await bus._handle_command(_command("op.history.get", args), "client-1")
+    *chunks, summary = _sent(bus)
+    returned = [entry["envelope"]["payload"]["idx"] for frame in chunks for entry in frame.payload["data"]["entries"]]
+    assert returned == [3, 2, 1]
+    assert summary.payload["data"]["count"] == 3
+
+    bus.send_to_client.reset_mock()
+    await bus._handle_command(_command("op.history.replay", _replay_args(now, chunk_size=2, max_chunks=1)), "client-1")
+    replay_cursor = _response(bus).payload["data"]["next_cursor"]
+    await bus._handle_command(_command("op.history.get", {**args, "cursor": replay_cursor}), "client-1")
+    response = _response(bus)
+    assert response.status == "error"
+    assert response.error_code == "VALIDATION_ERROR"
@@ -0,0 +1,112 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from arqonbus.config.config import ArqonBusConfig
+from arqonbus.protocol.envelope import Envelope
+from arqonbus.protocol.protobuf_codec import envelope_batch_to_proto_bytes
+from arqonbus.protocol.validator import EnvelopeValidator, ValidationError
+from arqonbus.storage.interface import StorageResult
+from arqonbus.transport.websocket_bus import WebSocketBus
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.open = True
+        self.sent = []
+
+    async def send(self, data):
+        self.sent.append(data)
+
+
+def _message(n: int, room: str = "science", channel: str = "general") -> Envelope:
+    return Envelope(
+        id=f"arq_1700000000000000000_{n}_abcdef",
+        type="message",
+        room=room,
+        channel=channel,
+        payload={"n": n},
+    )
+
+
+def test_json_array_is_parsed_in_one_pass_with_per_item_errors():
+    frame = json.dumps([_message(1).to_dict(), "not-an-envelope", {**_message(2).to_dict(), "id": "bad"}])
+    items, wire_format, is_batch = EnvelopeValidator.validate_and_parse_wire_frame(frame)
+
+    assert (wire_format, is_batch) == ("json", True)
+    assert items[0][0].payload == {"n": 1} and items[0][1] == []
+    assert items[1][0] is None and items[1][1]
+    assert "Invalid message ID format: bad" in items[2][1]
+
+    with pytest.raises(ValidationError):
+        EnvelopeValidator.validate_and_parse_wire(frame)
+
+
+def test_protobuf_batch_is_distinguished_from_single_envelope():
+    batch = envelope_batch_to_proto_bytes([_message(1), _message(2)])
+    items, wire_format, is_batch = EnvelopeValidator.validate_and_parse_wire_frame(batch)
+    assert (wire_format, is_batch) == ("protobuf", True)
+    assert [envelope.payload for envelope, _ in items] == [{"n": 1}, {"n": 2}]
+
+    single = _message(3).to_proto_bytes()
+    envelope, errors, wire_format = EnvelopeValidator.validate_and_parse_wire(single)
+    assert (envelope.payload, errors, wire_format) == ({"n": 3}, [], "protobuf")
+
+
+@pytest.mark.asyncio
+async def test_batch_frame_bulk_stores_groups_fanout_and_reports_once():
+    config = ArqonBusConfig()
+    config.casil.enabled = False
+    config.storage.enable_persistence = True
+    storage = MagicMock()
+    storage.store_messages = AsyncMock(
+        side_effect=lambda envelopes: [StorageResult(success=True, message_id=e.id) for e in envelopes]
+    )
+    registry = MagicMock()
+    registry.broadcast_many = AsyncMock()
+    registry.update_client_activity = AsyncMock()
+    bus = WebSocketBus(client_registry=registry, storage=storage, config=config)
+    ws = _FakeWebSocket()
+
+    frame = json.dumps(
+        [
+            _message(1).to_dict(),
+            _message(2, room="ops", channel="alerts").to_dict(),
+            {**_message(3).to_dict(), "type": "command", "command": "op.store.list"},
+            _message(4).to_dict(),
+        ]
+    )
+    await bus._handle_message_from_client("client-1", ws, frame)
+
+    storage.store_messages.assert_awaited_once()
+    assert [e.id for e in storage.store_messages.call_args.args[0]] == [
+        _message(n).id for n in (1, 2, 4)
+    ]
+    groups = {
+        (call.args[1], call.args[2]): [e.payload["n"] for e in call.args[0]]
+        for call in registry.broadcast_many.await_args_list
+    }
+    assert groups == {("science", "general"): [1, 4], ("ops", "alerts"): [2]}
+
+    assert len(ws.sent) == 1
+    response = json.loads(ws.sent[0])
+    assert response["payload"]["accepted"] == 3
+    assert response["payload"]["rejected"] == 1
+    assert response["payload"]["errors"][0]["index"] == 2
+    assert bus._stats["messages_processed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_oversized_batch_is_rejected():
+    config = ArqonBusConfig()
+    config.casil.enabled = False
+    config.websocket.max_batch_size = 2
+    bus = WebSocketBus(client_registry=MagicMock(), config=config)
+    ws = _FakeWebSocket()
+
+    frame = json.dumps([_message(n).to_dict() for n in range(3)])
+    await bus._handle_message_from_client("client-1", ws, frame)
+
+    response = json.loads(ws.sent[0])
+    assert response["error_code"] == "BATCH_SIZE_ERROR"
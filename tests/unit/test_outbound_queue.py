@@ -0,0 +1,268 @@
+import asyncio
+
+import pytest
+
+from arqonbus.protocol.envelope import Envelope
+from arqonbus.routing.client_registry import ClientRegistry
+from arqonbus.routing.outbound import OutboundQueue, parse_overflow_policies
+
+
+class _BlockedWebSocket:
+    """WebSocket whose sends stay pending until released."""
+
+    def __init__(self):
+        self.open = True
+        self.sent = []
+        self.closed_with = None
+        self.release = asyncio.Event()
+
+    async def send(self, data):
+        await self.release.wait()
+        self.sent.append(data)
+
+    async def close(self, code=1000, reason=""):
+        self.closed_with = (code, reason)
+        self.open = False
+
+
+async def _drain(queue: OutboundQueue):
+    for _ in range(50):
+        if len(queue) == 0:
+            break
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_and_drop_newest_keep_queue_bounded():
+    ws = _BlockedWebSocket()
+    queue = OutboundQueue("c1", ws, maxsize=2)
+    queue.start()
+    await asyncio.sleep(0)
+
+    # First frame is picked up by the writer and blocks in send().
+    assert queue.put("f0") == "queued"
+    await asyncio.sleep(0)
+    assert queue.put("f1") == "queued"
+    assert queue.put("f2") == "queued"
+    assert queue.put("f3", policy="drop_oldest") == "queued"
+    assert queue.put("f4", policy="drop_newest") == "dropped"
+    assert len(queue) == 2
+    assert queue.stats["dropped"] == 2
+
+    ws.release.set()
+    await _drain(queue)
+    await asyncio.sleep(0)
+    assert ws.sent == ["f0", "f2", "f3"]
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_coalesce_replaces_frame_for_same_key():
+    ws = _BlockedWebSocket()
+    queue = OutboundQueue("c1", ws, maxsize=2)
+    queue.put("a1", key="r:a")
+    queue.put("b1", key="r:b")
+    assert queue.put("a2", key="r:a", policy="coalesce") == "coalesced"
+    assert len(queue) == 2
+
+    ws.release.set()
+    queue.start()
+    await _drain(queue)
+    await asyncio.sleep(0)
+    assert ws.sent == ["a2", "b1"]
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_closes_connection_on_overflow():
+    ws = _BlockedWebSocket()
+    queue = OutboundQueue("c1", ws, maxsize=1)
+    queue.put("f1")
+    assert queue.put("f2", policy="disconnect") == "disconnected"
+    await asyncio.sleep(0)
+    assert queue.closed is True
+    assert ws.closed_with[0] == 1013
+    assert queue.put("f3") == "dropped"
+
+
+@pytest.mark.asyncio
+async def test_registry_broadcast_does_not_wait_for_stalled_socket():
+    registry = ClientRegistry(
+        outbound_queue_size=4,
+        overflow_policies={"science:general": "drop_newest"},
+    )
+    stalled = _BlockedWebSocket()
+    client_id = await registry.register_client(stalled, room="science", channel="general")
+
+    for _ in range(6):
+        envelope = Envelope(type="message", room="science", channel="general", payload={"n": 1})
+        await asyncio.wait_for(
+            registry.broadcast_to_room_channel(envelope, "science", "general"),
+            timeout=0.5,
+        )
+
+    client = await registry.get_client(client_id)
+    assert len(client.outbox) <= 4
+    assert registry.last_broadcast.dropped == 1
+    stats = await registry.get_stats()
+    assert stats["outbound"]["dropped"] >= 1
+
+    await registry.unregister_client(client_id)
+    assert client.outbox.closed is True
+
+
+@pytest.mark.asyncio
+async def test_wait_for_room_blocks_until_writer_drains():
+    ws = _BlockedWebSocket()
+    queue = OutboundQueue("c1", ws, maxsize=4)
+    queue.start()
+    await asyncio.sleep(0)
+    for n in range(4):
+        queue.put(f"f{n}")
+    await asyncio.sleep(0)
+
+    waiter = asyncio.create_task(queue.wait_for_room())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    ws.release.set()
+    assert await asyncio.wait_for(waiter, timeout=0.5) is True
+    assert len(queue) <= 2
+
+    await queue.close()
+    for n in range(4):
+        queue.put(f"g{n}")
+    assert await queue.wait_for_room(high_water=0) is False
+
+
+@pytest.mark.asyncio
+async def test_control_frames_wait_for_room_and_are_never_evicted():
+    ws = _BlockedWebSocket()
+    queue = OutboundQueue("c1", ws, maxsize=2)
+
+    assert await queue.put_control("response") == "queued"
+    assert queue.put("f1", key="r:c", policy="coalesce") == "queued"
+    # Overflow evicts data frames only, whatever the policy.
+    assert queue.put("f2", policy="drop_oldest") == "queued"
+    assert queue.put("f3", key="x:y", policy="coalesce") == "queued"
+    assert [frame for frame, _, _ in queue._items] == ["response", "f3"]
+
+    # A full queue holds the next response back until the writer drains.
+    control = asyncio.create_task(queue.put_control("error"))
+    await asyncio.sleep(0)
+    assert not control.done()
+
+    ws.release.set()
+    queue.start()
+    assert await asyncio.wait_for(control, 1.0) == "queued"
+    await _drain(queue)
+    await asyncio.sleep(0)
+    assert ws.sent == ["response", "f3", "error"]
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_control_frames_never_overrun_maxsize():
+    ws = _BlockedWebSocket()
+    queue = OutboundQueue("c1", ws, maxsize=2)
+    queue.put("f0")
+    queue.put("f1")
+    waiters = [asyncio.create_task(queue.put_control(f"r{i}")) for i in range(4)]
+    await asyncio.sleep(0)
+
+    depths = []
+    queue._items.popleft()
+    queue._items.popleft()
+    queue._drained.set()
+    for _ in range(4):
+        await asyncio.sleep(0)
+        depths.append(len(queue))
+        if len(queue):
+            queue._items.popleft()
+            queue._drained.set()
+
+    assert all(waiter.done() for waiter in waiters)
+    assert max(depths) <= queue.maxsize
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_queue_depth_gauge_sums_all_connections(monkeypatch):
+    from arqonbus.routing import outbound
+
+    gauges = {}
+    monkeypatch.setattr(outbound, "record_gauge", lambda name, value, labels=None: gauges.__setitem__(name, value))
+    monkeypatch.setattr(OutboundQueue, "_depth_total", 0)
+    first = OutboundQueue("c1", _BlockedWebSocket(), maxsize=8)
+    second = OutboundQueue("c2", _BlockedWebSocket(), maxsize=8)
+    for frame in ("a", "b", "c"):
+        first.put(frame)
+    second.put("d")
+
+    first._record_batch(0.0)
+    second._record_batch(0.0)
+    assert gauges["outbound_queue_depth"] == 4.0
+
+    first._items.clear()
+    first._record_batch(0.0)
+    assert gauges["outbound_queue_depth"] == 1.0
+    await first.close()
+    await second.close()
+
+
+def test_parse_overflow_policies():
+    assert parse_overflow_policies("science:general=coalesce, ops:*=drop-newest") == {
+        "science:general": "coalesce",
+        "ops:*": "drop_newest",
+    }
+    with pytest.raises(ValueError):
+        parse_overflow_policies("science:general=explode")
+
+
+def test_routing_coordinator_applies_outbound_config():
+    from arqonbus.config.config import ArqonBusConfig
+    from arqonbus.routing.router import RoutingCoordinator
+
+    config = ArqonBusConfig()
+    config.websocket.send_timeout_seconds = 2.5
+    config.websocket.outbound_queue_size = 32
+    config.websocket.outbound_overflow_policy = "drop_newest"
+    config.websocket.outbound_overflow_policies = {"science:*": "coalesce"}
+
+    registry = RoutingCoordinator(config).client_registry
+
+    assert registry.send_timeout == 2.5
+    assert registry.outbound_queue_size == 32
+    assert registry.overflow_policy_for("lobby", "general") == "drop_newest"
+    assert registry.overflow_policy_for("science", "general") == "coalesce"
+
+
+@pytest.mark.asyncio
+async def test_server_entrypoint_enables_configured_outbound_queues(monkeypatch):
+    server_module = pytest.importorskip("arqonbus.server")
+    from arqonbus.transport.websocket_bus import WebSocketBus
+
+    monkeypatch.setenv("ARQONBUS_STORAGE_BACKEND", "memory")
+    monkeypatch.setenv("ARQONBUS_OUTBOUND_QUEUE_SIZE", "16")
+    monkeypatch.setenv("ARQONBUS_OUTBOUND_OVERFLOW_POLICY", "disconnect")
+    monkeypatch.setenv("ARQONBUS_SEND_TIMEOUT_SECONDS", "1.5")
+
+    async def start_server(self):
+        self.running = True
+
+    monkeypatch.setattr(WebSocketBus, "start_server", start_server)
+    server = server_module.ArqonBusServer()
+    await server.start()
+    try:
+        registry = server.ws_bus.client_registry
+        assert registry.outbound_queue_size == 16
+        assert registry.overflow_policy == "disconnect"
+        assert registry.send_timeout == 1.5
+
+        ws = _BlockedWebSocket()
+        await registry.register_client(ws)
+        assert isinstance(registry.outbox_for(ws), OutboundQueue)
+        assert registry.outbox_for(ws).maxsize == 16
+    finally:
+        server.ws_bus = None
+        await server.stop()
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
@@ -19,6 +20,20 @@ class _Acquire:
         return False
 
 
+class _Transaction:
+    def __init__(self):
+        self.entered = 0
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        self.entered += 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
 class _Pool:
     def __init__(self, conn):
         self._conn = conn
@@ -55,7 +70,10 @@ async def test_postgres_create_strict_fails_when_dependency_missing(monkeypatch)
 async def test_postgres_create_and_append_success(monkeypatch):
     from arqonbus.storage import postgres as pg_mod
 
-    conn = SimpleNamespace(execute=AsyncMock(return_value="INSERT 0 1"))
+    conn = SimpleNamespace(
+        execute=AsyncMock(return_value="CREATE TABLE"),
+        fetch=AsyncMock(return_value=[{"message_id": "msg-1"}]),
+    )
     pool = _Pool(conn)
     create_pool = AsyncMock(return_value=pool)
     monkeypatch.setattr(pg_mod, "POSTGRES_AVAILABLE", True)
@@ -77,7 +95,8 @@ async def test_postgres_create_and_append_success(monkeypatch):
 
     assert result.success is True
     assert result.message_id == "msg-1"
-    assert conn.execute.await_count >= 2  # schema + insert
+    assert conn.execute.await_count >= 1  # schema
+    assert conn.fetch.await_count == 1  # multi-row insert
 
 
 @pytest.mark.asyncio
@@ -94,3 +113,392 @@ async def test_postgres_strict_runtime_failure_raises(monkeypatch):
         await PostgresStorageBackend.create(
             {"postgres_url": "postgresql://localhost:5432/arqonbus", "storage_mode": "strict"}
         )
+
+
+def _backend_with_conn(conn, **kwargs) -> PostgresStorageBackend:
+    return PostgresStorageBackend(
+        postgres_url="postgresql://localhost:5432/arqonbus",
+        storage_mode="strict",
+        pool=_Pool(conn),
+        **kwargs,
+    )
+
+
+def _message(message_id: str) -> Envelope:
+    return Envelope(id=message_id, type="message", room="room-a", channel="channel-a", payload={})
+
+
+@pytest.mark.asyncio
+async def test_postgres_concurrent_appends_share_one_insert():
+    async def fetch(query, ids, *columns):
+        return [{"message_id": message_id} for message_id in ids if message_id != "msg-2"]
+
+    conn = SimpleNamespace(fetch=AsyncMock(side_effect=fetch))
+    backend = _backend_with_conn(conn, batch_max_size=10)
+
+    results = await asyncio.gather(*(backend.append(_message(f"msg-{i}")) for i in range(5)))
+
+    assert [r.message_id for r in results] == [f"msg-{i}" for i in range(5)]
+    assert all(r.success for r in results)
+    assert results[2].metadata == {"duplicate": True}
+    assert conn.fetch.await_count == 1
+    assert len(conn.fetch.await_args.args[1]) == 5
+
+
+@pytest.mark.asyncio
+async def test_postgres_append_many_chunks_by_batch_size():
+    async def fetch(query, ids, *columns):
+        return [{"message_id": message_id} for message_id in ids]
+
+    conn = SimpleNamespace(fetch=AsyncMock(side_effect=fetch))
+    backend = _backend_with_conn(conn, batch_max_size=2)
+
+    results = await backend.append_many([_message(f"msg-{i}") for i in range(5)])
+
+    assert len(results) == 5
+    assert [len(call.args[1]) for call in conn.fetch.await_args_list] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_postgres_batched_append_failure_reaches_every_caller():
+    conn = SimpleNamespace(fetch=AsyncMock(side_effect=Exception("write failed")))
+    backend = _backend_with_conn(conn, batch_max_size=10)
+
+    results = await asyncio.gather(
+        *(backend.append(_message(f"msg-{i}")) for i in range(3)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_postgres_partition_maintenance_creates_ahead_and_drops_expired():
+    executed = []
+
+    async def execute(query, *args):
+        executed.append(query)
+        return "OK"
+
+    conn = SimpleNamespace(
+        execute=AsyncMock(side_effect=execute),
+        fetchval=AsyncMock(return_value=None),
+        fetch=AsyncMock(
+            return_value=[
+                {"name": "arqonbus_message_history_default"},
+                {"name": "arqonbus_message_history_p20260101"},
+                {"name": "arqonbus_message_history_p20260110"},
+            ]
+        ),
+    )
+    backend = _backend_with_conn(conn, partitioning="daily", retention_hours=48, partition_premake=2)
+    await backend._ensure_schema()
+
+    assert any("PARTITION BY RANGE (stored_at)" in query for query in executed)
+    assert any("CREATE TABLE IF NOT EXISTS arqonbus_message_ids" in query for query in executed)
+    executed.clear()
+    result = await backend.maintain_partitions(now=datetime(2026, 1, 10, 12, tzinfo=timezone.utc))
+
+    assert result["created"] == [
+        "arqonbus_message_history_p20260111",
+        "arqonbus_message_history_p20260112",
+    ]
+    assert result["dropped"] == ["arqonbus_message_history_p20260101"]
+    assert "DROP TABLE IF EXISTS arqonbus_message_history_p20260101" in executed
+    assert any("FOR VALUES FROM ('2026-01-11T00:00:00+00:00')" in query for query in executed)
+    assert "DELETE FROM arqonbus_message_history_default WHERE stored_at < $1" in executed
+
+    assert "DELETE FROM arqonbus_message_ids WHERE stored_at < $1" in executed
+
+    # stored_at is the server's clock, never the sender's; IDs are claimed separately.
+    stale = _message("msg-1")
+    stale.timestamp = datetime(2001, 1, 1, tzinfo=timezone.utc)
+    conn.fetch = AsyncMock(return_value=[{"message_id": "msg-1"}])
+    await backend.append_many([stale])
+    query, *columns = conn.fetch.await_args.args
+    assert "INSERT INTO arqonbus_message_ids" in query
+    assert "ON CONFLICT (message_id) DO NOTHING" in query
+    assert "stored_at" not in query
+    assert len(columns) == 6
+    assert all(not isinstance(value, datetime) for column in columns for value in column)
+
+
+@pytest.mark.asyncio
+async def test_postgres_partition_maintenance_moves_default_rows_into_new_partition():
+    executed = []
+
+    async def execute(query, *args):
+        executed.append(query)
+        if "PARTITION OF arqonbus_message_history FOR VALUES" in query:
+            raise RuntimeError("updated partition constraint for default partition would be violated")
+        if "WITH moved AS" in query:
+            return "INSERT 0 5"
+        if query.startswith("DELETE FROM arqonbus_message_history_default"):
+            return "DELETE 2"
+        return "OK"
+
+    conn = SimpleNamespace(
+        execute=AsyncMock(side_effect=execute),
+        fetch=AsyncMock(
+            return_value=[
+                {"name": "arqonbus_message_history_default"},
+                {"name": "arqonbus_message_history_p20260110"},
+            ]
+        ),
+        fetchrow=AsyncMock(return_value={"count": 7, "last_stored_at": None}),
+        fetchval=AsyncMock(return_value=3),
+        transaction=_Transaction(),
+    )
+    backend = _backend_with_conn(conn, partitioning="daily", retention_hours=48, partition_premake=1)
+    backend._partitioned = True
+
+    result = await backend.maintain_partitions(now=datetime(2026, 1, 10, 12, tzinfo=timezone.utc))
+
+    assert result["created"] == ["arqonbus_message_history_p20260111"]
+    assert conn.transaction.entered == 1
+    assert any(
+        "ATTACH PARTITION arqonbus_message_history_p20260111 FOR VALUES FROM ('2026-01-11T00:00:00+00:00')" in query
+        for query in executed
+    )
+    stats = await backend.get_stats()
+    assert stats["default_rows_moved"] == 5
+    assert stats["default_rows_expired"] == 2
+    assert stats["default_partition_rows"] == 3
+
+
+@pytest.mark.asyncio
+async def test_postgres_partitioning_skipped_for_existing_plain_table():
+    conn = SimpleNamespace(execute=AsyncMock(return_value="OK"), fetchval=AsyncMock(return_value="r"))
+    backend = _backend_with_conn(conn, partitioning="hourly")
+    await backend._ensure_schema()
+
+    assert backend._partitioned is False
+    schema = conn.execute.await_args.args[0]
+    assert "PARTITION BY" not in schema
+    # The NOTIFY trigger is only created when missing, never dropped and recreated.
+    assert "DROP TRIGGER" not in schema
+    assert "FROM pg_trigger" in schema
+    assert await backend.maintain_partitions() == {"created": [], "dropped": []}
+
+
+@pytest.mark.asyncio
+async def test_postgres_pool_options_and_metrics(monkeypatch):
+    from arqonbus.storage import postgres as pg_mod
+
+    conn = SimpleNamespace(execute=AsyncMock(return_value="OK"), fetchrow=AsyncMock(return_value=None))
+    pool = _Pool(conn)
+    pool.get_size = lambda: 4
+    pool.get_idle_size = lambda: 1
+    create_pool = AsyncMock(return_value=pool)
+    monkeypatch.setattr(pg_mod, "POSTGRES_AVAILABLE", True)
+    monkeypatch.setattr(pg_mod, "asyncpg", SimpleNamespace(create_pool=create_pool))
+
+    backend = await PostgresStorageBackend.create(
+        {
+            "postgres_url": "postgresql://localhost:5432/arqonbus",
+            "pool_min_size": 2,
+            "pool_max_size": 8,
+            "statement_cache_size": 0,
+            "command_timeout": 0,
+            "max_inactive_connection_lifetime": 60,
+        }
+    )
+
+    assert create_pool.await_args.kwargs == {
+        "min_size": 2,
+        "max_size": 8,
+        "statement_cache_size": 0,
+        "max_inactive_connection_lifetime": 60.0,
+        "command_timeout": None,
+    }
+    stats = await backend.get_stats()
+    assert stats["pool_acquires"] >= 1
+    assert stats["pool"]["in_use"] == 3
+    assert stats["pool"]["utilization"] == 3 / 8
+
+
+def test_postgres_history_query_text_is_stable_per_filter_shape():
+    from arqonbus.storage.postgres import _history_query
+
+    query = _history_query(True, True, False, True)
+    assert query is _history_query(True, True, False, True)
+    assert "room = $1 AND channel = $2 AND stored_at <= $3" in query
+    assert "LIMIT $4" in query
+
+
+
+@pytest.mark.asyncio
+async def test_postgres_history_page_uses_keyset_cursor():
+    stored_at = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+    rows = [
+        {"id": row_id, "envelope": _message(f"msg-{row_id}").to_dict(), "envelope_proto": None, "stored_at": stored_at}
+        for row_id in (1, 2, 3)
+    ]
+    conn = SimpleNamespace(fetch=AsyncMock(return_value=rows))
+    backend = _backend_with_conn(conn)
+
+    page, cursor = await backend.get_history_page(room="room-a", limit=2, ascending=True)
+    query, *params = conn.fetch.await_args.args
+    assert "ORDER BY stored_at ASC, id ASC" in query
+    assert params == ["room-a", 3]
+    assert [entry.envelope.id for entry in page] == ["msg-1", "msg-2"]
+    assert cursor == f"{stored_at.isoformat()}|2"
+
+    conn.fetch.return_value = rows[2:]
+    page, cursor = await backend.get_history_page(room="room-a", limit=2, cursor=cursor, ascending=True)
+    query, *params = conn.fetch.await_args.args
+    assert "(stored_at, id) > ($2, $3)" in query
+    assert params == ["room-a", stored_at, 2, 3]
+    assert [entry.envelope.id for entry in page] == ["msg-3"]
+    assert cursor is None
+
+    with pytest.raises(ValueError):
+        await backend.get_history_page(room="room-a", cursor="not-a-cursor")
+
+
+def _continuum_event(event_id: str, source_ts: str, episode_id: str = "ep-1") -> dict:
+    return {
+        "event_id": event_id,
+        "event_type": "episode.updated",
+        "tenant_id": "t1",
+        "agent_id": "a1",
+        "episode_id": episode_id,
+        "source_ts": source_ts,
+        "schema_version": 1,
+        "payload": {"content_ref": "ref", "tags": [], "metadata": {}},
+    }
+
+
+@pytest.mark.asyncio
+async def test_postgres_continuum_project_events_uses_one_statement_per_batch():
+    prior_ts = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+    async def fetch(query, tenants, agents, event_ids, *columns):
+        # evt-seen was recorded by an earlier call.
+        return [
+            {"ord": ord_, "recorded": event_id != "evt-seen", "projected": True, "prior_ts": prior_ts}
+            for ord_, event_id in enumerate(event_ids, start=1)
+        ]
+
+    conn = SimpleNamespace(fetch=AsyncMock(side_effect=fetch), transaction=_Transaction())
+    backend = _backend_with_conn(conn)
+
+    results = await backend.continuum_project_events(
+        [
+            _continuum_event("evt-1", "2026-01-01T12:05:00Z"),
+            _continuum_event("evt-old", "2026-01-01T11:00:00Z"),
+            _continuum_event("evt-2", "2026-01-01T12:10:00Z"),
+            _continuum_event("evt-between", "2026-01-01T12:07:00Z"),
+            _continuum_event("evt-1", "2026-01-01T12:05:00Z"),
+            _continuum_event("evt-seen", "2026-01-01T12:30:00Z"),
+        ]
+    )
+
+    assert [r["status"] for r in results] == [
+        "projected",
+        "stale_rejected",
+        "projected",
+        "stale_rejected",
+        "duplicate",
+        "duplicate",
+    ]
+    assert results[1]["existing_last_event_ts"] == "2026-01-01T12:05:00+00:00"
+    assert results[3]["existing_last_event_ts"] == "2026-01-01T12:10:00+00:00"
+    assert conn.fetch.await_count == 1
+    assert conn.transaction.entered == 1
+    # The in-batch repeat of evt-1 is not sent.
+    assert conn.fetch.await_args.args[3] == ["evt-1", "evt-old", "evt-2", "evt-between", "evt-seen"]
+    assert "ON CONFLICT" in conn.fetch.await_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_postgres_continuum_project_event_reports_guarded_upsert_as_stale():
+    async def fetch(query, *columns):
+        return [{"ord": 1, "recorded": True, "projected": False, "prior_ts": None}]
+
+    conn = SimpleNamespace(fetch=AsyncMock(side_effect=fetch), transaction=_Transaction())
+    backend = _backend_with_conn(conn, batch_max_size=2)
+
+    result = await backend.continuum_project_event(_continuum_event("evt-1", "2026-01-01T12:00:00Z"))
+
+    assert result["status"] == "stale_rejected"
+    assert result["projection_key"] == ("t1", "a1", "ep-1")
+    assert conn.fetch.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_postgres_continuum_listings_use_keyset_predicates():
+    conn = SimpleNamespace(fetch=AsyncMock(return_value=[]))
+    backend = _backend_with_conn(conn)
+
+    await backend.continuum_projector_list(
+        limit=10,
+        tenant_id="t1",
+        after=("2026-01-01T12:00:00+00:00", "t1", "a1", "ep-1"),
+    )
+    query, *params = conn.fetch.await_args.args
+    assert "(updated_at, tenant_id, agent_id, episode_id) < ($2, $3, $4, $5)" in query
+    assert "ORDER BY updated_at DESC, tenant_id DESC, agent_id DESC, episode_id DESC" in query
+    assert params == ["t1", datetime(2026, 1, 1, 12, tzinfo=timezone.utc), "t1", "a1", "ep-1", 10]
+
+    await backend.continuum_projector_dlq_list(limit=5, after=("2026-01-01T12:00:00+00:00", "dlq_1"))
+    query, *params = conn.fetch.await_args.args
+    assert "(queued_at, dlq_id) < ($2, $3)" in query
+    assert params == [5, datetime(2026, 1, 1, 12, tzinfo=timezone.utc), "dlq_1"]
+
+    await backend.continuum_projector_events_between(
+        from_ts=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        to_ts=datetime(2026, 1, 2, tzinfo=timezone.utc),
+        limit=100,
+        after=(datetime(2026, 1, 1, 6, tzinfo=timezone.utc), "t1", "a1", "evt-9"),
+    )
+    query, *params = conn.fetch.await_args.args
+    assert "(source_ts, tenant_id, agent_id, event_id) > ($3, $4, $5, $6)" in query
+    assert "LIMIT $7" in query
+
+
+@pytest.mark.asyncio
+async def test_postgres_continuum_list_tag_filters_use_jsonb_operators():
+    conn = SimpleNamespace(fetch=AsyncMock(return_value=[]))
+    backend = _backend_with_conn(conn)
+
+    await backend.continuum_projector_list(
+        limit=10,
+        tags_all=["red", "big"],
+        tags_any=["blue"],
+        attributes={"tier": "gold"},
+    )
+
+    query, *params = conn.fetch.await_args.args
+    assert "tags @> $1::jsonb AND tags ?| $2::text[] AND metadata @> $3::jsonb" in query
+    assert params == ['["red", "big"]', ["blue"], '{"tier": "gold"}', 10]
+
+
+@pytest.mark.asyncio
+async def test_postgres_continuum_listen_decodes_notifications(monkeypatch):
+    import arqonbus.storage.postgres as pg_mod
+
+    terminated = []
+    listen_conn = SimpleNamespace(
+        add_listener=AsyncMock(),
+        remove_listener=AsyncMock(),
+        add_termination_listener=terminated.append,
+        remove_termination_listener=lambda callback: None,
+        close=AsyncMock(),
+    )
+    monkeypatch.setattr(pg_mod, "asyncpg", SimpleNamespace(connect=AsyncMock(return_value=listen_conn)))
+    backend = _backend_with_conn(SimpleNamespace())
+    changes, lost = [], []
+
+    stop = await backend.continuum_listen(changes.append, on_lost=lambda: lost.append(True))
+    channel, on_notify = listen_conn.add_listener.await_args.args
+    assert channel == pg_mod.CONTINUUM_NOTIFY_CHANNEL
+    on_notify(listen_conn, 1, channel, '{"tenant_id": "t1", "agent_id": "a1", "episode_id": "ep-1"}')
+    on_notify(listen_conn, 1, channel, "not json")
+    assert changes == [{"tenant_id": "t1", "agent_id": "a1", "episode_id": "ep-1"}]
+
+    terminated[0](listen_conn)
+    assert lost == [True]
+
+    await stop()
+    listen_conn.close.assert_awaited_once()
@@ -48,3 +48,23 @@ def test_validator_can_parse_protobuf_wire_payload():
     assert wire_format == "protobuf"
     assert not errors
     assert parsed.id == envelope.id
+
+
+def test_envelope_frames_encode_once_and_invalidate_on_field_change():
+    envelope = Envelope(
+        id=generate_message_id(),
+        timestamp=datetime.now(timezone.utc),
+        type="message",
+        room="ops",
+        channel="events",
+        payload={"x": 1},
+    )
+    frames = envelope.frames
+    assert envelope.frames is frames
+    assert frames.for_format("json") is envelope.to_json()
+    assert frames.for_format("protobuf") is envelope.to_proto_bytes()
+    assert envelope_from_proto_bytes(frames.proto).payload == {"x": 1}
+
+    envelope.sender = "client-b"
+    assert envelope.frames is not frames
+    assert '"sender": "client-b"' in envelope.to_json()
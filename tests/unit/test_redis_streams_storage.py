@@ -0,0 +1,293 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import fakeredis
+import pytest
+
+from arqonbus.protocol.envelope import Envelope
+from arqonbus.storage.redis_streams import RedisStreamsStorage
+
+
+def _envelope(n: int) -> Envelope:
+    return Envelope(
+        type="message",
+        sender="arq_client_1",
+        room="science",
+        channel="general",
+        payload={"n": n},
+    )
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.mark.asyncio
+async def test_append_many_writes_index_streams_in_one_round_trip(redis_client):
+    storage = RedisStreamsStorage(redis_client=redis_client, retention_hours=24)
+
+    results = await storage.append_many([_envelope(i) for i in range(3)])
+
+    assert [r.success for r in results] == [True, True, True]
+    assert storage._stats["pipeline_round_trips"] == 1
+    assert storage._stats["pipelined_appends"] == 3
+    for stream in ("messages", "sender_arq_client_1", "room_science", "channel_general"):
+        assert await redis_client.xlen(f"arqonbus:{stream}") == 3
+    assert 0 < await redis_client.ttl("arqonbus:messages") <= 24 * 3600
+
+
+@pytest.mark.asyncio
+async def test_trimming_follows_retention_settings(redis_client):
+    storage = RedisStreamsStorage(redis_client=redis_client, retention_hours=1)
+    trim = storage._trim_kwargs()
+    cutoff_ms = int(trim["minid"].split("-")[0])
+    assert abs(cutoff_ms - (time.time() - 3600) * 1000) < 5000
+    assert trim["approximate"] is True
+
+    capped = RedisStreamsStorage(redis_client=redis_client, max_size=500, retention_hours=0)
+    assert capped._trim_kwargs() == {"maxlen": 500, "approximate": True}
+
+
+@pytest.mark.asyncio
+async def test_stream_expiry_is_not_refreshed_on_every_append(redis_client):
+    storage = RedisStreamsStorage(redis_client=redis_client, key_ttl=3600)
+
+    await storage.append(_envelope(1))
+    await redis_client.persist("arqonbus:messages")
+    await storage.append(_envelope(2))
+
+    assert await redis_client.ttl("arqonbus:messages") == -1
+    assert await redis_client.xlen("arqonbus:messages") == 2
+
+
+@pytest.mark.asyncio
+async def test_write_behind_acknowledges_then_commits_in_groups(redis_client):
+    storage = RedisStreamsStorage(
+        redis_client=redis_client,
+        write_behind=True,
+        write_behind_flush_ms=20,
+        write_behind_batch_size=4,
+    )
+
+    results = [await storage.append(_envelope(i)) for i in range(6)]
+    assert all(r.success and r.metadata == {"write_behind": True} for r in results)
+    assert await redis_client.xlen("arqonbus:messages") == 0
+
+    await storage.flush(timeout=1.0)
+    assert await redis_client.xlen("arqonbus:messages") == 6
+    assert storage._stats["write_behind_commits"] == 2
+    assert storage._stats["pipeline_round_trips"] == 2
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_rejects_when_full_and_not_blocking(redis_client):
+    storage = RedisStreamsStorage(
+        redis_client=redis_client,
+        write_behind=True,
+        write_behind_queue_size=2,
+        write_behind_block_when_full=False,
+    )
+
+    # Nothing yields to the committer between these appends.
+    results = await storage.append_many([_envelope(i) for i in range(3)])
+    assert [r.success for r in results] == [True, True, False]
+    assert results[2].error_message == "Write-behind queue full"
+    assert storage._stats["write_behind_rejected"] == 1
+
+    await storage.close()
+    assert await redis_client.xlen("arqonbus:messages") == 2
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flush_returns_under_steady_publishing(redis_client):
+    storage = RedisStreamsStorage(redis_client=redis_client, write_behind=True, write_behind_flush_ms=1)
+    await storage.append(_envelope(0))
+
+    async def publish():
+        n = 1
+        while True:
+            await storage.append(_envelope(n))
+            n += 1
+            await asyncio.sleep(0)
+
+    publisher = asyncio.create_task(publish())
+    await asyncio.sleep(0.01)
+    watermark = storage._enqueued_seq
+    await storage.flush(timeout=1.0)
+    assert storage._settled_seq >= watermark
+
+    publisher.cancel()
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_retries_failed_groups_then_counts_drops(redis_client, monkeypatch):
+    monkeypatch.setattr("arqonbus.storage.redis_streams._WRITE_BEHIND_RETRY_BASE", 0.001)
+    storage = RedisStreamsStorage(
+        redis_client=redis_client,
+        storage_mode="strict",
+        write_behind=True,
+        write_behind_flush_ms=1,
+        write_behind_max_retries=2,
+    )
+    commit = storage._commit
+    failures = {"left": 1}
+
+    async def flaky(envelopes, **kwargs):
+        if failures["left"]:
+            failures["left"] -= 1
+            raise RuntimeError("redis down")
+        return await commit(envelopes, **kwargs)
+
+    monkeypatch.setattr(storage, "_commit", flaky)
+    await storage.append(_envelope(1))
+    await storage.flush(timeout=1.0)
+    assert await redis_client.xlen("arqonbus:messages") == 1
+    assert storage._stats["write_behind_retries"] == 1
+    assert storage._stats["write_behind_dropped"] == 0
+
+    failures["left"] = 10
+    await storage.append(_envelope(2))
+    await storage.flush(timeout=1.0)
+    assert storage._stats["write_behind_dropped"] == 1
+    assert await redis_client.xlen("arqonbus:messages") == 1
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_history_includes_acknowledged_write_behind_messages(redis_client):
+    storage = RedisStreamsStorage(redis_client=redis_client, write_behind=True, write_behind_flush_ms=50)
+    await storage.append(_envelope(1))
+
+    await storage.get_history()
+    assert await redis_client.xlen("arqonbus:messages") == 1
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_history_reads_room_channel_stream_with_cursor(redis_client):
+    storage = RedisStreamsStorage(redis_client=redis_client)
+    await storage.append_many([_envelope(i) for i in range(5)])
+    other = _envelope(99)
+    other.channel = "random"
+    await storage.append(other)
+
+    page, cursor = await storage.get_history_page(room="science", channel="general", limit=3)
+    assert [entry.envelope.payload["n"] for entry in page] == [4, 3, 2]
+    assert cursor == page[-1].storage_metadata["stream_id"]
+
+    rest, cursor = await storage.get_history_page(room="science", channel="general", limit=3, cursor=cursor)
+    assert [entry.envelope.payload["n"] for entry in rest] == [1, 0]
+    assert cursor is None
+
+    with pytest.raises(ValueError):
+        await storage.get_history_page(room="science", cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_room_channel_index_does_not_collide_with_room_only_index(redis_client):
+    storage = RedisStreamsStorage(redis_client=redis_client)
+    room_only = Envelope(type="message", room="a_channel_b", payload={"n": 1})
+    room_channel = Envelope(type="message", room="a", channel="b", payload={"n": 2})
+    split_a = Envelope(type="message", room="a:b", channel="c", payload={"n": 3})
+    split_b = Envelope(type="message", room="a", channel="b:c", payload={"n": 4})
+    for envelope in (room_only, room_channel, split_a, split_b):
+        await storage.append(envelope)
+
+    assert [e.envelope.payload["n"] for e in await storage.get_history(room="a_channel_b")] == [1]
+    assert [e.envelope.payload["n"] for e in await storage.get_history(room="a", channel="b")] == [2]
+    assert [e.envelope.payload["n"] for e in await storage.get_history(room="a:b", channel="c")] == [3]
+    assert [e.envelope.payload["n"] for e in await storage.get_history(room="a", channel="b:c")] == [4]
+
+
+@pytest.mark.asyncio
+async def test_history_page_ascending_walks_oldest_first(redis_client):
+    storage = RedisStreamsStorage(redis_client=redis_client)
+    await storage.append_many([_envelope(i) for i in range(5)])
+
+    page, cursor = await storage.get_history_page(room="science", channel="general", limit=3, ascending=True)
+    assert [entry.envelope.payload["n"] for entry in page] == [0, 1, 2]
+
+    rest, cursor = await storage.get_history_page(
+        room="science", channel="general", limit=3, cursor=cursor, ascending=True
+    )
+    assert [entry.envelope.payload["n"] for entry in rest] == [3, 4]
+    assert cursor is None
+
+
+@pytest.mark.asyncio
+async def test_history_time_bounds_map_to_stream_ids(redis_client):
+    storage = RedisStreamsStorage(redis_client=redis_client)
+    stream = storage._history_stream("science", "general")
+    for ms, n in ((1_000, 0), (2_000, 1), (3_000, 2)):
+        envelope = _envelope(n)
+        await redis_client.xadd(stream, storage._message_data(envelope), id=f"{ms}-0")
+
+    entries = await storage.get_history(
+        room="science",
+        channel="general",
+        since=datetime.utcfromtimestamp(1.0),
+        until=datetime.fromtimestamp(3.0, tz=timezone.utc),
+    )
+    assert [entry.envelope.payload["n"] for entry in entries] == [1]
+    assert entries[0].stored_at == datetime.utcfromtimestamp(2.0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("record_format", ["json", "protobuf", "compressed"])
+async def test_single_encoding_records_round_trip(record_format):
+    redis_client = fakeredis.FakeAsyncRedis()
+    storage = RedisStreamsStorage(redis_client=redis_client, record_format=record_format)
+    envelope = _envelope(7)
+    await storage.append(envelope)
+
+    [(_, fields)] = await redis_client.xrange("arqonbus:messages")
+    assert set(fields) == {b"hdr", b"body"}
+    assert fields[b"hdr"].decode().startswith("1:")
+
+    [entry] = await storage.get_history(room="science", channel="general")
+    assert entry.envelope.id == envelope.id
+    assert entry.envelope.payload == {"n": 7}
+
+    await storage.ensure_group("arqonbus:messages", "workers")
+    [(_, [(_, data)])] = await storage.read_group("arqonbus:messages", "workers", "c1", block_ms=None)
+    assert data["id"] == envelope.id
+
+
+def test_unknown_record_format_and_version_are_rejected():
+    with pytest.raises(ValueError):
+        RedisStreamsStorage(record_format="yaml")
+    with pytest.raises(ValueError, match="record version"):
+        RedisStreamsStorage._decode_record({"hdr": "9:pb", "body": b""})
+
+
+@pytest.mark.asyncio
+async def test_stats_use_counters_bounded_scan_and_cache(redis_client, monkeypatch):
+    storage = RedisStreamsStorage(redis_client=redis_client, stats_scan_count=1, stats_scan_max_calls=2)
+    await storage.append_many([_envelope(i) for i in range(3)])
+
+    async def _no_keys(*args, **kwargs):
+        raise AssertionError("KEYS must not be used")
+
+    monkeypatch.setattr(redis_client, "keys", _no_keys)
+    stats = await storage.get_stats()
+    assert stats["counters"]["messages_appended"] == 3
+    assert stats["stream_stats"]["complete"] is False
+    assert "arqonbus:stats" not in stats["stream_stats"]["stream_names"]
+
+    await storage.append(_envelope(3))
+    cached = await storage.get_stats()
+    assert cached["counters"]["messages_appended"] == 3
+
+    storage._stats_cache = None
+    storage.stats_scan_max_calls = 100
+    fresh = await storage.get_stats()
+    assert fresh["counters"]["messages_appended"] == 4
+    assert fresh["stream_stats"] == {
+        "total_streams": 5,
+        "stream_names": fresh["stream_stats"]["stream_names"],
+        "complete": True,
+    }
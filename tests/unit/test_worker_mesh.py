@@ -0,0 +1,155 @@
+import asyncio
+import os
+
+import pytest
+
+from arqonbus.config.config import ArqonBusConfig
+from arqonbus.protocol.envelope import Envelope
+from arqonbus.routing.client_registry import ClientRegistry
+from arqonbus.transport.cluster import WorkerMesh, WorkerSupervisor
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.open = True
+        self.sent = []
+
+    async def send(self, data):
+        self.sent.append(data)
+
+
+async def _wait_for(predicate, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+async def mesh_pair(tmp_path):
+    registries = [ClientRegistry(), ClientRegistry()]
+    meshes = [WorkerMesh(i, 2, str(tmp_path), reconnect_delay=0.01) for i in range(2)]
+    for mesh, registry in zip(meshes, registries):
+        mesh.attach(registry)
+        await mesh.start()
+    await _wait_for(lambda: all(mesh.snapshot()["connected_peers"] for mesh in meshes))
+    yield registries, meshes
+    for mesh in meshes:
+        await mesh.stop()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_is_forwarded_only_to_subscribed_workers(mesh_pair):
+    (registry_a, registry_b), (mesh_a, mesh_b) = mesh_pair
+    remote = _FakeWebSocket()
+    await registry_b.register_client(remote, room="science", channel="general")
+    await _wait_for(lambda: "science:general" in mesh_a._peer_interest.get(1, set()))
+
+    message = Envelope(type="message", room="science", channel="general", payload={"n": 1})
+    report = await registry_a.broadcast_with_report(message, "science", "general")
+    assert report.forwarded == 1
+    await _wait_for(lambda: remote.sent)
+    assert Envelope.from_json(remote.sent[0]).payload == {"n": 1}
+
+    other = Envelope(type="message", room="science", channel="other", payload={})
+    report = await registry_a.broadcast_with_report(other, "science", "other")
+    assert report.forwarded == 0
+
+
+@pytest.mark.asyncio
+async def test_forwarded_messages_are_not_forwarded_back(mesh_pair):
+    (registry_a, registry_b), (mesh_a, mesh_b) = mesh_pair
+    local = _FakeWebSocket()
+    remote = _FakeWebSocket()
+    await registry_a.register_client(local, room="ops", channel="alerts")
+    await registry_b.register_client(remote, room="ops", channel="alerts")
+    await _wait_for(lambda: "ops:alerts" in mesh_b._peer_interest.get(0, set()))
+
+    message = Envelope(type="message", room="ops", channel="alerts", payload={})
+    await registry_a.broadcast_with_report(message, "ops", "alerts")
+    await _wait_for(lambda: remote.sent)
+    await asyncio.sleep(0.05)
+
+    assert len(local.sent) == 1
+    assert mesh_b.stats["forwarded"] == 0
+    assert mesh_b.stats["received"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_stops_forwarding(mesh_pair):
+    (registry_a, registry_b), (mesh_a, _) = mesh_pair
+    client_id = await registry_b.register_client(_FakeWebSocket(), room="science", channel="general")
+    await _wait_for(lambda: "science:general" in mesh_a._peer_interest.get(1, set()))
+
+    await registry_b.unregister_client(client_id)
+    await _wait_for(lambda: "science:general" not in mesh_a._peer_interest.get(1, set()))
+    message = Envelope(type="message", room="science", channel="general", payload={})
+    assert (await registry_a.broadcast_with_report(message, "science", "general")).forwarded == 0
+
+
+def test_worker_count_is_validated():
+    config = ArqonBusConfig()
+    config.server.workers = 0
+    assert "Invalid worker count: 0" in config.validate()
+    with pytest.raises(ValueError):
+        WorkerSupervisor(0)
+
+
+def test_multi_worker_mode_requires_shared_storage():
+    config = ArqonBusConfig()
+    config.server.workers = 2
+    config.storage.backend = "memory"
+    assert any("need a shared storage backend" in error for error in config.validate())
+
+    config.storage.backend = "postgres"
+    assert not any("shared storage" in error for error in config.validate())
+
+
+def test_supervisor_removes_only_the_socket_dir_it_created(tmp_path):
+    owned = WorkerSupervisor(2)
+    assert os.path.isdir(owned.socket_dir)
+    owned.stop()
+    assert not os.path.exists(owned.socket_dir)
+
+    given = WorkerSupervisor(2, socket_dir=str(tmp_path))
+    given.stop()
+    assert tmp_path.is_dir()
+
+
+@pytest.mark.asyncio
+async def test_supervisor_restarts_worker_when_metrics_fail(monkeypatch):
+    from arqonbus.transport import cluster
+
+    class _Process:
+        def __init__(self, alive):
+            self.alive = alive
+            self.exitcode = None if alive else 1
+
+        def is_alive(self):
+            return self.alive
+
+        def terminate(self):
+            self.alive = False
+
+        def join(self, timeout=None):
+            pass
+
+    def broken_counter(*args, **kwargs):
+        raise RuntimeError("metrics backend down")
+
+    supervisor = WorkerSupervisor(1, socket_dir="/tmp", restart_delay=0)
+    spawned = []
+
+    def spawn(worker_id):
+        spawned.append(worker_id)
+        supervisor._workers[worker_id] = _Process(alive=len(spawned) > 1)
+
+    monkeypatch.setattr(supervisor, "_spawn", spawn)
+    monkeypatch.setattr(cluster, "record_counter", broken_counter)
+    task = asyncio.create_task(supervisor.run())
+    await _wait_for(lambda: len(spawned) == 2)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert supervisor._stopping is True